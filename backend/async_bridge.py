@@ -2,72 +2,204 @@
 Async Bridge Module.
 
 This module provides an asynchronous bridge to the synchronous `RenodeWrapper`.
-It ensures that blocking Renode operations run in a separate thread (executor)
-to avoid freezing the asyncio event loop (and consequently the UI).
+It ensures that blocking Renode operations run on a dedicated worker thread
+(`CommandExecutor`) to avoid freezing the asyncio event loop (and consequently the UI).
+Memory polling runs on one extra worker per machine, so a slow machine does not
+delay reads on the others.
 """
 
 import asyncio
+import functools
+import logging
+import time
 from .renode_wrapper import RenodeWrapper
+from .command_executor import CommandExecutor, PRIORITY_CONTROL, PRIORITY_USER, PRIORITY_POLL
+from .metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Poll requests older than this many seconds are dropped instead of run.
+POLL_MAX_AGE = 1.0
 
 class RenodeBridge:
     """
     Asynchronous bridge for interacting with the Renode simulation.
 
-    This class wraps `RenodeWrapper` methods, executing them in a thread pool
-    executor to integrate seamlessy with asyncio-based applications (like the UI).
+    This class wraps `RenodeWrapper` methods, executing them on a single worker
+    thread that owns the Renode objects, to integrate seamlessy with asyncio-based
+    applications (like the UI). Control actions run first, then user monitor
+    commands, then polling reads. `read_many` runs on a per-machine poll worker
+    instead, created on first use.
+
+    The backend itself is started as the first call on the worker, so creating
+    the bridge does not block; calls made before it is ready queue behind it.
+
+    Every call is timed in `metrics`: "queue" is the wait for the worker, "exec"
+    the run on the worker (i.e. in Renode), and "deliver" the delay until the
+    awaiting coroutine resumes on the loop. Callers may add an "apply" phase for
+    the work of applying the result to the UI.
     """
 
-    def __init__(self, sys_bus_params=None):
+    def __init__(self, sys_bus_params=None, simulator=None, snapshot_cache=None, metrics=None):
         """
         Initializes the RenodeBridge.
 
         Args:
             sys_bus_params (str, optional): Comma-separated key=value pairs for
                 SystemBus parameters. Passed to the underlying RenodeWrapper.
+            simulator (SimulatedRenode, optional): A synthetic backend used instead
+                of Renode. Passed to the underlying RenodeWrapper.
+            snapshot_cache (SnapshotCache, optional): Cache of post-load snapshots
+                used for fast resets. Passed to the underlying RenodeWrapper.
+            metrics (MetricsRegistry, optional): Receives the call latencies.
+                Defaults to a new registry.
         """
-        self.wrapper = RenodeWrapper(sys_bus_params=sys_bus_params)
+        self.wrapper = RenodeWrapper(sys_bus_params=sys_bus_params, simulator=simulator,
+                                     snapshot_cache=snapshot_cache, connect=False)
         self.loop = asyncio.get_event_loop()
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.executor = CommandExecutor(metrics=self.metrics)
+        self.poll_executors = {} # machine name (None for the default machine) -> CommandExecutor
+        # Resolves to the startup phase timings once the backend is up
+        self.ready = asyncio.wrap_future(
+            self.executor.submit(PRIORITY_CONTROL, self.wrapper.connect, name="connect"), loop=self.loop)
+
+    async def _call(self, priority, func, *args, **kwargs):
+        """
+        Runs a wrapper method on the worker thread and awaits its result.
+
+        Args:
+            priority (int): The request priority.
+            func (callable): The wrapper method to call.
+            *args: Positional arguments for `func`.
+            **kwargs: Options passed to `CommandExecutor.submit` (name, key, max_age).
+
+        Returns:
+            The return value of `func`.
+        """
+        future = self.executor.submit(priority, func, *args, **kwargs)
+        return await self._await(future, kwargs.get("name") or getattr(func, "__name__", "call"))
+
+    async def _await(self, future, name):
+        """
+        Awaits a worker future and records how long its result took to reach the loop.
+
+        Args:
+            future (concurrent.futures.Future): The future of a submitted call.
+            name (str): The operation name.
+
+        Returns:
+            The result of the call.
+        """
+        finished = []
+        future.add_done_callback(lambda _: finished.append(time.perf_counter()))
+        try:
+            return await asyncio.wrap_future(future, loop=self.loop)
+        finally:
+            if finished:
+                self.metrics.observe(name, "deliver", time.perf_counter() - finished[0])
+
+    def _poll_executor(self, machine):
+        """
+        Returns the poll worker of a machine, starting it on first use.
+
+        Args:
+            machine (str): The machine name, or None for the default machine.
+
+        Returns:
+            CommandExecutor: The poll worker.
+        """
+        executor = self.poll_executors.get(machine)
+        if executor is None:
+            executor = CommandExecutor(name=f"renode-poll-{machine or 'default'}", metrics=self.metrics)
+            self.poll_executors[machine] = executor
+        return executor
+
+    def queue_stats(self):
+        """
+        Returns queue-wait statistics per operation.
+
+        Operations of the poll workers are reported as "<name>@<machine>".
+
+        Returns:
+            dict: See `CommandExecutor.wait_stats`.
+        """
+        stats = self.executor.wait_stats()
+        for machine, executor in list(self.poll_executors.items()):
+            for name, entry in executor.wait_stats().items():
+                stats[f"{name}@{machine or 'default'}"] = entry
+        return stats
+
+    def cache_stats(self):
+        """
+        Returns the monitor response cache statistics.
+
+        Returns:
+            dict: See `ResponseCache.stats`.
+        """
+        return self.wrapper.cache_stats()
+
+    def close(self):
+        """
+        Cleans up the wrapper on the worker thread and stops the worker.
+        """
+        for executor in self.poll_executors.values():
+            executor.shutdown(wait=True)
+        self.executor.submit(PRIORITY_CONTROL, self.wrapper.cleanup)
+        self.executor.shutdown(wait=True)
 
     async def load_script(self, path: str):
         """
         Asynchronously loads a Renode script.
 
-        This method delegates to `RenodeWrapper.load_script` running in a separate thread.
+        This method delegates to `RenodeWrapper.load_script` running on the worker thread.
 
         Args:
             path (str): The path to the script file.
         """
-        await self.loop.run_in_executor(None, self.wrapper.load_script, path)
+        await self._call(PRIORITY_CONTROL, self.wrapper.load_script, path)
 
-    async def start(self):
+    async def start(self, machine=None):
         """
         Asynchronously starts the simulation.
 
-        This method delegates to `RenodeWrapper.start` running in a separate thread.
+        This method delegates to `RenodeWrapper.start` running on the worker thread.
+
+        Args:
+            machine (str, optional): Only start this machine. Defaults to None,
+                which starts the whole emulation.
         """
-        await self.loop.run_in_executor(None, self.wrapper.start)
+        await self._call(PRIORITY_CONTROL, self.wrapper.start, machine)
 
-    async def pause(self):
+    async def pause(self, machine=None):
         """
         Asynchronously pauses the simulation.
 
-        This method delegates to `RenodeWrapper.pause` running in a separate thread.
+        This method delegates to `RenodeWrapper.pause` running on the worker thread.
+
+        Args:
+            machine (str, optional): Only pause this machine. Defaults to None,
+                which pauses the whole emulation.
         """
-        await self.loop.run_in_executor(None, self.wrapper.pause)
+        await self._call(PRIORITY_CONTROL, self.wrapper.pause, machine)
 
-    async def reset(self):
+    async def reset(self, machine=None):
         """
         Asynchronously resets the simulation.
 
-        This method delegates to `RenodeWrapper.reset` running in a separate thread.
+        This method delegates to `RenodeWrapper.reset` running on the worker thread.
+
+        Args:
+            machine (str, optional): Only reset this machine. Defaults to None,
+                which resets the whole emulation.
         """
-        await self.loop.run_in_executor(None, self.wrapper.reset)
+        await self._call(PRIORITY_CONTROL, self.wrapper.reset, machine)
 
     async def read_memory(self, addr: int, width: int) -> int:
         """
         Asynchronously reads memory from the simulation.
 
-        This method delegates to `RenodeWrapper.read_memory` running in a separate thread.
+        This method delegates to `RenodeWrapper.read_memory` running on the worker thread.
 
         Args:
             addr (int): The memory address to read from.
@@ -75,32 +207,195 @@ class RenodeBridge:
 
         Returns:
             int: The value read from memory.
+
+        Raises:
+            StaleRequestError: If the request waited longer than `POLL_MAX_AGE`.
+        """
+        return await self._call(PRIORITY_POLL, self.wrapper.read_memory, addr, width, max_age=POLL_MAX_AGE)
+
+    async def list_machines(self) -> list:
+        """
+        Asynchronously lists the machines of the emulation.
+
+        This method delegates to `RenodeWrapper.list_machines` running on the worker thread.
+
+        Returns:
+            list: The machine names.
         """
-        return await self.loop.run_in_executor(None, self.wrapper.read_memory, addr, width)
+        return await self._call(PRIORITY_CONTROL, self.wrapper.list_machines)
 
-    def setup_logging(self, callback):
+    async def read_many(self, requests, machine=None) -> list:
+        """
+        Asynchronously reads many memory values of one machine in a single executor call.
+
+        This method delegates to `RenodeWrapper.read_many` running on the poll
+        worker of the machine, which coalesces nearby addresses into contiguous
+        range reads. Reads of different machines run concurrently.
+
+        Args:
+            requests (list): A list of (address, width) tuples.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The values in the same order as `requests` (None where a read failed).
+
+        Raises:
+            StaleRequestError: If the request was superseded by a newer `read_many`
+                of the same machine or waited longer than `POLL_MAX_AGE`.
+        """
+        await self.ready
+        future = self._poll_executor(machine).submit(
+            PRIORITY_POLL, functools.partial(self.wrapper.read_many, machine=machine), requests,
+            name="read_many", key="read_many", max_age=POLL_MAX_AGE)
+        return await self._await(future, "read_many")
+
+    async def read_pages(self, addresses, page_size, machine=None) -> list:
+        """
+        Asynchronously reads whole memory pages of one machine.
+
+        This method delegates to `RenodeWrapper.read_pages` running on the poll
+        worker of the machine. It runs ahead of polling reads, as it serves what
+        the user is looking at.
+
+        Args:
+            addresses (list): The start addresses of the pages.
+            page_size (int): The page size in bytes.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The page contents as bytes, None for unreadable pages.
+        """
+        await self.ready
+        future = self._poll_executor(machine).submit(
+            PRIORITY_USER, functools.partial(self.wrapper.read_pages, machine=machine), addresses, page_size,
+            name="read_pages")
+        return await self._await(future, "read_pages")
+
+    def setup_logging(self, callback, max_batch=1000, flush_interval=0.02, prepare=None):
         """
         Sets up logging with a thread-safe callback.
 
         Wraps the provided callback to ensure it is invoked on the main asyncio loop
-        via `call_soon_threadsafe`.
+        via `call_soon_threadsafe`. Lines arrive in batches, so a log flood costs one
+        loop callback per batch rather than one per line.
 
         Args:
-            callback (callable): The function to call with log messages.
+            callback (callable): The function to call with a list of log lines.
+            max_batch (int, optional): Maximum number of lines per callback. Defaults to 1000.
+            flush_interval (float, optional): Minimum time in seconds between two
+                partial batches. Defaults to 0.02.
+            prepare (callable, optional): A function applied to each batch on the
+                log tailing thread, e.g. to parse it; the callback then receives
+                its result instead of the lines.
         """
-        def safe_callback(msg):
-            self.loop.call_soon_threadsafe(callback, msg)
+        def safe_callback(lines):
+            if prepare is not None:
+                try:
+                    lines = prepare(lines)
+                except Exception as e:
+                    logger.error(f"Failed to prepare log lines: {e}")
+                    return
+            self.loop.call_soon_threadsafe(callback, lines)
         
-        # This doesn't need to be async as it just sets up the thread
-        self.wrapper.setup_logging(safe_callback)
+        # This doesn't need to be awaited; it only queues the setup on the worker
+        self.executor.submit(PRIORITY_CONTROL, self.wrapper.setup_logging, safe_callback, max_batch, flush_interval)
+
+    def setup_watch_push(self, callback):
+        """
+        Delivers push-based watch events to a callback on the asyncio loop.
+
+        The wrapper only signals that events are pending; the events are then
+        drained in one batch on the loop, so a burst of watchpoint hits costs a
+        single loop callback.
+
+        Args:
+            callback (callable): The function to call with a list of
+                (address, value, virtual_time, machine) tuples.
+        """
+        def drain():
+            events = self.wrapper.drain_watch_events()
+            if events:
+                callback(events)
+
+        self.wrapper.set_watch_listener(lambda: self.loop.call_soon_threadsafe(drain))
+
+    async def execute_batch(self, commands, stop_on_error=False) -> list:
+        """
+        Asynchronously executes several monitor commands in a single worker call.
+
+        This method delegates to `RenodeWrapper.execute_batch` running on the worker thread.
+
+        Args:
+            commands (list): The monitor commands, in order.
+            stop_on_error (bool, optional): Skip the remaining commands after a
+                command fails. Defaults to False.
+
+        Returns:
+            list: One (output, error) tuple per command; None for skipped commands.
+        """
+        return await self._call(PRIORITY_USER, self.wrapper.execute_batch, commands, stop_on_error)
+
+    async def open_uart(self, uart, machine=None):
+        """
+        Asynchronously exposes a UART on a local TCP port.
+
+        This method delegates to `RenodeWrapper.open_uart_terminal` running on the worker thread.
+
+        Args:
+            uart (str): The UART peripheral, e.g. "sysbus.uart0".
+            machine (str, optional): The machine of the UART. Defaults to None.
+
+        Returns:
+            tuple: The (host, port) of the terminal.
+        """
+        port = await self._call(PRIORITY_USER, self.wrapper.open_uart_terminal, uart, machine)
+        return "127.0.0.1", port
+
+    async def close_uart(self, uart, port, machine=None):
+        """
+        Asynchronously disconnects a UART from its terminal.
+
+        This method delegates to `RenodeWrapper.close_uart_terminal` running on the worker thread.
+
+        Args:
+            uart (str): The UART peripheral.
+            port (int): The port of the terminal.
+            machine (str, optional): The machine of the UART. Defaults to None.
+        """
+        await self._call(PRIORITY_USER, self.wrapper.close_uart_terminal, uart, port, machine)
+
+    def set_connection_listener(self, callback):
+        """
+        Accepts a connection listener for interface compatibility with
+        `SocketRenodeBridge`; an in-process Renode never disconnects.
+
+        Args:
+            callback (callable): Unused.
+        """
+
+    async def sync_watchpoints(self, requests) -> list:
+        """
+        Asynchronously registers watchpoint hooks for push-based watches.
+
+        This method delegates to `RenodeWrapper.sync_watchpoints` running on the worker thread.
+
+        Args:
+            requests (list): A list of (address, width, machine) tuples.
+
+        Returns:
+            list: One bool per request, True where the watch is push-driven.
+        """
+        return await self._call(PRIORITY_CONTROL, self.wrapper.sync_watchpoints, requests)
 
     async def monitor_command(self, command: str):
         """
         Asynchronously executes a monitor command.
 
-        This method delegates to `RenodeWrapper.monitor_command` running in a separate thread.
+        This method delegates to `RenodeWrapper.monitor_command` running on the worker thread.
 
         Args:
             command (str): The monitor command to execute.
         """
-        await self.loop.run_in_executor(None, self.wrapper.monitor_command, command)
+        await self._call(PRIORITY_USER, self.wrapper.monitor_command, command)
@@ -0,0 +1,248 @@
+"""
+Command Executor Module.
+
+This module provides a single-threaded, priority-ordered executor that owns all
+calls into the Renode objects. Running every call on one worker keeps `Monitor`
+and `Emulation` access serialized, while the priority queue lets control actions
+and user commands overtake background polling. A `SharedLock` lets executors of
+different machines read memory concurrently while the emulation is not replaced.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Request priorities; lower values run first.
+PRIORITY_CONTROL = 0
+PRIORITY_USER = 1
+PRIORITY_POLL = 2
+
+class StaleRequestError(Exception):
+    """
+    Raised for a request that was dropped before running because it went stale.
+
+    A request is stale when it waited longer than its `max_age`, or when a newer
+    request with the same `key` was submitted before it started.
+    """
+
+class SharedLock:
+    """
+    A readers-writer lock.
+
+    Any number of threads may hold it shared at once, e.g. pollers reading
+    different machines; holding it exclusively waits for all of them, e.g. to
+    replace the emulation.
+    """
+
+    def __init__(self):
+        """
+        Initializes the SharedLock.
+        """
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+
+    @contextmanager
+    def shared(self):
+        """
+        Holds the lock in shared mode for the duration of a `with` block.
+        """
+        with self._cond:
+            while self._writer:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Holds the lock in exclusive mode for the duration of a `with` block.
+
+        New shared holders are blocked while waiting for the current ones.
+        """
+        with self._cond:
+            while self._writer:
+                self._cond.wait()
+            self._writer = True
+            while self._readers:
+                self._cond.wait()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+class _Job:
+    """
+    A queued call together with its future and bookkeeping.
+    """
+
+    __slots__ = ("future", "func", "args", "name", "key", "max_age", "submitted", "superseded")
+
+    def __init__(self, func, args, name, key, max_age):
+        """
+        Initializes the job.
+
+        Args:
+            func (callable): The function to call.
+            args (tuple): Positional arguments for `func`.
+            name (str): Operation name used for statistics.
+            key (str): Coalescing key, or None.
+            max_age (float): Maximum queue wait in seconds, or None.
+        """
+        self.future = Future()
+        self.func = func
+        self.args = args
+        self.name = name
+        self.key = key
+        self.max_age = max_age
+        self.submitted = time.monotonic()
+        self.superseded = False
+
+class CommandExecutor:
+    """
+    Runs submitted calls one at a time on a dedicated worker thread.
+
+    Calls are ordered by priority and then by submission order. The time each
+    call spends waiting in the queue is recorded per operation name, and with a
+    metrics registry the queue wait and execution time are also recorded in its
+    histograms.
+    """
+
+    def __init__(self, name="renode-worker", metrics=None):
+        """
+        Initializes the CommandExecutor and starts its worker thread.
+
+        Args:
+            name (str, optional): The worker thread name. Defaults to "renode-worker".
+            metrics (MetricsRegistry, optional): Receives "queue" and "exec"
+                durations per operation name.
+        """
+        self.metrics = metrics
+        self.queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._pending_keys = {}
+        self._wait_stats = {}
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def submit(self, priority, func, *args, name=None, key=None, max_age=None):
+        """
+        Queues a call for execution on the worker thread.
+
+        Args:
+            priority (int): The request priority (e.g. `PRIORITY_POLL`).
+            func (callable): The function to call.
+            *args: Positional arguments for `func`.
+            name (str, optional): Operation name used for statistics. Defaults to
+                the function name.
+            key (str, optional): Coalescing key. A pending request with the same key
+                is dropped as stale when this one is submitted.
+            max_age (float, optional): Seconds the request may wait in the queue
+                before it is dropped as stale.
+
+        Returns:
+            concurrent.futures.Future: The future receiving the call's result.
+        """
+        job = _Job(func, args, name or getattr(func, "__name__", "call"), key, max_age)
+        if key is not None:
+            with self._lock:
+                previous = self._pending_keys.get(key)
+                if previous is not None:
+                    previous.superseded = True
+                self._pending_keys[key] = job
+        self.queue.put((priority, next(self._seq), job))
+        return job.future
+
+    def wait_stats(self):
+        """
+        Returns queue-wait statistics per operation.
+
+        Returns:
+            dict: Maps operation names to dicts with 'count', 'total' and 'max'
+                wait times in seconds.
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._wait_stats.items()}
+
+    def shutdown(self, wait=True):
+        """
+        Stops the worker after the calls already queued have run.
+
+        Args:
+            wait (bool, optional): Whether to wait for the worker to exit.
+        """
+        self.queue.put((float("inf"), next(self._seq), None))
+        if wait:
+            self.thread.join()
+
+    def _run(self):
+        """
+        Worker thread body.
+        """
+        while True:
+            _, _, job = self.queue.get()
+            if job is None:
+                break
+            if job.key is not None:
+                with self._lock:
+                    if self._pending_keys.get(job.key) is job:
+                        del self._pending_keys[job.key]
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            waited = time.monotonic() - job.submitted
+            self._record_wait(job.name, waited)
+            if job.superseded or (job.max_age is not None and waited > job.max_age):
+                logger.debug(f"Dropping stale request {job.name} after {waited:.3f}s")
+                job.future.set_exception(StaleRequestError(f"{job.name} dropped after waiting {waited:.3f}s"))
+                continue
+            started = time.perf_counter()
+            try:
+                result = job.func(*job.args)
+            except BaseException as e:
+                self._record_exec(job.name, started)
+                job.future.set_exception(e)
+            else:
+                self._record_exec(job.name, started)
+                job.future.set_result(result)
+
+    def _record_exec(self, name, started):
+        """
+        Records the execution time of a call in the metrics registry, if any.
+
+        Args:
+            name (str): The operation name.
+            started (float): `time.perf_counter()` when the call started.
+        """
+        if self.metrics is not None:
+            self.metrics.observe(name, "exec", time.perf_counter() - started)
+
+    def _record_wait(self, name, waited):
+        """
+        Adds a queue-wait sample to the statistics.
+
+        Args:
+            name (str): The operation name.
+            waited (float): The wait time in seconds.
+        """
+        if self.metrics is not None:
+            self.metrics.observe(name, "queue", waited)
+        with self._lock:
+            stats = self._wait_stats.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["total"] += waited
+            stats["max"] = max(stats["max"], waited)
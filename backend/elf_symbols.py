@@ -0,0 +1,292 @@
+"""
+ELF Symbols Module.
+
+This module reads the symbol table of the ELF images loaded by a Renode script and
+indexes it for fast lookups. The parser is pure Python and only reads the section
+headers, the symbol table and its string table, so large images with debug info
+are cheap to open. Symbols are kept in sorted arrays: one ordered by address for
+address-to-symbol bisection, one ordered by name for lookups and completion.
+"""
+
+import logging
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+logger = logging.getLogger(__name__)
+
+SHT_SYMTAB = 2
+SHT_DYNSYM = 11
+SHN_UNDEF = 0
+# Symbol types worth indexing: NOTYPE, OBJECT, FUNC.
+SYMBOL_TYPES = {0, 1, 2}
+
+# Header layouts after e_ident, section header and symbol entry, per ELF class.
+_LAYOUTS = {
+    1: ("HHIIIIIHHHHHH", "IIIIIIIIII", "IIIBBH"),
+    2: ("HHIQQQIHHHHHH", "IIQQQQIIQQ", "IBBHQQ"),
+}
+
+LOAD_ELF_PATTERN = re.compile(r"\bLoadELF\s+(@\"[^\"]+\"|@\S+|\$\w+)")
+# `?=` only assigns a variable that is not set yet; `=` always assigns.
+VARIABLE_PATTERN = re.compile(r"^\s*(\$\w+)\s*(\??=)\s*(@\"[^\"]+\"|@\S+)")
+# Hex addresses annotated in log lines.
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{4,16}\b")
+
+class SymbolTable:
+    """
+    An immutable, sorted index of symbols.
+
+    Address lookups bisect the address-ordered arrays; name lookups and prefix
+    completion bisect the name-ordered list. Both are O(log n).
+    """
+
+    def __init__(self, symbols):
+        """
+        Initializes the SymbolTable.
+
+        Args:
+            symbols (iterable): (name, address, size) tuples.
+        """
+        by_address = sorted(symbols, key=lambda s: (s[1], s[0]))
+        self.names = [s[0] for s in by_address]
+        self.addresses = array('Q', (s[1] for s in by_address))
+        self.sizes = array('Q', (s[2] for s in by_address))
+        order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._sorted_names = [self.names[i] for i in order]
+        self._name_rows = array('L', order)
+
+    def __len__(self):
+        """
+        Returns the number of symbols.
+
+        Returns:
+            int: The number of symbols.
+        """
+        return len(self.names)
+
+    def address_of(self, name):
+        """
+        Looks up a symbol by name.
+
+        Args:
+            name (str): The exact symbol name.
+
+        Returns:
+            int: The symbol address, or None if there is no such symbol.
+        """
+        i = bisect_left(self._sorted_names, name)
+        if i < len(self._sorted_names) and self._sorted_names[i] == name:
+            return self.addresses[self._name_rows[i]]
+        return None
+
+    def symbol_at(self, addr):
+        """
+        Finds the symbol containing an address.
+
+        Symbols with a size match any address inside them; symbols without a
+        size only match their own address.
+
+        Args:
+            addr (int): The address.
+
+        Returns:
+            tuple: (name, offset) of the symbol, or None if no symbol matches.
+        """
+        i = bisect_right(self.addresses, addr) - 1
+        while i >= 0:
+            start, size = self.addresses[i], self.sizes[i]
+            if addr < start + size or addr == start:
+                return self.names[i], addr - start
+            if i == 0 or self.addresses[i - 1] != start:
+                return None
+            i -= 1 # Another symbol at the same address may have a size
+        return None
+
+    def label(self, addr):
+        """
+        Formats an address as "symbol" or "symbol+0xoffset".
+
+        Args:
+            addr (int): The address.
+
+        Returns:
+            str: The label, or None if no symbol matches.
+        """
+        found = self.symbol_at(addr)
+        if found is None:
+            return None
+        name, offset = found
+        return f"{name}+{hex(offset)}" if offset else name
+
+    def annotate(self, text):
+        """
+        Appends the symbol label to every hex address in a text.
+
+        Args:
+            text (str): The text, e.g. a log line.
+
+        Returns:
+            str: The text with "0x... <symbol+0xoffset>" annotations.
+        """
+        if "0x" not in text:
+            return text
+
+        def replace(match):
+            label = self.label(int(match.group(0), 16))
+            return f"{match.group(0)} <{label}>" if label else match.group(0)
+
+        return ADDRESS_PATTERN.sub(replace, text)
+
+    def complete(self, prefix, limit=50):
+        """
+        Returns symbol names starting with a prefix, in sorted order.
+
+        Args:
+            prefix (str): The name prefix.
+            limit (int, optional): Maximum number of names returned. Defaults to 50.
+
+        Returns:
+            list: The matching names.
+        """
+        names = self._sorted_names
+        i = bisect_left(names, prefix)
+        result = []
+        while i < len(names) and len(result) < limit and names[i].startswith(prefix):
+            if not result or result[-1] != names[i]:
+                result.append(names[i])
+            i += 1
+        return result
+
+def read_elf_symbols(path):
+    """
+    Reads the defined symbols of an ELF file.
+
+    Args:
+        path (str): The ELF file path.
+
+    Returns:
+        list: (name, address, size) tuples.
+
+    Raises:
+        ValueError: If the file is not a valid ELF file.
+    """
+    with open(path, "rb") as f:
+        ident = f.read(16)
+        if len(ident) < 16 or ident[:4] != b"\x7fELF" or ident[4] not in _LAYOUTS or ident[5] not in (1, 2):
+            raise ValueError(f"{path} is not an ELF file")
+        endian = "<" if ident[5] == 1 else ">"
+        header_fmt, section_fmt, symbol_fmt = (endian + fmt for fmt in _LAYOUTS[ident[4]])
+        header = struct.unpack(header_fmt, f.read(struct.calcsize(header_fmt)))
+        shoff, shentsize, shnum = header[5], header[10], header[11]
+        if not shoff or not shnum:
+            return []
+
+        f.seek(shoff)
+        raw = f.read(shentsize * shnum)
+        sections = [struct.unpack_from(section_fmt, raw, i * shentsize) for i in range(shnum)]
+
+        # Prefer the full symbol table; fall back to the dynamic one
+        symtabs = [s for s in sections if s[1] == SHT_SYMTAB] or [s for s in sections if s[1] == SHT_DYNSYM]
+        symbols = []
+        symbol_size = struct.calcsize(symbol_fmt)
+        for section in symtabs:
+            strtab = sections[section[6]]
+            f.seek(strtab[4])
+            strings = f.read(strtab[5])
+            f.seek(section[4])
+            data = f.read(section[5] - section[5] % symbol_size)
+            for entry in struct.iter_unpack(symbol_fmt, data):
+                if ident[4] == 1:
+                    name_off, value, sym_size, info, _, shndx = entry
+                else:
+                    name_off, info, _, shndx, value, sym_size = entry
+                if not name_off or shndx == SHN_UNDEF or (info & 0xF) not in SYMBOL_TYPES:
+                    continue
+                end = strings.find(b"\0", name_off)
+                name = strings[name_off:end if end >= 0 else None].decode("utf-8", "replace")
+                if name and not name.startswith("$"): # Skip ARM/AArch64 mapping symbols
+                    symbols.append((name, value, sym_size))
+        return symbols
+
+def resolve_script_path(token, script_dir):
+    """
+    Resolves a Renode path token (e.g. `@./main.elf`) to a file path.
+
+    Args:
+        token (str): The token, including the leading '@'.
+        script_dir (str): The directory of the script.
+
+    Returns:
+        str: The first existing candidate path, or None.
+    """
+    path = token[1:].strip('"').replace("$ORIGIN", script_dir)
+    if os.path.isabs(path):
+        return path if os.path.exists(path) else None
+    for base in (script_dir, os.getcwd()):
+        candidate = os.path.normpath(os.path.join(base, path))
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+def find_script_elfs(script_path):
+    """
+    Finds the ELF files loaded by `LoadELF` commands of a Renode script.
+
+    `$variable = @path` and `$variable ?= @path` assignments in the script are
+    followed, in script order.
+
+    Args:
+        script_path (str): The path of the .resc script.
+
+    Returns:
+        list: The existing ELF file paths.
+    """
+    script_dir = os.path.dirname(os.path.abspath(script_path))
+    variables = {}
+    paths = []
+    with open(script_path, errors="replace") as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            assignment = VARIABLE_PATTERN.match(line)
+            if assignment:
+                name, operator, value = assignment.groups()
+                if operator == "?=":
+                    variables.setdefault(name, value)
+                else:
+                    variables[name] = value
+                continue
+            load = LOAD_ELF_PATTERN.search(line)
+            if load:
+                token = variables.get(load.group(1), load.group(1))
+                path = resolve_script_path(token, script_dir) if token.startswith("@") else None
+                if path is None:
+                    logger.warning(f"ELF file not found for '{line.strip()}'")
+                elif path not in paths:
+                    paths.append(path)
+    return paths
+
+def load_script_symbols(script_path):
+    """
+    Builds a symbol table from all ELF files loaded by a Renode script.
+
+    Intended to run off the UI thread.
+
+    Args:
+        script_path (str): The path of the .resc script.
+
+    Returns:
+        SymbolTable: The symbols, or None if the script loads no readable ELF.
+    """
+    symbols = []
+    found = False
+    for path in find_script_elfs(script_path):
+        try:
+            symbols.extend(read_elf_symbols(path))
+            found = True
+            logger.info(f"Read symbols from {path}")
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Failed to read symbols from {path}: {e}")
+    return SymbolTable(symbols) if found else None
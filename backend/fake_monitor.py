@@ -0,0 +1,222 @@
+"""
+Fake Monitor Module.
+
+This module serves a `SimulatedRenode` (or `SimulatedEmulation`) over a socket
+the way `renode --port N` serves its monitor: telnet option negotiation on
+connect, a banner, the command line echoed back, errors printed in red and a
+"(monitor) " or "(<machine>) " prompt after every response. It lets the socket
+transport (`backend/socket_bridge.py`) be exercised without Renode, e.g.:
+
+    python -m backend.fake_monitor --port 1234 benchmarks/simulation_multi.json
+
+`drop_clients` closes every connection, like a crashing Renode process.
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+
+from .simulated_backend import SimulatedRenode, load_simulation
+
+logger = logging.getLogger(__name__)
+
+# IAC WILL ECHO, IAC WILL SUPPRESS-GO-AHEAD, as sent by the Renode telnet server.
+TELNET_GREETING = b"\xff\xfb\x01\xff\xfb\x03"
+BANNER = "Renode, fake monitor over SimulatedRenode\r\n"
+RED, RESET = "\x1b[31;1m", "\x1b[0m"
+PROMPT_COLOR = "\x1b[34;1m"
+
+class FakeMonitorServer:
+    """
+    A socket monitor answering commands from a simulation.
+
+    Commands run one at a time on a worker thread, in the order received across
+    all connections, like the single monitor of a Renode process.
+    """
+
+    def __init__(self, simulation, host="127.0.0.1", port=0):
+        """
+        Initializes the FakeMonitorServer.
+
+        Args:
+            simulation (SimulatedRenode or SimulatedEmulation): The emulation served.
+            host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): The port; 0 picks a free one. Defaults to 0.
+        """
+        self.simulation = simulation
+        self.host = host
+        self.port = port
+        self.commands = 0
+        self._server = None
+        self._writers = set()
+        self._handlers = set()
+        self._lock = asyncio.Lock()
+        self._current = None # Machine selected with `mach set`, None for the monitor context
+
+    async def start(self):
+        """
+        Starts listening; `port` then holds the actual port.
+        """
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Fake monitor listening on {self.host}:{self.port}")
+
+    def drop_clients(self):
+        """
+        Closes every client connection, keeping the server listening.
+        """
+        for writer in list(self._writers):
+            writer.close()
+
+    async def close(self):
+        """
+        Stops listening and closes every client connection.
+        """
+        if self._server is not None:
+            self._server.close()
+        self.drop_clients()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _prompt(self):
+        """
+        Returns the prompt for the current context.
+
+        Returns:
+            str: The colored prompt.
+        """
+        return f"{PROMPT_COLOR}({self._current or 'monitor'}) {RESET}"
+
+    async def _serve(self, reader, writer):
+        """
+        Serves one client connection.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        loop = asyncio.get_running_loop()
+        try:
+            writer.write(TELNET_GREETING + (BANNER + self._prompt()).encode())
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip("\r\n")
+                async with self._lock:
+                    output, error = await loop.run_in_executor(None, self.execute, command)
+                    self.commands += 1
+                response = f"{command}\r\n"
+                if output:
+                    response += output.replace("\n", "\r\n") + "\r\n"
+                if error:
+                    response += f"{RED}{error}{RESET}\r\n"
+                writer.write((response + self._prompt()).encode())
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    def _machines(self):
+        """
+        Returns the simulated machines by name.
+
+        Returns:
+            dict: Maps machine names to `SimulatedRenode` objects.
+        """
+        return self.simulation.machines
+
+    def _machine(self):
+        """
+        Returns the machine commands apply to.
+
+        Returns:
+            SimulatedRenode: The selected machine, or the first one.
+        """
+        machines = self._machines()
+        return machines.get(self._current) or next(iter(machines.values()))
+
+    def execute(self, command):
+        """
+        Executes a monitor command.
+
+        Handles the commands the socket transport issues that the simulation
+        itself does not: script inclusion, log file setup, machine selection
+        and listing, per-machine control and `ReadBytes`.
+
+        Args:
+            command (str): The command line.
+
+        Returns:
+            tuple: (output, error) strings.
+        """
+        words = command.split()
+        if not words:
+            return "", ""
+        try:
+            if words[0] in ("i", "include") and len(words) > 1:
+                self.simulation.load_script(command.split(None, 1)[1].lstrip("@").strip().strip('"'))
+                return "", ""
+            if words[0] == "logFile" and len(words) > 1:
+                self.simulation.attach_log_file(command.split(None, 1)[1].lstrip("@").strip().strip('"'))
+                return "", ""
+            if words[0] == "logLevel":
+                return "", ""
+            if words == ["mach"]:
+                names = "\n".join(f"\t{i}: {name}" for i, name in enumerate(self._machines()))
+                return f"Available machines:\n{names}", ""
+            if words[:2] == ["mach", "set"] and len(words) > 2:
+                name = command.split(None, 2)[2].strip().strip('"')
+                if name not in self._machines():
+                    return "", f"No machine named {name}"
+                self._current = name
+                if not isinstance(self.simulation, SimulatedRenode):
+                    self.simulation.execute(command)
+                return "", ""
+            if words == ["mach", "clear"]:
+                self._current = None
+                return "", ""
+            if words[0] == "machine" and len(words) == 2 and words[1] in ("Start", "Pause", "Reset"):
+                getattr(self._machine(), words[1].lower())()
+                return "", ""
+            access = re.fullmatch(r"sysbus ReadBytes (\S+) (\S+)", command.strip())
+            if access:
+                data = self._machine().read_bytes(int(access.group(1), 0), int(access.group(2), 0))
+                return "[\n" + ", ".join(f"0x{byte:02X}" for byte in data) + "\n]", ""
+            if words[0] == "sysbus":
+                return self._machine().execute(command)
+            return self.simulation.execute(command)
+        except Exception as e:
+            return "", str(e)
+
+def main():
+    """
+    Serves a simulation until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Fake Renode socket monitor over a SimulatedRenode")
+    parser.add_argument("config", nargs="?", help="Simulation JSON file (see backend/simulated_backend.py)")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=1234, help="Port to listen on (default: 1234)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    async def serve():
+        server = FakeMonitorServer(load_simulation(args.config) if args.config else SimulatedRenode(),
+                                   args.host, args.port)
+        await server.start()
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
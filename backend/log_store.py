@@ -0,0 +1,293 @@
+"""
+Log Store Module.
+
+This module keeps Renode log lines in a bounded columnar buffer. Lines are parsed
+on arrival (on the log tailing thread) into timestamp, level, machine, source and
+message columns, and indexed by level, machine and source so that filtering costs
+time proportional to the matching lines only. Every line gets a sequence number
+that stays valid until the line is dropped from the buffer, which is what views
+and search results refer to. Regex searches work on a snapshot of the lines and
+can run on any thread.
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+# Renode log levels from least to most severe; "" marks lines without a level,
+# e.g. monitor output.
+LOG_LEVELS = ("", "NOISY", "DEBUG", "INFO", "WARNING", "ERROR")
+# A Renode log line, e.g. "12:00:00.0000 [INFO] machine-0/uart0: message". The
+# machine prefix is missing in single-machine emulations and on emulation-wide
+# sources; the source is missing on free-form messages.
+LOG_LINE_PATTERN = re.compile(r"(\S+) \[(\w+)\] (?:(?:([^/\s:]+)/)?([^\s:]+): )?")
+# Default number of lines kept.
+DEFAULT_LOG_CAPACITY = 100000
+# Lines searched between two checks of the cancellation flag.
+SEARCH_CHUNK = 4096
+
+class LogStore:
+    """
+    A bounded, indexed buffer of parsed log lines.
+
+    Thread-safe: lines are appended by the log tailing thread while the UI reads
+    cells and selects lines. Machine and source names are interned to small
+    integer ids; id 0 stands for "none".
+    """
+
+    COLUMNS = ("timestamp", "level", "machine", "source", "message")
+
+    def __init__(self, capacity=DEFAULT_LOG_CAPACITY):
+        """
+        Initializes the LogStore.
+
+        Args:
+            capacity (int, optional): Maximum number of lines kept. Defaults to 100000.
+        """
+        self.capacity = capacity
+        self.first = 0 # Sequence number of the oldest line kept
+        self.lines = []
+        self.stamp_ends = array('L') # End of the timestamp in each line, 0 if none
+        self.message_starts = array('L') # Start of the message in each line
+        self.levels = array('B') # Index into LOG_LEVELS
+        self.machines = array('L') # Index into machine_names
+        self.sources = array('L') # Index into source_names
+        self.machine_names = [""]
+        self.source_names = [""]
+        self._machine_ids = {"": 0}
+        self._source_ids = {"": 0}
+        self._level_ids = {level: i for i, level in enumerate(LOG_LEVELS)}
+        # Sorted sequence numbers of the lines of each level, machine and source
+        self._by_level = [array('Q') for _ in LOG_LEVELS]
+        self._by_machine = [array('Q')]
+        self._by_source = [array('Q')]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the number of lines kept.
+
+        Returns:
+            int: The number of lines.
+        """
+        return len(self.lines)
+
+    @property
+    def end(self):
+        """
+        Returns the sequence number the next line will get.
+
+        Returns:
+            int: The sequence number.
+        """
+        return self.first + len(self.lines)
+
+    def append(self, lines):
+        """
+        Parses, stores and indexes a batch of lines, dropping the oldest lines
+        beyond the capacity.
+
+        Args:
+            lines (list): The log lines.
+
+        Returns:
+            range: The sequence numbers of the new lines.
+        """
+        match = LOG_LINE_PATTERN.match
+        level_ids = self._level_ids
+        parsed = []
+        for line in lines:
+            m = match(line)
+            if m is None:
+                parsed.append((0, 0, 0, "", ""))
+            else:
+                stamp_end, level, machine, source = m.end(1), m.group(2), m.group(3) or "", m.group(4) or ""
+                parsed.append((stamp_end, m.end(), level_ids.get(level, 0), machine, source))
+        with self._lock:
+            start = self.end
+            self.lines.extend(lines)
+            by_level, by_machine, by_source = self._by_level, self._by_machine, self._by_source
+            for seq, (stamp_end, message_start, level, machine, source) in enumerate(parsed, start):
+                machine_id = self._machine_ids.get(machine)
+                if machine_id is None:
+                    machine_id = self._machine_ids[machine] = len(self.machine_names)
+                    self.machine_names.append(machine)
+                    by_machine.append(array('Q'))
+                source_id = self._source_ids.get(source)
+                if source_id is None:
+                    source_id = self._source_ids[source] = len(self.source_names)
+                    self.source_names.append(source)
+                    by_source.append(array('Q'))
+                self.stamp_ends.append(stamp_end)
+                self.message_starts.append(message_start)
+                self.levels.append(level)
+                self.machines.append(machine_id)
+                self.sources.append(source_id)
+                by_level[level].append(seq)
+                by_machine[machine_id].append(seq)
+                by_source[source_id].append(seq)
+            # Trimming shifts every column, so let the buffer overshoot a little
+            if len(self.lines) > self.capacity + max(self.capacity // 16, 1):
+                self._drop(len(self.lines) - self.capacity)
+            return range(start, self.end)
+
+    def _drop(self, count):
+        """
+        Drops the oldest lines. The lock must be held.
+
+        Args:
+            count (int): The number of lines to drop.
+        """
+        for column in (self.lines, self.stamp_ends, self.message_starts, self.levels, self.machines, self.sources):
+            del column[:count]
+        self.first += count
+        for index in chain(self._by_level, self._by_machine, self._by_source):
+            del index[:bisect_left(index, self.first)]
+
+    def clear(self):
+        """
+        Drops all lines. Sequence numbers keep increasing.
+        """
+        with self._lock:
+            self._drop(len(self.lines))
+
+    def cell(self, seq, column):
+        """
+        Returns one field of a line.
+
+        Args:
+            seq (int): The line's sequence number.
+            column (int): The field, an index into `COLUMNS`.
+
+        Returns:
+            str: The field text, or None if the line was dropped.
+        """
+        with self._lock:
+            row = seq - self.first
+            if not 0 <= row < len(self.lines):
+                return None
+            if column == 0:
+                return self.lines[row][:self.stamp_ends[row]]
+            if column == 1:
+                return LOG_LEVELS[self.levels[row]]
+            if column == 2:
+                return self.machine_names[self.machines[row]]
+            if column == 3:
+                return self.source_names[self.sources[row]]
+            return self.lines[row][self.message_starts[row]:]
+
+    def line(self, seq):
+        """
+        Returns the full text of a line.
+
+        Args:
+            seq (int): The line's sequence number.
+
+        Returns:
+            str: The line, or None if it was dropped.
+        """
+        with self._lock:
+            row = seq - self.first
+            return self.lines[row] if 0 <= row < len(self.lines) else None
+
+    def level(self, seq):
+        """
+        Returns the level of a line.
+
+        Args:
+            seq (int): The line's sequence number.
+
+        Returns:
+            str: The level, "" if none or if the line was dropped.
+        """
+        with self._lock:
+            row = seq - self.first
+            return LOG_LEVELS[self.levels[row]] if 0 <= row < len(self.lines) else ""
+
+    def source_list(self):
+        """
+        Returns the names of all sources seen so far.
+
+        Returns:
+            list: The source names, sorted.
+        """
+        with self._lock:
+            return sorted(self.source_names[1:])
+
+    def select(self, levels=None, machine=None, sources=None, start=0):
+        """
+        Returns the lines matching a filter, using the indexes.
+
+        Args:
+            levels (iterable, optional): The accepted levels; None accepts all.
+            machine (str, optional): The machine; lines without a machine are
+                always accepted. None accepts all machines.
+            sources (iterable, optional): The accepted sources; None accepts all.
+            start (int, optional): The first sequence number to consider.
+
+        Returns:
+            array: The sorted sequence numbers of the matching lines.
+        """
+        with self._lock:
+            start = max(start, self.first)
+            dimensions = []
+            if levels is not None:
+                ids = [self._level_ids[level] for level in levels if level in self._level_ids]
+                dimensions.append((self.levels, ids, [self._by_level[i] for i in ids]))
+            if machine is not None:
+                ids = [0] + ([self._machine_ids[machine]] if machine in self._machine_ids else [])
+                dimensions.append((self.machines, ids, [self._by_machine[i] for i in ids]))
+            if sources is not None:
+                ids = [self._source_ids[source] for source in sources if source in self._source_ids]
+                dimensions.append((self.sources, ids, [self._by_source[i] for i in ids]))
+            if not dimensions:
+                return array('Q', range(start, self.end))
+            # Walk the smallest candidate set and check the other filters on the columns
+            sizes = [sum(len(index) - bisect_left(index, start) for index in indexes) for _, _, indexes in dimensions]
+            smallest = sizes.index(min(sizes))
+            _, _, indexes = dimensions.pop(smallest)
+            runs = [index[bisect_left(index, start):] for index in indexes]
+            candidates = runs[0] if len(runs) == 1 else array('Q', sorted(chain.from_iterable(runs)))
+            first = self.first
+            for column, ids, _ in dimensions:
+                accepted = bytearray(max(ids, default=0) + 1)
+                for i in ids:
+                    accepted[i] = 1
+                limit = len(accepted)
+                candidates = array('Q', [seq for seq in candidates
+                                         if column[seq - first] < limit and accepted[column[seq - first]]])
+            return candidates
+
+    def search(self, pattern, seqs=None, cancelled=None):
+        """
+        Returns the lines matching a regular expression.
+
+        The lines are snapshotted under the lock and searched without it, so
+        this can run on a worker thread while lines keep arriving.
+
+        Args:
+            pattern (re.Pattern): The compiled expression, searched in the full lines.
+            seqs (array, optional): Sorted sequence numbers to search; None searches all lines.
+            cancelled (threading.Event, optional): Aborts the search when set.
+
+        Returns:
+            array: The sorted sequence numbers of the matching lines, or None if cancelled.
+        """
+        with self._lock:
+            first, lines = self.first, self.lines[:]
+        if seqs is None:
+            seqs = range(first, first + len(lines))
+        else:
+            seqs = seqs[bisect_left(seqs, first):]
+            end = first + len(lines)
+            if seqs and seqs[-1] >= end:
+                seqs = seqs[:bisect_left(seqs, end)]
+        found = array('Q')
+        search = pattern.search
+        for offset in range(0, len(seqs), SEARCH_CHUNK):
+            if cancelled is not None and cancelled.is_set():
+                return None
+            found.extend([seq for seq in seqs[offset:offset + SEARCH_CHUNK] if search(lines[seq - first])])
+        return found
@@ -0,0 +1,174 @@
+"""
+Log Tail Module.
+
+This module provides an event-driven tailer for the Renode log file. On Linux it
+sleeps on inotify until Renode writes to the file, then reads everything available
+in large chunks and delivers complete lines in batches. Where inotify is not
+available it falls back to short polling.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+
+# Bytes read from the log file per read call.
+READ_CHUNK_SIZE = 1 << 16
+# Poll interval used when inotify is unavailable, in seconds.
+FALLBACK_POLL_INTERVAL = 0.05
+
+def _open_inotify(path):
+    """
+    Creates a non-blocking inotify descriptor watching a file for writes.
+
+    Args:
+        path (str): The file to watch.
+
+    Returns:
+        int: The inotify file descriptor, or None if inotify is unavailable.
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(path), IN_MODIFY | IN_CLOSE_WRITE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+class LogTailer:
+    """
+    Tails a log file on a background thread and delivers lines in batches.
+
+    The callback receives a list of lines. A batch is delivered as soon as
+    `max_batch` lines are pending; otherwise at most one batch is delivered per
+    `flush_interval`. A line arriving after a quiet period is delivered
+    immediately, while floods are coalesced into few callbacks.
+    """
+
+    def __init__(self, path, callback, max_batch=1000, flush_interval=0.02):
+        """
+        Initializes the LogTailer.
+
+        Args:
+            path (str): The path to the log file.
+            callback (callable): A function that accepts a list of log lines.
+            max_batch (int, optional): Maximum number of lines per callback. Defaults to 1000.
+            flush_interval (float, optional): Minimum time in seconds between two
+                partial batches. Defaults to 0.02.
+        """
+        self.path = path
+        self.callback = callback
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.stop_event = threading.Event()
+        self.thread = None
+        self._wake_r, self._wake_w = os.pipe()
+
+    def start(self):
+        """
+        Starts the tailing thread.
+        """
+        self.thread = threading.Thread(target=self._run, name="renode-log-tail", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=1.0):
+        """
+        Stops the tailing thread, flushing any pending lines first.
+
+        The thread closes the read end of the wake-up pipe itself when it exits,
+        so a thread still running after `timeout` never waits on a closed
+        descriptor.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to exit.
+        """
+        self.stop_event.set()
+        if self._wake_w is None:
+            return
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+        os.close(self._wake_w)
+        self._wake_w = None
+        if self.thread:
+            self.thread.join(timeout=timeout)
+        else:
+            os.close(self._wake_r)
+
+    def _run(self):
+        """
+        Thread body: waits for writes, reads chunks and delivers batches.
+        """
+        logger.info("Log tailing started")
+        inotify_fd = _open_inotify(self.path)
+        if inotify_fd is None:
+            logger.info("inotify unavailable, polling the log file")
+        wait_fds = [self._wake_r] + ([inotify_fd] if inotify_fd is not None else [])
+        pending = []
+        last_flush = 0.0
+        partial = b""
+        try:
+            with open(self.path, "rb") as f:
+                fd = f.fileno()
+                while not self.stop_event.is_set():
+                    # Drain everything currently in the file
+                    while True:
+                        chunk = os.read(fd, READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        *lines, partial = (partial + chunk).split(b"\n")
+                        pending.extend(line.decode("utf-8", "replace").strip() for line in lines)
+                        while len(pending) >= self.max_batch:
+                            self.callback(pending[:self.max_batch])
+                            del pending[:self.max_batch]
+                            last_flush = time.monotonic()
+
+                    timeout = None if inotify_fd is not None else FALLBACK_POLL_INTERVAL
+                    if pending:
+                        now = time.monotonic()
+                        remaining = last_flush + self.flush_interval - now
+                        if remaining <= 0:
+                            self.callback(pending)
+                            pending, last_flush = [], now
+                        else:
+                            timeout = remaining if timeout is None else min(timeout, remaining)
+
+                    readable, _, _ = select.select(wait_fds, [], [], timeout)
+                    if inotify_fd in readable:
+                        try:
+                            os.read(inotify_fd, 4096) # Discard the events; we only need the wakeup
+                        except BlockingIOError:
+                            pass
+                # Pick up lines written just before the stop request
+                while True:
+                    chunk = os.read(fd, READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    *lines, partial = (partial + chunk).split(b"\n")
+                    pending.extend(line.decode("utf-8", "replace").strip() for line in lines)
+                # A last line without a newline
+                if partial.strip():
+                    pending.append(partial.decode("utf-8", "replace").strip())
+                for start in range(0, len(pending), self.max_batch):
+                    self.callback(pending[start:start + self.max_batch])
+        except Exception as e:
+            logger.error(f"Log tailing error: {e}")
+        finally:
+            if inotify_fd is not None:
+                os.close(inotify_fd)
+            os.close(self._wake_r)
+            logger.info("Log tailing stopped")
@@ -0,0 +1,339 @@
+"""
+Metrics Module.
+
+This module records per-operation latencies in fixed-size log-scale histograms.
+Recording a sample is a bucket increment under a lock, so every bridge call can
+be instrumented without measurable overhead. Snapshots report p50, p99 and max
+per operation and phase, and can be exported periodically as JSON or in the
+Prometheus textfile format.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Histogram resolution: buckets per power of two, starting at HISTOGRAM_MIN seconds.
+BUCKETS_PER_OCTAVE = 4
+HISTOGRAM_MIN = 1e-6
+HISTOGRAM_OCTAVES = 28 # Up to ~4.5 minutes
+# Phases of a bridge call, in the order they happen.
+PHASES = ("queue", "exec", "deliver", "apply")
+# Default time between two metric exports, in seconds.
+DEFAULT_EXPORT_INTERVAL = 10.0
+EXPORT_FORMATS = ("json", "prometheus")
+
+class LatencyHistogram:
+    """
+    A histogram of durations with logarithmically spaced buckets.
+
+    Quantiles are accurate to one bucket, i.e. within about 19%; the exact
+    count, sum and maximum are kept alongside.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        """
+        Initializes an empty LatencyHistogram.
+        """
+        self.counts = array('Q', bytes(8 * BUCKETS_PER_OCTAVE * HISTOGRAM_OCTAVES))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def bucket(seconds):
+        """
+        Returns the bucket index of a duration.
+
+        Args:
+            seconds (float): The duration.
+
+        Returns:
+            int: The bucket index.
+        """
+        if seconds < HISTOGRAM_MIN:
+            return 0
+        mantissa, exponent = math.frexp(seconds / HISTOGRAM_MIN)
+        index = (exponent - 1) * BUCKETS_PER_OCTAVE + int((mantissa - 0.5) * 2 * BUCKETS_PER_OCTAVE)
+        return min(index, BUCKETS_PER_OCTAVE * HISTOGRAM_OCTAVES - 1)
+
+    @staticmethod
+    def upper_bound(index):
+        """
+        Returns the upper bound of a bucket.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            float: The largest duration in the bucket, in seconds.
+        """
+        octave, step = divmod(index + 1, BUCKETS_PER_OCTAVE)
+        return HISTOGRAM_MIN * (2 ** octave) * (1 + step / BUCKETS_PER_OCTAVE)
+
+    def add(self, seconds):
+        """
+        Records a duration.
+
+        Args:
+            seconds (float): The duration.
+        """
+        self.counts[self.bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """
+        Estimates a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The upper bound of the bucket holding the quantile, capped at
+                the maximum, or 0.0 without samples.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Summarizes the histogram.
+
+        Returns:
+            dict: 'count', 'sum', 'p50', 'p99' and 'max', in seconds.
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+class MetricsRegistry:
+    """
+    Latency histograms keyed by operation name and phase.
+
+    Thread-safe: samples are recorded from the worker threads and the asyncio
+    loop, while snapshots are taken by the UI and the exporter.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty MetricsRegistry.
+        """
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation, phase, seconds):
+        """
+        Records a duration.
+
+        Args:
+            operation (str): The operation name, e.g. "read_many".
+            phase (str): The phase, one of `PHASES`.
+            seconds (float): The duration.
+        """
+        with self._lock:
+            histogram = self._histograms.get((operation, phase))
+            if histogram is None:
+                histogram = self._histograms[(operation, phase)] = LatencyHistogram()
+            histogram.add(seconds)
+
+    @contextmanager
+    def timer(self, operation, phase):
+        """
+        Records the duration of a `with` block.
+
+        Args:
+            operation (str): The operation name.
+            phase (str): The phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(operation, phase, time.perf_counter() - start)
+
+    def snapshot(self):
+        """
+        Summarizes every histogram.
+
+        Returns:
+            dict: Maps operation names to dicts mapping phases to the summaries
+                of `LatencyHistogram.summary`.
+        """
+        with self._lock:
+            items = [(key, histogram.summary()) for key, histogram in self._histograms.items()]
+        result = {}
+        for (operation, phase), summary in sorted(items, key=lambda item: (item[0][0], _phase_order(item[0][1]))):
+            result.setdefault(operation, {})[phase] = summary
+        return result
+
+    def reset(self):
+        """
+        Drops all recorded samples.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+def _phase_order(phase):
+    """
+    Returns the sort position of a phase.
+
+    Args:
+        phase (str): The phase.
+
+    Returns:
+        int: Its index in `PHASES`, or after them for unknown phases.
+    """
+    return PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+def format_json(snapshot):
+    """
+    Formats a metrics snapshot as JSON.
+
+    Args:
+        snapshot (dict): A snapshot from `MetricsRegistry.snapshot`.
+
+    Returns:
+        str: The JSON document, with a 'timestamp' and the 'operations'.
+    """
+    return json.dumps({"timestamp": time.time(), "operations": snapshot}, indent=2)
+
+def format_prometheus(snapshot, prefix="renode_ui_call"):
+    """
+    Formats a metrics snapshot in the Prometheus text exposition format.
+
+    Each operation and phase becomes a summary with 0.5 and 0.99 quantiles,
+    plus a gauge for the maximum.
+
+    Args:
+        snapshot (dict): A snapshot from `MetricsRegistry.snapshot`.
+        prefix (str, optional): The metric name prefix.
+
+    Returns:
+        str: The metrics text.
+    """
+    lines = [
+        f"# HELP {prefix}_seconds Latency of Renode bridge calls by operation and phase.",
+        f"# TYPE {prefix}_seconds summary",
+    ]
+    maxima = [
+        f"# HELP {prefix}_seconds_max Maximum latency of Renode bridge calls by operation and phase.",
+        f"# TYPE {prefix}_seconds_max gauge",
+    ]
+    for operation, phases in snapshot.items():
+        for phase, summary in phases.items():
+            labels = f'operation="{_escape_label(operation)}",phase="{phase}"'
+            lines.append(f'{prefix}_seconds{{{labels},quantile="0.5"}} {summary["p50"]:.9g}')
+            lines.append(f'{prefix}_seconds{{{labels},quantile="0.99"}} {summary["p99"]:.9g}')
+            lines.append(f'{prefix}_seconds_sum{{{labels}}} {summary["sum"]:.9g}')
+            lines.append(f'{prefix}_seconds_count{{{labels}}} {summary["count"]}')
+            maxima.append(f'{prefix}_seconds_max{{{labels}}} {summary["max"]:.9g}')
+    return "\n".join(lines + maxima) + "\n"
+
+def _escape_label(value):
+    """
+    Escapes a Prometheus label value.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class MetricsExporter:
+    """
+    Periodically writes a metrics snapshot to a file from a background thread.
+
+    Files are replaced atomically, as required by the Prometheus node exporter's
+    textfile collector.
+    """
+
+    def __init__(self, registry, path, format=None, interval=DEFAULT_EXPORT_INTERVAL):
+        """
+        Initializes the MetricsExporter.
+
+        Args:
+            registry (MetricsRegistry): The metrics to export.
+            path (str): The output file.
+            format (str, optional): "json" or "prometheus". Defaults to
+                "prometheus" for `.prom` files and "json" otherwise.
+            interval (float, optional): Seconds between two exports. Defaults to 10.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if format is None:
+            format = "prometheus" if path.endswith(".prom") else "json"
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown metrics format: {format}")
+        self.registry = registry
+        self.path = path
+        self.format = format
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def start(self):
+        """
+        Starts the export thread.
+        """
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stops the export thread after a final export.
+        """
+        self._stop.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def export(self):
+        """
+        Writes the current snapshot to the output file.
+        """
+        snapshot = self.registry.snapshot()
+        text = format_prometheus(snapshot) if self.format == "prometheus" else format_json(snapshot)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            f.write(text)
+        os.replace(temporary, self.path)
+
+    def _run(self):
+        """
+        Export thread body.
+        """
+        while not self._stop.wait(self.interval):
+            self._export_logged()
+        self._export_logged()
+
+    def _export_logged(self):
+        """
+        Exports, logging instead of raising on I/O errors.
+        """
+        try:
+            self.export()
+        except OSError as e:
+            logger.warning(f"Failed to export metrics to {self.path}: {e}")
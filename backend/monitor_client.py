@@ -0,0 +1,395 @@
+"""
+Monitor Client Module.
+
+This module provides an asyncio client for the Renode monitor served over a
+socket (`renode --port N`, the telnet monitor). Commands are pipelined: each one
+is written as soon as it is issued and responses are matched to commands in
+order, using the monitor prompt as the response delimiter. Telnet negotiation
+and ANSI escapes are stripped from the stream; text Renode prints in red is
+reported as the command's error. When the connection drops, pending commands
+fail and the client reconnects in the background until it is closed.
+
+The monitor applies commands to its current machine, which `mach set` changes
+for every later command of every client. `execute_on` runs commands on a given
+machine and restores the previous selection, without any other command in
+between, so background reads cannot redirect each other's or the user's commands.
+"""
+
+import asyncio
+import codecs
+import logging
+import re
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Default port of the Renode socket monitor.
+DEFAULT_MONITOR_PORT = 1234
+# Delay before the first reconnection attempt, doubled up to RECONNECT_MAX_DELAY.
+RECONNECT_DELAY = 0.5
+RECONNECT_MAX_DELAY = 5.0
+# Seconds to wait for the first prompt after connecting.
+CONNECT_TIMEOUT = 10.0
+# Bytes read from the socket per read call.
+READ_CHUNK_SIZE = 1 << 16
+
+# Telnet commands: IAC SB ... IAC SE, IAC WILL/WONT/DO/DONT <option>, IAC <command>.
+TELNET_PATTERN = re.compile(rb"\xff\xfa.*?\xff\xf0|\xff[\xfb-\xfe].|\xff[\xf0-\xf9\xff]", re.DOTALL)
+# An incomplete telnet command at the end of a chunk.
+TELNET_PARTIAL_PATTERN = re.compile(rb"\xff(?:\xfa.*|[\xfb-\xfe])?\Z", re.DOTALL)
+# ANSI escape sequences; SGR ("m") sequences are inspected for the color red.
+ANSI_PATTERN = re.compile(r"\x1b\[([0-9;?]*)([A-Za-z])")
+ANSI_PARTIAL_PATTERN = re.compile(r"\x1b(?:\[[0-9;?]*)?\Z")
+# Markers enclosing red (error) text once the escapes are stripped.
+ERROR_START, ERROR_END = "\x02", "\x03"
+ERROR_PATTERN = re.compile(f"{ERROR_START}(.*?)(?:{ERROR_END}|\\Z)", re.DOTALL)
+# The monitor prompt, "(monitor) " or "(<machine>) ", at the start of a line.
+PROMPT_PATTERN = re.compile(r"(?:^|\n)[\x02\x03]*\(([^()\r\n]+)\) [\x02\x03]*", re.MULTILINE)
+# Prompt context shown while no machine is selected.
+MONITOR_CONTEXT = "monitor"
+
+class MonitorDisconnectedError(ConnectionError):
+    """
+    Raised for commands issued or pending while the monitor is not connected.
+    """
+
+class MonitorClient:
+    """
+    A persistent, pipelined connection to a Renode socket monitor.
+
+    `run` keeps the connection up; `execute` and `execute_many` may be called
+    from any coroutine on the loop, concurrently.
+    """
+
+    def __init__(self, host="localhost", port=DEFAULT_MONITOR_PORT, on_connection=None):
+        """
+        Initializes the MonitorClient.
+
+        Args:
+            host (str, optional): The monitor host. Defaults to "localhost".
+            port (int, optional): The monitor port. Defaults to 1234.
+            on_connection (callable, optional): Called with True after every
+                (re)connection and with False when the connection drops.
+        """
+        self.host = host
+        self.port = port
+        self.on_connection = on_connection
+        self.connected = False
+        self.context = None # Name shown in the last prompt: "monitor" or the current machine
+        self.connects = 0
+        self._writer = None
+        self._pending = deque() # (command, future) in the order the commands were written
+        self._banner = None # Future resolved by the first prompt of a connection
+        self._closed = False
+        self._task = None
+        self._connected_event = asyncio.Event()
+        # Held while writing, and by `execute_on` from reading the current
+        # machine until its commands are written
+        self._write_lock = asyncio.Lock()
+
+    def start(self):
+        """
+        Starts connecting in the background, reconnecting whenever the connection drops.
+        """
+        self._task = asyncio.ensure_future(self.run())
+
+    def close(self):
+        """
+        Closes the connection and stops reconnecting. Pending commands fail.
+        """
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+        self._drop_connection()
+
+    async def run(self):
+        """
+        Connects and serves the connection, reconnecting with a growing delay.
+        """
+        delay = RECONNECT_DELAY
+        while not self._closed:
+            try:
+                reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            except OSError as e:
+                logger.debug(f"Cannot connect to the monitor at {self.host}:{self.port}: {e}")
+            else:
+                delay = RECONNECT_DELAY
+                await self._serve(reader)
+            if not self._closed:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _serve(self, reader):
+        """
+        Reads responses until the connection drops.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+        """
+        self._banner = asyncio.get_running_loop().create_future()
+        read_task = asyncio.ensure_future(self._read_loop(reader))
+        try:
+            await asyncio.wait([self._banner, read_task], timeout=CONNECT_TIMEOUT,
+                               return_when=asyncio.FIRST_COMPLETED)
+            if self._banner.done():
+                self.connected = True
+                self.connects += 1
+                self._connected_event.set()
+                logger.info(f"Connected to the Renode monitor at {self.host}:{self.port}")
+                self._notify(True)
+            elif not read_task.done():
+                logger.warning(f"No monitor prompt from {self.host}:{self.port} within {CONNECT_TIMEOUT:g}s")
+                read_task.cancel()
+            error = (await asyncio.gather(read_task, return_exceptions=True))[0]
+            if isinstance(error, Exception):
+                logger.debug(f"Monitor connection closed: {error}")
+        finally:
+            read_task.cancel()
+            was_connected = self.connected
+            self._drop_connection()
+            if was_connected and not self._closed:
+                logger.warning(f"Lost the connection to the Renode monitor at {self.host}:{self.port}")
+                self._notify(False)
+
+    def _notify(self, connected):
+        """
+        Reports a connection change to the listener.
+
+        Args:
+            connected (bool): Whether the monitor is now connected.
+        """
+        if self.on_connection is not None:
+            try:
+                self.on_connection(connected)
+            except Exception as e:
+                logger.error(f"Monitor connection listener failed: {e}")
+
+    def _drop_connection(self):
+        """
+        Closes the socket and fails every pending command.
+        """
+        self.connected = False
+        self._connected_event.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._banner is not None and not self._banner.done():
+            self._banner.cancel()
+        while self._pending:
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(MonitorDisconnectedError("Lost the connection to the Renode monitor"))
+
+    async def _read_loop(self, reader):
+        """
+        Splits the incoming stream into responses at each prompt.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        raw = b""  # Bytes held back: an incomplete telnet command
+        escape = "" # Text held back: an incomplete ANSI escape
+        text = ""  # Cleaned text not yet terminated by a prompt
+        red = False
+        while True:
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                raise MonitorDisconnectedError("Connection closed by the monitor")
+            raw = TELNET_PATTERN.sub(b"", raw + chunk)
+            partial = TELNET_PARTIAL_PATTERN.search(raw)
+            if partial is not None:
+                raw, held = raw[:partial.start()], raw[partial.start():]
+            else:
+                held = b""
+            decoded = escape + decoder.decode(raw)
+            raw = held
+            partial = ANSI_PARTIAL_PATTERN.search(decoded)
+            if partial is not None:
+                decoded, escape = decoded[:partial.start()], decoded[partial.start():]
+            else:
+                escape = ""
+            cleaned, red = _strip_ansi(decoded.replace("\r", ""), red)
+            text += cleaned
+            start = 0
+            for prompt in PROMPT_PATTERN.finditer(text):
+                self.context = prompt.group(1)
+                self._complete(text[start:prompt.start()])
+                start = prompt.end()
+            text = text[start:]
+
+    def _complete(self, response):
+        """
+        Resolves the oldest pending command with a response.
+
+        Args:
+            response (str): The cleaned text received before the prompt.
+        """
+        if self._banner is not None and not self._banner.done():
+            self._banner.set_result(response)
+            return
+        if not self._pending:
+            return # Output not asked for, e.g. after a reconnection
+        command, future = self._pending.popleft()
+        if future.done():
+            return
+        lines = response.split("\n")
+        # The monitor echoes the command lines
+        echo = [line.strip() for line in command.strip().split("\n")]
+        if [line.replace(ERROR_START, "").replace(ERROR_END, "").strip() for line in lines[:len(echo)]] == echo:
+            lines = lines[len(echo):]
+        body = "\n".join(lines)
+        error = "\n".join(part.strip() for part in ERROR_PATTERN.findall(body) if part.strip())
+        output = ERROR_PATTERN.sub("", body).replace(ERROR_END, "").strip("\n")
+        future.set_result((output, error))
+
+    def _send(self, commands):
+        """
+        Writes commands in one write and queues their futures.
+
+        Args:
+            commands (list): The command lines.
+
+        Returns:
+            list: One future per command, resolving to (output, error).
+
+        Raises:
+            MonitorDisconnectedError: If the monitor is not connected.
+        """
+        if not self.connected:
+            raise MonitorDisconnectedError(f"Not connected to the Renode monitor at {self.host}:{self.port}")
+        loop = asyncio.get_running_loop()
+        futures = []
+        for command in commands:
+            future = loop.create_future()
+            self._pending.append((command, future))
+            futures.append(future)
+        self._writer.write("".join(f"{command}\n" for command in commands).encode())
+        return futures
+
+    async def execute(self, command):
+        """
+        Executes a monitor command.
+
+        Args:
+            command (str): The command line.
+
+        Returns:
+            tuple: (output, error) strings.
+
+        Raises:
+            MonitorDisconnectedError: If the monitor is or gets disconnected.
+        """
+        async with self._write_lock:
+            future = self._send([command])[0]
+        return await future
+
+    async def execute_many(self, commands):
+        """
+        Executes several monitor commands back to back.
+
+        The commands are written at once, so no other command runs in between,
+        and their responses are awaited together.
+
+        Args:
+            commands (list): The command lines.
+
+        Returns:
+            list: One (output, error) tuple per command.
+
+        Raises:
+            MonitorDisconnectedError: If the monitor is or gets disconnected.
+        """
+        if not commands:
+            return []
+        async with self._write_lock:
+            futures = self._send(commands)
+        return list(await asyncio.gather(*futures))
+
+    async def execute_on(self, machine, commands):
+        """
+        Executes monitor commands on a machine, then restores the machine
+        selected before.
+
+        Once every earlier command has been answered, so that the prompt shows
+        the current machine, the machine is selected; the commands and the
+        command restoring the previous selection follow in one write. No other
+        command is written in between.
+
+        Args:
+            machine (str): The machine name.
+            commands (list): The command lines.
+
+        Returns:
+            list: One (output, error) tuple per command. If the machine cannot be
+                selected, the commands are not run and each reports that error.
+
+        Raises:
+            MonitorDisconnectedError: If the monitor is or gets disconnected.
+        """
+        if not commands:
+            return []
+        async with self._write_lock:
+            pending = [future for _, future in self._pending]
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            previous = self.context
+            if previous == machine:
+                futures = self._send(commands)
+                restore = None
+            else:
+                _, error = await self._send([f'mach set "{machine}"'])[0]
+                if error:
+                    return [("", error)] * len(commands)
+                restore = "mach clear" if previous in (None, MONITOR_CONTEXT) else f'mach set "{previous}"'
+                futures = self._send(commands + [restore])
+        responses = list(await asyncio.gather(*futures))
+        if restore is None:
+            return responses
+        if responses[-1][1]:
+            logger.warning(f"Failed to reselect {previous} after commands on {machine}: {responses[-1][1]}")
+        return responses[:-1]
+
+    async def wait_connected(self):
+        """
+        Waits until the monitor is connected.
+
+        Returns:
+            float: Seconds waited.
+        """
+        start = time.perf_counter()
+        await self._connected_event.wait()
+        return time.perf_counter() - start
+
+def _strip_ansi(text, red):
+    """
+    Removes ANSI escapes, marking the text written in red.
+
+    Args:
+        text (str): The text.
+        red (bool): Whether red was active at the start of the text.
+
+    Returns:
+        tuple: (text with red spans enclosed in ERROR_START/ERROR_END, red
+            active at the end).
+    """
+    parts = []
+    position = 0
+    for escape in ANSI_PATTERN.finditer(text):
+        parts.append(text[position:escape.start()])
+        position = escape.end()
+        if escape.group(2) != "m":
+            continue
+        codes = escape.group(1).split(";")
+        now_red = red
+        for code in codes:
+            if code in ("31", "91"):
+                now_red = True
+            elif code in ("", "0", "39") or code.startswith(("3", "9")) and len(code) == 2:
+                now_red = False
+        if now_red != red:
+            parts.append(ERROR_START if now_red else ERROR_END)
+            red = now_red
+    parts.append(text[position:])
+    return "".join(parts), red
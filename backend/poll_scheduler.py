@@ -0,0 +1,146 @@
+"""
+Poll Scheduler Module.
+
+This module decides which watches the polling loop reads on each cycle. Every
+watch has a target interval; watches whose value keeps not changing are backed
+off exponentially up to a ceiling, and each cycle reads at most a fixed budget
+of the most overdue watches, so bus traffic stays bounded as the watch list grows.
+"""
+
+import heapq
+
+class PollScheduler:
+    """
+    Deadline-ordered scheduler for polled watches.
+
+    Watches are identified by id. Deadlines live in a heap with lazy deletion:
+    an entry is only valid while it matches the watch's current deadline.
+    """
+
+    def __init__(self, max_interval=8.0, backoff=2.0, budget=512):
+        """
+        Initializes the PollScheduler.
+
+        Args:
+            max_interval (float, optional): Longest interval in seconds an unchanged
+                watch is backed off to. Defaults to 8.0.
+            backoff (float, optional): Factor applied to the interval each time a
+                read finds the value unchanged. Defaults to 2.0.
+            budget (int, optional): Maximum number of watches returned by one call
+                to `due`. Defaults to 512.
+        """
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.budget = budget
+        self._targets = {}
+        self._intervals = {}
+        self._deadlines = {}
+        self._heap = []
+
+    def __len__(self):
+        """
+        Returns the number of scheduled watches.
+
+        Returns:
+            int: The number of watches.
+        """
+        return len(self._targets)
+
+    def sync(self, watch_ids, intervals, now):
+        """
+        Makes the scheduled set match the given watches.
+
+        New watches are due immediately; removed watches are dropped; watches
+        whose target interval changed restart at the new target.
+
+        Args:
+            watch_ids (list): The ids of the watches to poll.
+            intervals (list): The target interval in seconds of each watch.
+            now (float): The current time.
+        """
+        wanted = dict(zip(watch_ids, intervals))
+        for watch_id in list(self._targets):
+            if watch_id not in wanted:
+                del self._targets[watch_id], self._intervals[watch_id], self._deadlines[watch_id]
+        for watch_id, target in wanted.items():
+            if self._targets.get(watch_id) != target:
+                self._targets[watch_id] = self._intervals[watch_id] = target
+                self._schedule(watch_id, now)
+        self._compact()
+
+    def due(self, now):
+        """
+        Returns the watches to read now, most overdue first, up to the budget.
+
+        The returned watches are provisionally rescheduled one interval ahead, so
+        a read that fails without a `report` is retried later.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            list: The watch ids to read.
+        """
+        heap, deadlines = self._heap, self._deadlines
+        result = []
+        while heap and heap[0][0] <= now and len(result) < self.budget:
+            deadline, watch_id = heapq.heappop(heap)
+            if deadlines.get(watch_id) != deadline:
+                continue # Stale entry
+            result.append(watch_id)
+            self._schedule(watch_id, now + self._intervals[watch_id])
+        self._compact()
+        return result
+
+    def report(self, watch_ids, changed, now):
+        """
+        Adjusts intervals after a read.
+
+        Changed watches return to their target interval; unchanged watches are
+        backed off by `backoff`, up to `max_interval`.
+
+        Args:
+            watch_ids (list): The watch ids that were read.
+            changed (set): The ids whose value changed.
+            now (float): The time of the read.
+        """
+        for watch_id in watch_ids:
+            if watch_id not in self._targets:
+                continue
+            if watch_id in changed:
+                interval = self._targets[watch_id]
+            else:
+                interval = min(self._intervals[watch_id] * self.backoff, max(self.max_interval, self._targets[watch_id]))
+            self._intervals[watch_id] = interval
+            self._schedule(watch_id, now + interval)
+
+    def next_deadline(self):
+        """
+        Returns the earliest pending deadline.
+
+        Returns:
+            float: The earliest deadline, or None if nothing is scheduled.
+        """
+        heap, deadlines = self._heap, self._deadlines
+        while heap and deadlines.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _compact(self):
+        """
+        Rebuilds the heap once stale entries dominate it.
+        """
+        if len(self._heap) > 4 * len(self._deadlines) + 64:
+            self._heap = [(deadline, watch_id) for watch_id, deadline in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def _schedule(self, watch_id, deadline):
+        """
+        Sets a watch's deadline, invalidating its previous heap entry.
+
+        Args:
+            watch_id (int): The watch id.
+            deadline (float): The new deadline.
+        """
+        self._deadlines[watch_id] = deadline
+        heapq.heappush(self._heap, (deadline, watch_id))
@@ -0,0 +1,144 @@
+"""
+Profiler Module.
+
+This module provides a sampling profiler covering every Python thread at once:
+the Qt/asyncio loop on the main thread as well as the bridge worker threads. A
+background thread periodically captures the stacks of all threads with
+`sys._current_frames` and counts identical stacks; a session is written as a
+collapsed-stack file (one `thread;outer;...;inner count` line per stack) that
+flame graph tools read directly. Nothing is installed while the profiler is not
+running, so it costs nothing when disabled.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Default time between two samples, in seconds.
+DEFAULT_PROFILE_INTERVAL = 0.005
+# Default directory receiving the profile files.
+DEFAULT_PROFILE_DIR = "profiles"
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads at a fixed interval.
+
+    Each session runs from `start` to `stop` and is written to its own file.
+    """
+
+    def __init__(self, interval=DEFAULT_PROFILE_INTERVAL, directory=DEFAULT_PROFILE_DIR):
+        """
+        Initializes the SamplingProfiler.
+
+        Args:
+            interval (float, optional): Seconds between two samples. Defaults to 0.005.
+            directory (str, optional): Directory receiving the profile files,
+                created when the first session is written.
+        """
+        self.interval = interval
+        self.directory = directory
+        self.samples = 0
+        self._stacks = {} # (thread name, code objects outermost first) -> count
+        self._labels = {} # code object -> frame label
+        self._thread = None
+        self._stop = threading.Event()
+        self._started = None
+
+    @property
+    def running(self):
+        """
+        Returns whether a session is in progress.
+
+        Returns:
+            bool: True while sampling.
+        """
+        return self._thread is not None
+
+    def start(self):
+        """
+        Starts a profiling session.
+
+        Raises:
+            RuntimeError: If a session is already running.
+        """
+        if self.running:
+            raise RuntimeError("The profiler is already running")
+        self.samples = 0
+        self._stacks = {}
+        self._stop.clear()
+        self._started = time.time()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"Profiling all threads every {self.interval * 1000:g} ms")
+
+    def stop(self):
+        """
+        Stops the current session and writes its profile.
+
+        Returns:
+            str: The path of the collapsed-stack file, or None if no session was running.
+        """
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        duration = time.time() - self._started
+        path = os.path.join(self.directory, time.strftime("profile-%Y%m%d-%H%M%S.collapsed", time.localtime(self._started)))
+        self.write(path)
+        logger.info(f"Profile written to {path} ({self.samples} samples over {duration:.1f}s)")
+        return path
+
+    def write(self, path):
+        """
+        Writes the stacks sampled so far as a collapsed-stack file.
+
+        Args:
+            path (str): The output file path.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            for (thread_name, codes), count in sorted(self._stacks.items(), key=lambda item: -item[1]):
+                frames = [thread_name] + [self._label(code) for code in codes]
+                f.write(f"{';'.join(frames)} {count}\n")
+
+    def _label(self, code):
+        """
+        Returns the label of a stack frame, e.g. "read_many (renode_wrapper.py:716)".
+
+        Args:
+            code (code): The frame's code object.
+
+        Returns:
+            str: The label, free of the ';' separator.
+        """
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        """
+        Sampling thread body.
+        """
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                key = (names.get(ident, f"thread-{ident}").replace(";", ":").replace(" ", "_"), tuple(codes))
+                self._stacks[key] = self._stacks.get(key, 0) + 1
+            self.samples += 1
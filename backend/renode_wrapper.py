@@ -3,16 +3,24 @@ Renode Wrapper Module.
 
 This module provides a synchronous wrapper around the pyrenode3 library, handling
 simulation lifecycle (start, pause, reset), script loading, and monitoring.
-It also includes a mock mode for development without a functional Renode installation.
+It also includes a mock mode for development without a functional Renode installation,
+and can drive a `SimulatedRenode` instead of Renode for load testing.
 """
 
 import time
 import logging
 import traceback
 import os
-import threading
 import tempfile
+import threading
 import shutil
+import functools
+
+from .command_executor import SharedLock
+from .log_tail import LogTailer
+from .response_cache import ResponseCache, is_idempotent
+from .snapshot_cache import script_fingerprint
+from .uart_stream import UartTerminalRegistry, uart_terminal_name
 
 # Automatically detect renode package if env var is not set
 if 'PYRENODE_PKG' not in os.environ:
@@ -24,18 +32,120 @@ if 'PYRENODE_PKG' not in os.environ:
         os.environ['PYRENODE_PKG'] = pkg_path
         # logging.info(f"Auto-detected PYRENODE_PKG at: {pkg_path}") # Logger not set up yet
 
-# Try to import pyrenode3
-try:
-    import pyrenode3
-    from pyrenode3.wrappers import Emulation, Monitor
-    PYRENODE_AVAILABLE = True
-except (ImportError, RuntimeError):
-    PYRENODE_AVAILABLE = False
+# pyrenode3 is imported on first use by `import_pyrenode`, since importing it
+# starts the .NET runtime and takes seconds. None until the import was attempted.
+PYRENODE_AVAILABLE = None
+# Bus watchpoint hooks are used for push-based watches when the Renode build exposes them
+WATCHPOINTS_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Watches closer together than this many bytes are fetched with a single range read.
+DEFAULT_MAX_GAP = 64
+# Upper bound for a single coalesced range read, in bytes.
+DEFAULT_MAX_SPAN = 4096
+# Push watches hit more often than this per second are demoted to polling.
+DEFAULT_MAX_PUSH_RATE = 1000
+
+def import_pyrenode():
+    """
+    Imports pyrenode3 and the Renode types used by the wrapper, once.
+
+    Returns:
+        dict: Seconds spent in each phase: 'import' (pyrenode3 and pythonnet) and
+            'clr' (loading the Renode assemblies). Empty if already imported.
+    """
+    global PYRENODE_AVAILABLE, WATCHPOINTS_AVAILABLE, Emulation, Monitor, Access, BusHookDelegate, SysbusAccessWidth
+    if PYRENODE_AVAILABLE is not None:
+        return {}
+    timings = {}
+    start = time.perf_counter()
+    try:
+        import pyrenode3
+        timings["import"] = time.perf_counter() - start
+        start = time.perf_counter()
+        from pyrenode3.wrappers import Emulation, Monitor
+        PYRENODE_AVAILABLE = True
+    except (ImportError, RuntimeError):
+        PYRENODE_AVAILABLE = False
+    if PYRENODE_AVAILABLE:
+        try:
+            from Antmicro.Renode.Peripherals.Bus import Access, BusHookDelegate, SysbusAccessWidth
+            WATCHPOINTS_AVAILABLE = True
+        except (ImportError, RuntimeError):
+            pass
+        timings["clr"] = time.perf_counter() - start
+    else:
+        timings["import"] = time.perf_counter() - start
+    return timings
+
+def coalesce_reads(requests, max_gap=DEFAULT_MAX_GAP, max_span=DEFAULT_MAX_SPAN):
+    """
+    Groups memory read requests into a small number of contiguous ranges.
+
+    Requests are sorted by address, and neighbouring requests are merged into
+    one range when the gap between them is at most `max_gap` bytes and the
+    resulting range does not exceed `max_span` bytes.
+
+    Args:
+        requests (list): A list of (address, width) tuples.
+        max_gap (int, optional): Largest gap in bytes bridged by a merged range.
+        max_span (int, optional): Largest size in bytes of a merged range.
+
+    Returns:
+        list: A list of (start, length, members) tuples, where `members` is a list
+            of (request_index, offset, width) tuples locating each request inside
+            the range.
+    """
+    order = sorted(range(len(requests)), key=lambda i: requests[i][0])
+    ranges = []
+    start = end = None
+    members = []
+    for i in order:
+        addr, width = requests[i]
+        if start is not None and addr - end <= max_gap and max(end, addr + width) - start <= max_span:
+            members.append((i, addr - start, width))
+            end = max(end, addr + width)
+            continue
+        if start is not None:
+            ranges.append((start, end - start, members))
+        start, end = addr, addr + width
+        members = [(i, 0, width)]
+    if start is not None:
+        ranges.append((start, end - start, members))
+    return ranges
+
+def _exclusive(method):
+    """
+    Decorates a wrapper method that replaces or tears down emulation objects, so
+    that it runs with `emulation_lock` held exclusively.
+
+    Args:
+        method (callable): The method.
+
+    Returns:
+        callable: The locked method.
+    """
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.emulation_lock.exclusive():
+            return method(self, *args, **kwargs)
+    return locked
+
+def _path_token(path):
+    """
+    Formats a file path as a monitor path argument.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        str: The path prefixed with '@', quoted if it contains spaces.
+    """
+    return f'@"{path}"' if " " in path else f"@{path}"
+
 class RenodeWrapper:
     """
     Wraps the pyrenode3 functionality to control Renode emulation.
@@ -45,79 +155,228 @@ class RenodeWrapper:
     the simulation state (start, pause, reset).
     """
 
-    def __init__(self, sys_bus_params=None):
+    def __init__(self, sys_bus_params=None, byteorder="little", simulator=None, snapshot_cache=None, connect=True):
         """
         Initializes the RenodeWrapper.
 
         Args:
             sys_bus_params (str, optional): Comma-separated key=value pairs for
                 SystemBus parameters. Defaults to None.
+            byteorder (str, optional): Byte order used to assemble multi-byte values
+                from raw memory reads ("little" or "big"). Defaults to "little".
+            simulator (SimulatedRenode, optional): A synthetic backend used instead of
+                Renode. Defaults to None.
+            snapshot_cache (SnapshotCache, optional): Where to keep the snapshots taken
+                after loading a script, used for fast resets. Defaults to None, which
+                makes resets fall back to `Clear`.
+            connect (bool, optional): Whether to start the backend right away. When
+                False, `connect` must be called (e.g. on a worker thread) before use.
+                Defaults to True.
         """
-        self.running = False
+        self.running = False # Whether any machine is running
+        self._running_machines = set()
+        self.byteorder = byteorder
+        self.sys_bus_params = sys_bus_params
         self.emulation = None
         self.monitor = None
-        if PYRENODE_AVAILABLE:
-            if sys_bus_params:
-                self.emulation = Emulation(sysBusParams=sys_bus_params)
+        self.simulator = simulator
+        self.real = False
+        self.connected = False
+        # Held shared by memory reads, which may run on several threads (one per
+        # machine), and exclusively while the emulation is created, replaced or
+        # changed by a user command
+        self.emulation_lock = SharedLock()
+
+        self.log_file_path = None
+        self.log_tailer = None
+        self.log_callback = None
+        self.response_cache = ResponseCache()
+
+        # Snapshot of the emulation right after the current script was loaded
+        self.snapshot_cache = snapshot_cache
+        self.snapshot_path = None
+        self._snapshot_salt = f"{'simulated' if simulator is not None else 'renode'}:{sys_bus_params or ''}"
+
+        # Push-based watches: (machine, address) -> (width, hook, stats); events are buffered
+        # here by the emulation thread until the listener drains them.
+        self.max_push_rate = DEFAULT_MAX_PUSH_RATE
+        self._watchpoints = {}
+        self._demoted = set()
+        self._watch_events = []
+        self._watch_lock = threading.Lock()
+        self._watch_listener = None
+        self.uart_terminals = UartTerminalRegistry()
+
+        if connect:
+            self.connect()
+
+    @_exclusive
+    def connect(self):
+        """
+        Starts the backend: imports pyrenode3 and creates the `Emulation` and
+        `Monitor`, or attaches the simulator.
+
+        Returns:
+            dict: Seconds spent in each startup phase ('import', 'clr', 'emulation').
+        """
+        if self.connected:
+            return {}
+        timings = import_pyrenode() if self.simulator is None else {}
+        self.real = PYRENODE_AVAILABLE and self.simulator is None
+        start = time.perf_counter()
+        if self.real:
+            if self.sys_bus_params:
+                self.emulation = Emulation(sysBusParams=self.sys_bus_params)
             else:
                 self.emulation = Emulation()
             self.monitor = Monitor()
+            timings["emulation"] = time.perf_counter() - start
             logger.info("RenodeWrapper initialized (Real)")
+        elif self.simulator is not None:
+            # The simulator answers monitor commands like Monitor.execute
+            self.monitor = self.simulator
+            logger.info("RenodeWrapper initialized (Simulated)")
         else:
             logger.warning("pyrenode3 not found. Falling back to Mock mode.")
             logger.info("RenodeWrapper initialized (Mock)")
-
-        self.log_file_path = None
-        self.log_thread = None
-        self.stop_logging_event = None
-        self.log_callback = None
+        self.connected = True
+        return timings
 
     def _execute_and_log(self, command: str):
         """
         Executes a monitor command and logs the output/error via the callback.
 
+        Idempotent queries are answered from `response_cache` when possible;
+        any other command invalidates it.
+
         Args:
             command (str): The Renode monitor command to execute.
 
         Returns:
             tuple: A tuple containing (output, error). Both are strings.
-                Returns ("", "") if PYRENODE_AVAILABLE is False.
+                Returns ("", "") in Mock mode.
         """
-        if not PYRENODE_AVAILABLE:
+        if self.monitor is None:
             return "", ""
         
+        lines = []
         try:
-            # Echo command
-            if self.log_callback:
-                self.log_callback(f"(monitor) {command}")
-            
-            output, error = self.monitor.execute(command)
-            
-            if output and self.log_callback:
-                self.log_callback(output.strip())
-            
-            if error and self.log_callback:
-                self.log_callback(f"Error: {error.strip()}")
-                
-            return output, error
+            return self._execute_collecting(command, lines)
+        finally:
+            if lines and self.log_callback:
+                self.log_callback(lines)
+
+    def _execute_collecting(self, command, lines):
+        """
+        Executes a monitor command, collecting the echo, output and error lines
+        for the log instead of sending them right away.
+
+        Args:
+            command (str): The Renode monitor command to execute.
+            lines (list): Receives the log lines.
+
+        Returns:
+            tuple: A tuple containing (output, error). Both are strings.
+        """
+        # Echo command
+        lines.append(f"(monitor) {command}")
+        try:
+            if is_idempotent(command):
+                cached = self.response_cache.get(command)
+                if cached is not None:
+                    output, error = cached
+                else:
+                    output, error = self.monitor.execute(command)
+                    if not error:
+                        self.response_cache.put(command, (output, error))
+            else:
+                # Anything else may change the emulation state
+                self.response_cache.invalidate()
+                output, error = self.monitor.execute(command)
         except Exception as e:
-            if self.log_callback:
-                self.log_callback(f"Exception executing '{command}': {e}")
+            lines.append(f"Exception executing '{command}': {e}")
             raise e
 
-    def setup_logging(self, callback):
+        if output:
+            lines.append(output.strip())
+        if error:
+            lines.append(f"Error: {error.strip()}")
+        return output, error
+
+    def execute_batch(self, commands, stop_on_error=False) -> list:
+        """
+        Executes several monitor commands in one call.
+
+        The commands run back to back on the calling thread and their echo and
+        output reach the log callback as a single batch, so a pasted sequence
+        costs one worker hop and one log delivery instead of one per command.
+
+        Args:
+            commands (list): The monitor commands, in order.
+            stop_on_error (bool, optional): Skip the remaining commands after a
+                command fails. Defaults to False.
+
+        Returns:
+            list: One (output, error) tuple per command; None for skipped commands.
+                Exceptions are reported as the command's error.
+        """
+        if self.monitor is None:
+            return [("", "")] * len(commands)
+        results = []
+        lines = []
+        failed = False
+        try:
+            with self._command_lock(commands):
+                for command in commands:
+                    if failed and stop_on_error:
+                        results.append(None)
+                        continue
+                    try:
+                        output, error = self._execute_collecting(command, lines)
+                    except Exception as e:
+                        output, error = "", str(e)
+                    results.append((output, error))
+                    failed = failed or bool(error)
+        finally:
+            if lines and self.log_callback:
+                self.log_callback(lines)
+        return results
+
+    def _command_lock(self, commands):
+        """
+        Returns how `emulation_lock` is held while user commands run.
+
+        Idempotent queries only read, like the pollers, and hold it shared. Any
+        other command (`Clear`, `mach set`, `i @script`, ...) may replace or
+        reconfigure emulation objects the pollers are reading, so it holds the
+        lock exclusively, as `load_script` and `reset` do.
+
+        Args:
+            commands (list): The monitor commands about to run.
+
+        Returns:
+            contextmanager: The lock context.
+        """
+        if all(is_idempotent(command) for command in commands):
+            return self.emulation_lock.shared()
+        return self.emulation_lock.exclusive()
+
+    def setup_logging(self, callback, max_batch=1000, flush_interval=0.02):
         """
         Sets up Renode logging to a temporary file and tails it.
 
         This method configures Renode to log to a temporary file, then starts
-        a background thread to read from that file and invoke the provided callback
-        for each new line.
+        a `LogTailer` that wakes up when the file is written and invokes the
+        provided callback with batches of new lines.
 
         Args:
-            callback (callable): A function that accepts a single string argument (the log line).
+            callback (callable): A function that accepts a list of log lines.
+            max_batch (int, optional): Maximum number of lines per callback. Defaults to 1000.
+            flush_interval (float, optional): Minimum time in seconds between two
+                partial batches. Defaults to 0.02.
         """
         self.log_callback = callback
-        if not PYRENODE_AVAILABLE:
+        if self.monitor is None:
             logger.warning("Logging not available in Mock mode")
             return
 
@@ -132,54 +391,28 @@ class RenodeWrapper:
 
         # Tell Renode to log to this file
         try:
-            self.monitor.execute(f"logFile @{self.log_file_path}")
-            self.monitor.execute("logLevel 0") # Capture everything
+            if self.simulator is not None:
+                self.simulator.attach_log_file(self.log_file_path)
+            else:
+                self.monitor.execute(f"logFile @{self.log_file_path}")
+                self.monitor.execute("logLevel 0") # Capture everything
         except Exception as e:
             logger.error(f"Failed to setup logFile: {e}")
             return
 
         # Start tailing thread
-        self.stop_logging_event = threading.Event()
-        self.log_thread = threading.Thread(
-            target=self._tail_log_file, 
-            args=(self.log_file_path, callback, self.stop_logging_event),
-            daemon=True
-        )
-        self.log_thread.start()
-
-    def _tail_log_file(self, path, callback, stop_event):
-        """
-        Tails a log file and calls the callback for new lines.
-
-        Args:
-            path (str): The path to the log file.
-            callback (callable): The function to call with new log lines.
-            stop_event (threading.Event): Event to signal the thread to stop.
-        """
-        logger.info("Log tailing started")
-        try:
-            with open(path, "r") as f:
-                # Go to end? No, we want to see startup logs if any.
-                # But if we just created it, it's empty.
-                while not stop_event.is_set():
-                    line = f.readline()
-                    if line:
-                        callback(line.strip())
-                    else:
-                        time.sleep(0.1)
-        except Exception as e:
-            logger.error(f"Log tailing error: {e}")
-        finally:
-            logger.info("Log tailing stopped")
+        self.log_tailer = LogTailer(self.log_file_path, callback, max_batch=max_batch, flush_interval=flush_interval)
+        self.log_tailer.start()
 
+    @_exclusive
     def cleanup(self):
         """
         Cleans up resources, stopping the log tailing thread and removing temp files.
         """
-        if self.stop_logging_event:
-            self.stop_logging_event.set()
-        if self.log_thread:
-            self.log_thread.join(timeout=1.0)
+        if self.simulator is not None and self.simulator.running:
+            self.simulator.pause()
+        if self.log_tailer:
+            self.log_tailer.stop(timeout=1.0)
         
         if self.log_file_path and os.path.exists(self.log_file_path):
             try:
@@ -188,6 +421,7 @@ class RenodeWrapper:
                 pass
 
 
+    @_exclusive
     def load_script(self, path: str):
         """
         Loads and executes a Renode script (.resc).
@@ -199,51 +433,110 @@ class RenodeWrapper:
             Exception: If an error occurs during script execution or loading.
         """
         logger.info(f"Loading script: {path}")
-        if PYRENODE_AVAILABLE:
+        self.response_cache.invalidate()
+        self.snapshot_path = None
+        self.uart_terminals.clear()
+        if self.real:
             try:
                 self.emulation.clear()
+                self._watchpoints.clear() # Hooks die with the old emulation
+                self._demoted.clear()
                 
                 # Use execute_script to properly capture errors
                 if self.log_callback:
-                    self.log_callback(f"(monitor) i @{path}")
+                    self.log_callback([f"(monitor) i @{path}"])
                 
                 output, error = self.monitor.execute_script(path)
                 
                 if output and self.log_callback:
-                    self.log_callback(output.strip())
+                    self.log_callback([output.strip()])
                 
                 if error:
                     if self.log_callback:
-                        self.log_callback(f"Error: {error.strip()}")
+                        self.log_callback([f"Error: {error.strip()}"])
                     raise Exception(f"Renode Error: {error}")
                     
                 logger.info("Script loaded successfully")
+                self._sync_running()
+                self._take_snapshot(path)
             except Exception as e:
                 logger.error("Failed to load script. Exception type: %s", type(e))
                 logger.error("Exception details: %s", e)
                 logger.error("Traceback: %s", traceback.format_exc())
                 raise e
+        elif self.simulator is not None:
+            self.simulator.load_script(path)
+            logger.info("Script loaded successfully")
+            self._sync_running()
+            self._take_snapshot(path)
         else:
             time.sleep(0.5) # Simulate work
             if not path:
                 raise ValueError("Invalid path")
             logger.info("Script loaded successfully")
 
-    def start(self):
+    def _take_snapshot(self, path):
+        """
+        Saves the freshly loaded emulation so that `reset` can restore it.
+
+        Snapshots are looked up by a fingerprint of the script and the files it
+        references, so reloading an unchanged script reuses the cached one.
+        No snapshot is taken if the script left the emulation running (e.g. it
+        ends with `start`), since restoring it would not give the loaded state.
+        Failures only disable fast resets.
+
+        Args:
+            path (str): The file path to the Renode script just loaded.
+        """
+        self.snapshot_path = None
+        if self.snapshot_cache is None:
+            return
+        if self.running:
+            logger.warning("Emulation is running after loading the script, no snapshot taken; "
+                           "reset will clear the emulation")
+            return
+        try:
+            key = script_fingerprint(path, salt=self._snapshot_salt)
+            snapshot = self.snapshot_cache.lookup(key)
+            if snapshot is None:
+                start = time.monotonic()
+                partial = self.snapshot_cache.partial_path_for(key)
+                try:
+                    output, error = self._execute_and_log(f"Save {_path_token(partial)}")
+                    if error:
+                        raise Exception(f"Renode Error: {error}")
+                    snapshot = self.snapshot_cache.commit(key)
+                except Exception:
+                    self.snapshot_cache.discard(key)
+                    raise
+                logger.info(f"Saved snapshot in {time.monotonic() - start:.2f}s: {snapshot}")
+            self.snapshot_path = snapshot
+        except Exception as e:
+            logger.warning(f"Snapshot unavailable, reset will clear the emulation: {e}")
+
+    def start(self, machine=None):
         """
         Starts the simulation.
 
+        Args:
+            machine (str, optional): Start only this machine. Defaults to None,
+                which starts all machines.
+
         Raises:
             Exception: If the simulation fails to start.
         """
+        if machine is not None:
+            self._control_machine("start", machine)
+            self._set_machine_running(machine, True)
+            return
         logger.info("Starting simulation...")
-        if PYRENODE_AVAILABLE:
+        if self.monitor is not None:
             try:
                 # self.emulation.StartAll()
                 output, error = self._execute_and_log("start")
                 if error:
                      raise Exception(f"Renode Error: {error}")
-                self.running = True
+                self._set_all_running(True)
                 logger.info("Simulation started")
             except Exception as e:
                 logger.error("Failed to start simulation. Exception type: %s", type(e))
@@ -252,80 +545,634 @@ class RenodeWrapper:
                 raise e
         else:
             time.sleep(0.2)
-            self.running = True
+            self._set_all_running(True)
             logger.info("Simulation started")
 
-    def pause(self):
+    def pause(self, machine=None):
         """
         Pauses the simulation.
 
+        Args:
+            machine (str, optional): Pause only this machine. Defaults to None,
+                which pauses all machines.
+
         Raises:
             Exception: If the simulation fails to pause.
         """
+        if machine is not None:
+            self._control_machine("pause", machine)
+            self._set_machine_running(machine, False)
+            return
         logger.info("Pausing simulation...")
-        if PYRENODE_AVAILABLE:
+        if self.monitor is not None:
             try:
                 # self.emulation.PauseAll()
                 output, error = self._execute_and_log("pause")
                 if error:
                      raise Exception(f"Renode Error: {error}")
-                self.running = False
+                self._set_all_running(False)
                 logger.info("Simulation paused")
             except Exception as e:
                 logger.error(f"Failed to pause simulation: {e}")
                 raise e
         else:
             time.sleep(0.1)
-            self.running = False
+            self._set_all_running(False)
             logger.info("Simulation paused")
 
-    def reset(self):
+    @_exclusive
+    def reset(self, machine=None):
         """
-        Resets the simulation, clearing the emulation state.
+        Resets the simulation.
+
+        When a snapshot of the loaded script exists, the emulation is restored to
+        the state right after loading, ready to start again. Otherwise the
+        emulation state is cleared. Either way, the running state is read back
+        from the emulation afterwards.
+
+        Args:
+            machine (str, optional): Reset only this machine to its initial state
+                instead. Defaults to None.
 
         Raises:
             Exception: If the simulation fails to reset.
         """
+        if machine is not None:
+            self._control_machine("reset", machine)
+            self._set_machine_running(machine, False)
+            return
         logger.info("Resetting simulation...")
-        if PYRENODE_AVAILABLE:
+        self.response_cache.invalidate()
+        self.uart_terminals.clear()
+        if self.monitor is not None:
             try:
-                # self.emulation.clear()
-                output, error = self._execute_and_log("Clear")
-                if error:
-                     raise Exception(f"Renode Error: {error}")
-                self.running = False
+                restored = False
+                if self.snapshot_path is not None and os.path.exists(self.snapshot_path):
+                    start = time.monotonic()
+                    output, error = self._execute_and_log(f"Load {_path_token(self.snapshot_path)}")
+                    restored = not error
+                    if restored:
+                        logger.info(f"Restored snapshot in {time.monotonic() - start:.2f}s")
+                    else:
+                        logger.warning(f"Failed to restore snapshot, clearing instead: {error}")
+                        self.snapshot_path = None
+                if not restored:
+                    # self.emulation.clear()
+                    output, error = self._execute_and_log("Clear")
+                    if error:
+                         raise Exception(f"Renode Error: {error}")
+                self._watchpoints.clear()
+                self._demoted.clear()
+                self._sync_running()
                 logger.info("Simulation reset")
             except Exception as e:
                 logger.error(f"Failed to reset simulation: {e}")
                 raise e
         else:
             time.sleep(0.5)
-            self.running = False
+            self._set_all_running(False)
             logger.info("Simulation reset")
 
-    def read_memory(self, addr: int, width: int) -> int:
+    def _sync_running(self):
+        """
+        Records which machines run, as reported by the emulation itself, e.g.
+        after a script or snapshot that may have started machines was loaded.
+        """
+        if self.real:
+            self._running_machines = {self._machine_name(machine) for machine in self.emulation.Machines
+                                      if not machine.IsPaused}
+        elif self.simulator is not None:
+            self._running_machines = {name for name, machine in self.simulator.machines.items() if machine.running}
+        else:
+            self._running_machines = set()
+        self.running = bool(self._running_machines)
+
+    def _set_all_running(self, running):
+        """
+        Records that the whole emulation was started or stopped.
+
+        Args:
+            running (bool): Whether all machines now run.
+        """
+        self._running_machines = set(self.list_machines()) if running else set()
+        self.running = running
+
+    def _set_machine_running(self, machine, running):
+        """
+        Records that a single machine was started or stopped.
+
+        Args:
+            machine (str): The machine name.
+            running (bool): Whether the machine now runs.
+        """
+        if running:
+            self._running_machines.add(machine)
+        else:
+            self._running_machines.discard(machine)
+        self.running = bool(self._running_machines)
+
+    def _control_machine(self, action, machine):
+        """
+        Starts, pauses or resets a single machine.
+
+        Args:
+            action (str): "start", "pause" or "reset".
+            machine (str): The machine name.
+
+        Raises:
+            Exception: If the machine does not exist or the action fails.
+        """
+        logger.info(f"Machine {machine}: {action}")
+        self.response_cache.invalidate()
+        if self.monitor is None:
+            time.sleep(0.1)
+            return
+        target = self._get_machine(machine)
+        if self.real:
+            getattr(target, {"start": "Start", "pause": "Pause", "reset": "Reset"}[action])()
+        else:
+            getattr(target, action)()
+
+    def run_for(self, seconds):
+        """
+        Runs the emulation for an amount of virtual time, then pauses it.
+
+        Blocks until the virtual time has elapsed (`emulation RunFor`).
+
+        Args:
+            seconds (float): The virtual time to run for.
+
+        Raises:
+            Exception: If Renode reports an error.
+        """
+        if self.monitor is None:
+            time.sleep(seconds) # Mock: no virtual time, keep the pacing
+            return
+        minutes, rest = divmod(seconds, 60)
+        hours, minutes = divmod(int(minutes), 60)
+        output, error = self._execute_and_log(f'emulation RunFor "{hours:02d}:{minutes:02d}:{rest:09.6f}"')
+        if error:
+            raise Exception(f"Renode Error: {error}")
+
+    def virtual_time(self, machine=None):
+        """
+        Returns the virtual time elapsed in the emulation.
+
+        Args:
+            machine (str, optional): The machine. Defaults to the first machine.
+
+        Returns:
+            float: The virtual time in seconds, or None if it is not available.
+        """
+        if self.real:
+            try:
+                return self._get_machine(machine).ElapsedVirtualTime.TimeElapsed.TotalSeconds
+            except Exception as e:
+                logger.debug(f"Virtual time unavailable: {e}")
+            return None
+        if self.simulator is not None:
+            return self._get_machine(machine).virtual_time()
+        return None
+
+    def list_machines(self) -> list:
+        """
+        Returns the names of the machines in the emulation.
+
+        Returns:
+            list: The machine names, in creation order; empty in Mock mode.
+        """
+        if self.real:
+            return [self._machine_name(machine) for machine in self.emulation.Machines]
+        if self.simulator is not None:
+            return list(self.simulator.machines)
+        return []
+
+    def _machine_name(self, machine):
+        """
+        Returns the name of a CLR machine object.
+
+        Args:
+            machine (object): The machine.
+
+        Returns:
+            str: The machine name.
+        """
+        found, name = self.emulation.TryGetMachineName(machine, None)
+        return name if found else str(machine)
+
+    def _get_machine(self, machine=None):
+        """
+        Returns a machine of the emulation.
+
+        Args:
+            machine (str, optional): The machine name. Defaults to None, which
+                selects the first machine.
+
+        Returns:
+            object: The CLR machine object, or the simulated machine.
+
+        Raises:
+            RuntimeError: If there is no such machine.
+        """
+        if self.simulator is not None:
+            machines = self.simulator.machines
+            if machine is None:
+                return next(iter(machines.values()))
+            if machine in machines:
+                return machines[machine]
+        else:
+            for candidate in self.emulation.Machines:
+                if machine is None or self._machine_name(candidate) == machine:
+                    return candidate
+        raise RuntimeError(f"No machine {'available' if machine is None else machine} in the emulation")
+
+    def _get_sysbus(self, machine=None):
+        """
+        Returns the system bus of a machine in the emulation.
+
+        Args:
+            machine (str, optional): The machine name. Defaults to the first machine.
+
+        Returns:
+            object: The CLR system bus object.
+
+        Raises:
+            RuntimeError: If there is no such machine.
+        """
+        return self._get_machine(machine).SystemBus
+
+    def read_bytes(self, addr: int, count: int, machine=None) -> bytes:
+        """
+        Reads a contiguous range of bytes from memory.
+
+        Args:
+            addr (int): The start address of the range.
+            count (int): The number of bytes to read.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            bytes: The raw memory contents.
+        """
+        if self.real:
+            return bytes(self._get_sysbus(machine).ReadBytes(addr, count))
+        elif self.simulator is not None:
+            return self._get_machine(machine).read_bytes(addr, count)
+        else:
+            time.sleep(0.01) # fast read
+            # Repeat the mock value so that aligned words read back as 0xDEADBEEF
+            pattern = (0xDEADBEEF).to_bytes(4, self.byteorder)
+            return bytes(pattern[(addr + i) % 4] for i in range(count))
+
+    def read_memory(self, addr: int, width: int, machine=None) -> int:
         """
         Reads a value from memory at the specified address.
 
         Args:
             addr (int): The memory address to read from.
             width (int): The width of the data to read (e.g., 4 for 32-bit).
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
 
         Returns:
             int: The value read from memory.
         """
-        if PYRENODE_AVAILABLE:
-            # TODO: Implement real memory read using pyrenode3
-            # For now, we'll just log and return a dummy value to avoid crashing
-            # if we don't know the exact API.
-            # Ideally: return Monitor.execute(f"sysbus ReadDoubleWord {addr}") (parsed)
-            return 0xDEADBEEF
+        if self.real or self.simulator is not None:
+            return int.from_bytes(self.read_bytes(addr, width, machine), self.byteorder)
         else:
             # Simulate memory read
             # logger.debug(f"Reading memory at {hex(addr)}") # Commented out to avoid spam
             time.sleep(0.01) # fast read
             return 0xDEADBEEF # Mock value
 
+    def read_many(self, requests, max_gap=DEFAULT_MAX_GAP, max_span=DEFAULT_MAX_SPAN, machine=None) -> list:
+        """
+        Reads many values in as few bus accesses as possible.
+
+        Nearby addresses are coalesced into contiguous range reads (see
+        `coalesce_reads`) and each value is sliced back out of its range. If a
+        range cannot be read as a whole (e.g. it spans unmapped memory), its
+        members are read individually instead.
+
+        Safe to call from several threads at once, e.g. one per machine.
+
+        Args:
+            requests (list): A list of (address, width) tuples.
+            max_gap (int, optional): Largest gap in bytes bridged by a merged range.
+            max_span (int, optional): Largest size in bytes of a merged range.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The values in the same order as `requests`. Entries that could
+                not be read are None.
+        """
+        with self.emulation_lock.shared():
+            return self._read_many(requests, max_gap, max_span, machine)
+
+    def _read_many(self, requests, max_gap, max_span, machine):
+        """
+        Implements `read_many` without taking the emulation lock.
+
+        Args:
+            requests (list): A list of (address, width) tuples.
+            max_gap (int): Largest gap in bytes bridged by a merged range.
+            max_span (int): Largest size in bytes of a merged range.
+            machine (str): The machine to read from, or None for the first one.
+
+        Returns:
+            list: The values in the same order as `requests`, None where unreadable.
+        """
+        values = [None] * len(requests)
+        for start, length, members in coalesce_reads(requests, max_gap, max_span):
+            try:
+                data = self.read_bytes(start, length, machine)
+            except Exception as e:
+                if len(members) == 1:
+                    logger.error(f"Error reading memory at {hex(start)}: {e}")
+                    continue
+                data = None
+            for index, offset, width in members:
+                if data is not None:
+                    values[index] = int.from_bytes(data[offset:offset + width], self.byteorder)
+                    continue
+                try:
+                    values[index] = self.read_memory(start + offset, width, machine)
+                except Exception as e:
+                    logger.error(f"Error reading memory at {hex(start + offset)}: {e}")
+        return values
+
+    def read_pages(self, addresses, page_size, machine=None) -> list:
+        """
+        Reads whole memory pages, e.g. for a memory viewer.
+
+        Safe to call from several threads at once, like `read_many`.
+
+        Args:
+            addresses (list): The start addresses of the pages.
+            page_size (int): The page size in bytes.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The page contents as bytes, in the same order as `addresses`,
+                None for pages that cannot be read (e.g. unmapped).
+        """
+        pages = []
+        with self.emulation_lock.shared():
+            for addr in addresses:
+                try:
+                    pages.append(self.read_bytes(addr, page_size, machine))
+                except Exception as e:
+                    logger.debug(f"Cannot read page at {hex(addr)}: {e}")
+                    pages.append(None)
+        return pages
+
+    def set_watch_listener(self, listener):
+        """
+        Registers a function notified when push-based watch events are pending.
+
+        The listener is called without arguments from the emulation thread, once
+        each time the event buffer goes from empty to non-empty. It should arrange
+        for `drain_watch_events` to be called.
+
+        Args:
+            listener (callable): The notification function, or None.
+        """
+        self._watch_listener = listener
+
+    def drain_watch_events(self) -> list:
+        """
+        Returns and clears all buffered push-based watch events.
+
+        Returns:
+            list: A list of (address, value, virtual_time, machine) tuples. `value`
+                is None when the access did not cover the whole watch and the watch
+                must be re-read; `virtual_time` is in seconds, or None if unknown;
+                `machine` is the machine name as given to `sync_watchpoints`.
+        """
+        with self._watch_lock:
+            events, self._watch_events = self._watch_events, []
+        return events
+
+    def sync_watchpoints(self, requests) -> list:
+        """
+        Makes the registered watchpoint hooks match the given push-based watches.
+
+        Hooks are added for new addresses and removed for addresses no longer
+        requested. Watches whose hooks cannot be registered, or which were demoted
+        for firing more than `max_push_rate` times per second, report False and
+        should be polled instead. One hook serves each (machine, address); a
+        watch on an already hooked address with a different width reports
+        False too, since the hook only masks values to its own width.
+
+        Args:
+            requests (list): A list of (address, width, machine) tuples, where
+                `machine` is a machine name or None for the first machine.
+
+        Returns:
+            list: One bool per request, True where the watch is push-driven.
+        """
+        wanted = {}
+        for addr, width, machine in requests:
+            wanted.setdefault((machine, addr), width)
+        for key, (width, hook, stats) in list(self._watchpoints.items()):
+            if wanted.get(key) != width or stats["demoted"]:
+                self._remove_watchpoint(key)
+        active = {}
+        for key, width in wanted.items():
+            if key in self._watchpoints:
+                active[key] = True
+            elif key in self._demoted:
+                active[key] = False
+            else:
+                active[key] = self._add_watchpoint(key, width)
+        return [active[(machine, addr)] and wanted[(machine, addr)] == width
+                for addr, width, machine in requests]
+
+    def _add_watchpoint(self, key, width):
+        """
+        Registers a write watchpoint hook pushing value changes at an address.
+
+        Args:
+            key (tuple): The (machine, address) of the watch.
+            width (int): The watch width in bytes.
+
+        Returns:
+            bool: True if the hook was registered.
+        """
+        if not (self.real and WATCHPOINTS_AVAILABLE) or width not in (1, 2, 4, 8):
+            return False
+        access_width = {1: SysbusAccessWidth.Byte, 2: SysbusAccessWidth.Word,
+                        4: SysbusAccessWidth.DoubleWord, 8: SysbusAccessWidth.QuadWord}[width]
+        stats = {"window": time.monotonic(), "hits": 0, "demoted": False}
+        name, addr = key
+        try:
+            machine = self._get_machine(name)
+        except RuntimeError:
+            return False
+
+        def on_write(cpu, address, hit_width, value):
+            now = time.monotonic()
+            if now - stats["window"] >= 1.0:
+                stats["window"], stats["hits"] = now, 0
+            stats["hits"] += 1
+            if stats["demoted"] or stats["hits"] > self.max_push_rate:
+                stats["demoted"] = True
+                return
+            try:
+                vtime = machine.ElapsedVirtualTime.TimeElapsed.TotalSeconds
+            except Exception:
+                vtime = None
+            full = hit_width == access_width
+            self._push_watch_event(addr, int(value) & ((1 << (8 * width)) - 1) if full else None, vtime, name)
+
+        hook = BusHookDelegate(on_write)
+        try:
+            machine.SystemBus.AddWatchpointHook(addr, access_width, Access.Write, hook)
+        except Exception as e:
+            logger.warning(f"Cannot watch {hex(addr)} with a watchpoint, polling instead: {e}")
+            return False
+        self._watchpoints[key] = (width, hook, stats)
+        return True
+
+    def _remove_watchpoint(self, key):
+        """
+        Removes the watchpoint hook registered for an address.
+
+        Demoted watchpoints are remembered so they are not registered again.
+
+        Args:
+            key (tuple): The (machine, address) of the watch.
+        """
+        width, hook, stats = self._watchpoints.pop(key)
+        machine, addr = key
+        if stats["demoted"]:
+            logger.info(f"Watch at {hex(addr)} changes too often for push updates, polling instead")
+            self._demoted.add(key)
+        try:
+            self._get_sysbus(machine).RemoveWatchpointHook(addr, hook)
+        except Exception as e:
+            logger.warning(f"Failed to remove watchpoint at {hex(addr)}: {e}")
+
+    def _push_watch_event(self, addr, value, vtime, machine=None):
+        """
+        Buffers a watch event and notifies the listener if the buffer was empty.
+
+        Args:
+            addr (int): The watched address.
+            value (int): The new value, or None if it must be re-read.
+            vtime (float): The virtual time of the access in seconds, or None.
+            machine (str, optional): The machine of the watch.
+        """
+        with self._watch_lock:
+            notify = not self._watch_events
+            self._watch_events.append((addr, value, vtime, machine))
+        if notify and self._watch_listener:
+            self._watch_listener()
+
+    def _selected_machine(self):
+        """
+        Returns the machine selected in the monitor, e.g. by the user's `mach set`.
+
+        Returns:
+            tuple: (known, name): whether the selection could be read, and the
+                machine name, or None if no machine is selected.
+        """
+        try:
+            if self.real:
+                machine = self.monitor.internal.Machine
+                return True, self._machine_name(machine) if machine is not None else None
+            if self.simulator is not None and hasattr(self.simulator, "current"):
+                return True, self.simulator.current.name
+        except Exception as e:
+            logger.debug(f"Cannot read the machine selected in the monitor: {e}")
+        return False, None
+
+    def _execute_on_machine(self, machine, commands):
+        """
+        Executes monitor commands on a machine, stopping at the first error, and
+        selects the previously selected machine again afterwards.
+
+        The commands run on the calling (worker) thread, so no user command runs
+        while the other machine is selected.
+
+        Args:
+            machine (str): The machine name, or None for the machine currently
+                selected in the monitor.
+            commands (list): The monitor commands, in order.
+
+        Returns:
+            list: One (output, error) tuple per command, including the machine
+                selection; None for skipped commands.
+        """
+        if machine is None:
+            return self.execute_batch(commands, stop_on_error=True)
+        known, previous = self._selected_machine()
+        results = self.execute_batch([f'mach set "{machine}"'] + commands, stop_on_error=True)
+        if known and previous != machine:
+            restore = f'mach set "{previous}"' if previous is not None else "mach clear"
+            _, error = self.execute_batch([restore])[0]
+            if error:
+                logger.warning(f"Failed to select {previous} again: {error}")
+        return results
+
+    def open_uart_terminal(self, uart, machine=None) -> int:
+        """
+        Exposes a UART on a local TCP port through a Renode server socket terminal.
+
+        A UART opened before keeps its terminal and port.
+
+        Args:
+            uart (str): The UART peripheral, e.g. "sysbus.uart0".
+            machine (str, optional): The machine of the UART. Defaults to None,
+                the current machine of the monitor.
+
+        Returns:
+            int: The port to connect to.
+
+        Raises:
+            Exception: In Mock mode, or if Renode reports an error.
+        """
+        if self.monitor is None:
+            raise Exception("UART terminals are not available in Mock mode")
+        port, commands = self.uart_terminals.open_commands(uart, machine)
+        if commands:
+            errors = [result[1] for result in self._execute_on_machine(machine, commands)
+                      if result is not None and result[1]]
+            self.uart_terminals.opened(uart, machine, port, not errors)
+            if errors:
+                raise Exception(f"Renode Error: {errors[0]}")
+        logger.info(f"{uart} available on port {port}")
+        return port
+
+    def close_uart_terminal(self, uart, port, machine=None):
+        """
+        Disconnects a UART from the terminal opened by `open_uart_terminal`,
+        which is kept for the next `open_uart_terminal` of the UART.
+
+        Args:
+            uart (str): The UART peripheral.
+            port (int): The port of the terminal.
+            machine (str, optional): The machine of the UART. Defaults to None.
+        """
+        if self.monitor is None:
+            return
+        errors = [result[1] for result in self._execute_on_machine(machine, [f"connector Disconnect {uart} {uart_terminal_name(port)}"])
+                  if result is not None and result[1]]
+        self.uart_terminals.closed(uart, machine, not errors)
+        for error in errors:
+            logger.warning(f"Failed to disconnect {uart}: {error}")
+
+    def cache_stats(self):
+        """
+        Returns the monitor response cache statistics.
+
+        Returns:
+            dict: See `ResponseCache.stats`.
+        """
+        return self.response_cache.stats()
+
     def monitor_command(self, command: str):
         """
         Executes a raw monitor command provided by the user.
@@ -335,7 +1182,8 @@ class RenodeWrapper:
         """
         logger.info(f"Executing monitor command: {command}")
         try:
-            self._execute_and_log(command)
+            with self._command_lock([command]):
+                self._execute_and_log(command)
         except Exception as e:
             logger.error(f"Error executing monitor command: {e}")
             # Error is already logged via _execute_and_log callback if possible, 
@@ -0,0 +1,129 @@
+"""
+Response Cache Module.
+
+This module memoizes the output of idempotent monitor commands. Queries such as
+`help`, `peripherals` or symbol lookups are answered from an LRU cache, while any
+other command is treated as potentially state-changing and empties the cache.
+"""
+
+import threading
+from collections import OrderedDict
+
+# Default number of cached responses.
+DEFAULT_CACHE_SIZE = 256
+
+# Commands whose output depends only on the loaded platform, by first word.
+IDEMPOTENT_COMMANDS = {"help", "peripherals", "version", "showAnalyzers", "using"}
+# Peripheral or machine methods answering read-only queries, by second word
+# (e.g. "sysbus WhatIsAt 0x80000000").
+IDEMPOTENT_METHODS = {
+    "WhatIsAt",
+    "FindSymbolAt",
+    "GetSymbolAddress",
+    "GetAllSymbols",
+    "GetRegisteredPeripherals",
+    "GetMachineName",
+    "help",
+}
+
+def is_idempotent(command):
+    """
+    Classifies a monitor command as an idempotent query.
+
+    Unknown commands are conservatively treated as state-changing.
+
+    Args:
+        command (str): The monitor command.
+
+    Returns:
+        bool: True if repeating the command returns the same output until the
+            emulation state changes.
+    """
+    words = command.split()
+    if not words:
+        return False
+    if words[0] in IDEMPOTENT_COMMANDS:
+        # "using" with an argument changes how later commands resolve names
+        return words[0] != "using" or len(words) == 1
+    return len(words) > 1 and words[1] in IDEMPOTENT_METHODS
+
+class ResponseCache:
+    """
+    LRU cache of (output, error) pairs keyed by the normalized command text.
+
+    Thread-safe, as commands run on the worker thread while statistics may be
+    read from the UI thread.
+    """
+
+    def __init__(self, capacity=DEFAULT_CACHE_SIZE):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            capacity (int, optional): Maximum number of cached responses. Defaults to 256.
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, command):
+        """
+        Looks up a cached response.
+
+        Args:
+            command (str): The monitor command.
+
+        Returns:
+            tuple: The cached (output, error), or None on a miss.
+        """
+        key = " ".join(command.split())
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, command, response):
+        """
+        Stores a response, evicting the least recently used one when full.
+
+        Args:
+            command (str): The monitor command.
+            response (tuple): The (output, error) pair.
+        """
+        key = " ".join(command.split())
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """
+        Drops all cached responses.
+        """
+        with self._lock:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+
+    def stats(self):
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: 'hits', 'misses', 'invalidations' and current 'size'.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
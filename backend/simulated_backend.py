@@ -0,0 +1,772 @@
+"""
+Simulated Backend Module.
+
+This module provides `SimulatedRenode`, a synthetic stand-in for a Renode emulation
+used for load testing on machines without Renode. It holds an in-memory address
+space that configurable workloads mutate while the simulation runs, writes Renode
+style log lines to the log file at a configurable rate, streams boot-console
+style UART output to server socket terminals, and injects per-call latency and
+jitter. `SimulatedEmulation` drives several such machines together.
+`RenodeWrapper` uses either in place of pyrenode3 when given one.
+"""
+
+import json
+import logging
+import random
+import re
+import socket
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+# Header of saved states: memory base, memory size, virtual time.
+STATE_HEADER = struct.Struct("<QQd")
+
+class CounterWorkload:
+    """
+    Increments a block of 32-bit words by one on every tick.
+    """
+
+    def __init__(self, address, count=16):
+        """
+        Initializes the CounterWorkload.
+
+        Args:
+            address (int): The address of the first counter.
+            count (int, optional): The number of counters. Defaults to 16.
+        """
+        self.address = address
+        self.count = count
+
+    def tick(self, sim, rng):
+        """
+        Advances the counters.
+
+        Args:
+            sim (SimulatedRenode): The simulation owning the memory.
+            rng (random.Random): The random number generator.
+        """
+        words = sim.words(self.address, self.count)
+        for i in range(self.count):
+            words[i] = (words[i] + 1) & 0xFFFFFFFF
+
+class RandomWorkload:
+    """
+    Writes random values to randomly chosen words of a block on every tick.
+    """
+
+    def __init__(self, address, count=1024, writes_per_tick=64):
+        """
+        Initializes the RandomWorkload.
+
+        Args:
+            address (int): The address of the block.
+            count (int, optional): The number of words in the block. Defaults to 1024.
+            writes_per_tick (int, optional): Words written per tick. Defaults to 64.
+        """
+        self.address = address
+        self.count = count
+        self.writes_per_tick = writes_per_tick
+
+    def tick(self, sim, rng):
+        """
+        Writes the random values.
+
+        Args:
+            sim (SimulatedRenode): The simulation owning the memory.
+            rng (random.Random): The random number generator.
+        """
+        words = sim.words(self.address, self.count)
+        for _ in range(self.writes_per_tick):
+            words[rng.randrange(self.count)] = rng.getrandbits(32)
+
+WORKLOAD_TYPES = {"counter": CounterWorkload, "random": RandomWorkload}
+
+def parse_time_interval(text):
+    """
+    Parses a Renode time interval, e.g. "00:00:01.5" or "1.5" (seconds).
+
+    Args:
+        text (str): The interval, optionally quoted.
+
+    Returns:
+        float: The interval in seconds.
+    """
+    seconds = 0.0
+    for part in text.strip('"').split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+def _parse_int(value):
+    """
+    Parses an integer given as a number or a (hex) string.
+
+    Args:
+        value (int or str): The value, e.g. 4096 or "0x1000".
+
+    Returns:
+        int: The parsed integer.
+    """
+    return value if isinstance(value, int) else int(value, 0)
+
+class SimulatedTerminal:
+    """
+    A server socket terminal, like Renode's `emulation CreateServerSocketTerminal`:
+    a TCP port streaming the output of the UARTs connected to it.
+    """
+
+    def __init__(self, port, name):
+        """
+        Initializes the SimulatedTerminal and starts listening.
+
+        Args:
+            port (int): The port to listen on.
+            name (str): The terminal name.
+        """
+        self.port = port
+        self.name = name
+        self._server = socket.create_server(("127.0.0.1", port))
+        self._clients = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept, name=f"simulated-terminal-{name}", daemon=True).start()
+
+    def _accept(self):
+        """
+        Thread body: accepts clients until the terminal is closed.
+        """
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._clients.append(client)
+
+    def write(self, data):
+        """
+        Sends UART output to every client.
+
+        Args:
+            data (bytes): The output.
+        """
+        with self._lock:
+            for client in list(self._clients):
+                try:
+                    client.sendall(data)
+                except OSError:
+                    self._clients.remove(client)
+                    client.close()
+
+    def close(self):
+        """
+        Stops listening and disconnects every client.
+        """
+        self._server.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+class SimulatedRenode:
+    """
+    A synthetic Renode emulation with a flat, in-memory address space.
+
+    Memory outside `[memory_base, memory_base + memory_size)` is unmapped and
+    reads of it fail, like unmapped bus regions in Renode.
+    """
+
+    def __init__(self, memory_base=0x80000000, memory_size=1 << 24, workloads=None, tick_hz=100,
+                 log_rate=0.0, latency=0.0, jitter=0.0, seed=None, name="sim", uart_rate=0.0):
+        """
+        Initializes the SimulatedRenode.
+
+        Args:
+            memory_base (int, optional): The first mapped address. Defaults to 0x80000000.
+            memory_size (int, optional): The size of the mapped memory in bytes. Defaults to 16 MiB.
+            workloads (list, optional): Workload objects mutating memory on each tick.
+            tick_hz (float, optional): Workload ticks per second while running. Defaults to 100.
+            log_rate (float, optional): Log lines written per second while running. Defaults to 0.
+            latency (float, optional): Mean delay in seconds added to every call. Defaults to 0.
+            jitter (float, optional): Maximum random deviation from `latency`, in seconds.
+            seed (int, optional): Seed for the random number generator.
+            name (str, optional): The machine name, used in log lines. Defaults to "sim".
+            uart_rate (float, optional): UART output bytes per second while running,
+                sent to the connected terminals. Defaults to 0.
+        """
+        self.name = name
+        self.memory_base = memory_base
+        self.memory = bytearray(memory_size)
+        self.workloads = list(workloads or [])
+        self.tick_hz = tick_hz
+        self.log_rate = log_rate
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.uart_rate = uart_rate
+        self.terminals = {} # Terminal name -> SimulatedTerminal; shared by the machines of an emulation
+        self.uart_terminals = [] # Terminals the UART is connected to
+        self._uart_lines = 0
+        self._uart_pending = bytearray()
+        self.log_file_path = None
+        self.running = False
+        self._virtual_time = 0.0
+        self._started_at = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds a simulation from a configuration dict.
+
+        Args:
+            config (dict): Keyword arguments of `__init__`; addresses may be hex
+                strings, and 'workloads' is a list of dicts with a 'type' key
+                ("counter" or "random") plus that workload's arguments.
+
+        Returns:
+            SimulatedRenode: The configured simulation.
+        """
+        options = dict(config)
+        workloads = []
+        for spec in options.pop("workloads", []):
+            spec = dict(spec)
+            workload_cls = WORKLOAD_TYPES[spec.pop("type")]
+            spec["address"] = _parse_int(spec["address"])
+            workloads.append(workload_cls(**spec))
+        if "memory_base" in options:
+            options["memory_base"] = _parse_int(options["memory_base"])
+        if "memory_size" in options:
+            options["memory_size"] = _parse_int(options["memory_size"])
+        return cls(workloads=workloads, **options)
+
+    @property
+    def machines(self):
+        """
+        Returns the simulated machines by name; a SimulatedRenode is a single machine.
+
+        Returns:
+            dict: Maps the machine name to this simulation.
+        """
+        return {self.name: self}
+
+    def _delay(self):
+        """
+        Blocks for the configured per-call latency plus jitter.
+        """
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter) if self.jitter else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _offset(self, addr, count):
+        """
+        Translates a bus range to an offset into the memory buffer.
+
+        Args:
+            addr (int): The start address.
+            count (int): The number of bytes.
+
+        Returns:
+            int: The offset of `addr` in `memory`.
+
+        Raises:
+            ValueError: If the range is not fully mapped.
+        """
+        offset = addr - self.memory_base
+        if offset < 0 or offset + count > len(self.memory):
+            raise ValueError(f"Unmapped memory access at {hex(addr)} ({count} bytes)")
+        return offset
+
+    def words(self, addr, count):
+        """
+        Returns a writable view of `count` 32-bit words starting at `addr`.
+
+        Args:
+            addr (int): The address of the first word.
+            count (int): The number of words.
+
+        Returns:
+            memoryview: The words, in native byte order.
+        """
+        offset = self._offset(addr, 4 * count)
+        return memoryview(self.memory)[offset:offset + 4 * count].cast('I')
+
+    def virtual_time(self):
+        """
+        Returns the simulated time elapsed while running.
+
+        Returns:
+            float: The virtual time in seconds.
+        """
+        if self._started_at is None:
+            return self._virtual_time
+        return self._virtual_time + time.monotonic() - self._started_at
+
+    def attach_log_file(self, path):
+        """
+        Directs generated log lines to a file.
+
+        Args:
+            path (str): The log file path.
+        """
+        self.log_file_path = path
+
+    def load_script(self, path):
+        """
+        Simulates loading a script: clears memory and virtual time.
+
+        Args:
+            path (str): The script path.
+        """
+        self._delay()
+        if not path:
+            raise ValueError("Invalid path")
+        self.clear()
+
+    def start(self):
+        """
+        Starts the workload and log threads.
+        """
+        self._delay()
+        if self.running:
+            return
+        self.running = True
+        self._started_at = time.monotonic()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="simulated-renode", daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        """
+        Stops the workload and log threads, keeping memory contents.
+        """
+        self._delay()
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._virtual_time = self.virtual_time()
+        self._started_at = None
+        self.running = False
+
+    def reset(self):
+        """
+        Stops the simulation and zeroes memory and virtual time, as `machine
+        Reset` does; UART connections and terminals are kept.
+        """
+        if self.running:
+            self.pause()
+        self.memory[:] = bytes(len(self.memory))
+        self._virtual_time = 0.0
+        self._uart_lines = 0
+        self._uart_pending.clear()
+
+    def clear(self):
+        """
+        Resets the simulation and removes the terminals, as clearing a Renode
+        emulation does.
+        """
+        self.reset()
+        self.uart_terminals.clear()
+        for terminal in self.terminals.values():
+            terminal.close()
+        self.terminals.clear()
+
+    def run_for(self, seconds):
+        """
+        Advances the simulation by an amount of virtual time, like Renode's
+        `emulation RunFor`.
+
+        Ticks run back to back without waiting, so virtual time is decoupled
+        from wall time and runs are reproducible for a given seed.
+
+        Args:
+            seconds (float): The virtual time to run for.
+        """
+        if self.running:
+            self.pause()
+        ticks = round(seconds * self.tick_hz)
+        period = 1.0 / self.tick_hz
+        log_budget = 0.0
+        log_file = open(self.log_file_path, "a") if self.log_file_path and self.log_rate else None
+        try:
+            for _ in range(ticks):
+                for workload in self.workloads:
+                    workload.tick(self, self.rng)
+                self._virtual_time += period
+                if log_file:
+                    log_budget += self.log_rate * period
+                    count, log_budget = int(log_budget), log_budget - int(log_budget)
+                    if count:
+                        log_file.write(self._log_lines(count))
+        finally:
+            if log_file:
+                log_file.close()
+
+    def save_state(self, path):
+        """
+        Saves memory and virtual time to a file, like Renode's `Save`.
+
+        Args:
+            path (str): The state file path.
+        """
+        if self.running:
+            raise RuntimeError("Emulation must be paused to save its state")
+        with open(path, "wb") as f:
+            f.write(STATE_HEADER.pack(self.memory_base, len(self.memory), self._virtual_time))
+            f.write(self.memory)
+
+    def load_state(self, path):
+        """
+        Restores memory and virtual time from a file written by `save_state`.
+
+        Args:
+            path (str): The state file path.
+        """
+        if self.running:
+            self.pause()
+        with open(path, "rb") as f:
+            base, size, virtual_time = STATE_HEADER.unpack(f.read(STATE_HEADER.size))
+            if base != self.memory_base or size != len(self.memory):
+                raise ValueError("State was saved with a different memory layout")
+            f.readinto(self.memory)
+        self._virtual_time = virtual_time
+
+    def read_bytes(self, addr, count):
+        """
+        Reads a range of memory.
+
+        Args:
+            addr (int): The start address.
+            count (int): The number of bytes.
+
+        Returns:
+            bytes: The memory contents.
+        """
+        self._delay()
+        offset = self._offset(addr, count)
+        return bytes(self.memory[offset:offset + count])
+
+    def write_bytes(self, addr, data):
+        """
+        Writes a range of memory.
+
+        Args:
+            addr (int): The start address.
+            data (bytes): The bytes to write.
+        """
+        offset = self._offset(addr, len(data))
+        self.memory[offset:offset + len(data)] = data
+
+    def execute(self, command):
+        """
+        Executes a monitor command against the simulation.
+
+        Supports start/pause/Clear, `emulation RunFor`, Save/Load of the state,
+        server socket terminals (`emulation CreateServerSocketTerminal`,
+        `connector Connect`/`Disconnect` of any `sysbus.*` UART) and
+        `sysbus Read*`/`Write*` accesses; other commands are accepted without output.
+
+        Args:
+            command (str): The monitor command.
+
+        Returns:
+            tuple: (output, error) strings.
+        """
+        words = command.split()
+        if not words:
+            return "", ""
+        if words[0] == "start":
+            self.start()
+            return "", ""
+        if words[0] == "pause":
+            self.pause()
+            return "", ""
+        if words[0] == "Clear":
+            self.clear()
+            return "", ""
+        if words[:2] == ["emulation", "RunFor"] and len(words) > 2:
+            try:
+                self.run_for(parse_time_interval(words[2]))
+            except ValueError as e:
+                return "", str(e)
+            return "", ""
+        if words[:2] == ["emulation", "CreateServerSocketTerminal"] and len(words) > 3:
+            name = words[3].strip('"')
+            if name in self.terminals:
+                return "", f"Terminal {name} already exists"
+            try:
+                self.terminals[name] = SimulatedTerminal(int(words[2]), name)
+            except (ValueError, OSError) as e:
+                return "", str(e)
+            return "", ""
+        if words[0] == "connector" and len(words) == 4 and words[1] in ("Connect", "Disconnect"):
+            terminal = self.terminals.get(words[3])
+            if terminal is None:
+                return "", f"No terminal named {words[3]}"
+            if not words[2].startswith("sysbus."):
+                return "", f"No peripheral named {words[2]}"
+            if words[1] == "Connect" and terminal not in self.uart_terminals:
+                self.uart_terminals.append(terminal)
+            elif words[1] == "Disconnect" and terminal in self.uart_terminals:
+                self.uart_terminals.remove(terminal)
+            return "", ""
+        if words[0] in ("Save", "Load") and len(words) > 1:
+            path = command.strip()[len(words[0]):].strip().lstrip("@").strip('"')
+            try:
+                if words[0] == "Save":
+                    self.save_state(path)
+                else:
+                    self.load_state(path)
+            except (OSError, ValueError, RuntimeError, struct.error) as e:
+                return "", str(e)
+            return "", ""
+        access = re.fullmatch(r"sysbus (Read|Write)(Byte|Word|DoubleWord|QuadWord) (\S+)(?: (\S+))?", command.strip())
+        self._delay()
+        if not access:
+            return "", ""
+        width = {"Byte": 1, "Word": 2, "DoubleWord": 4, "QuadWord": 8}[access.group(2)]
+        try:
+            addr = int(access.group(3), 0)
+            if access.group(1) == "Read":
+                offset = self._offset(addr, width)
+                return hex(int.from_bytes(self.memory[offset:offset + width], "little")), ""
+            self.write_bytes(addr, int(access.group(4), 0).to_bytes(width, "little"))
+            return "", ""
+        except (ValueError, TypeError) as e:
+            return "", str(e)
+
+    def _run(self):
+        """
+        Thread body: ticks the workloads and writes log lines while running.
+        """
+        period = 1.0 / self.tick_hz
+        next_tick = time.monotonic()
+        log_budget = 0.0
+        uart_budget = 0.0
+        log_file = open(self.log_file_path, "a") if self.log_file_path and self.log_rate else None
+        try:
+            while not self._stop_event.is_set():
+                for workload in self.workloads:
+                    workload.tick(self, self.rng)
+                if self.uart_terminals and self.uart_rate:
+                    uart_budget += self.uart_rate * period
+                    count, uart_budget = int(uart_budget), uart_budget - int(uart_budget)
+                    if count:
+                        data = self._uart_output(count)
+                        for terminal in list(self.uart_terminals):
+                            terminal.write(data)
+                if log_file:
+                    log_budget += self.log_rate * period
+                    count, log_budget = int(log_budget), log_budget - int(log_budget)
+                    if count:
+                        log_file.write(self._log_lines(count))
+                        log_file.flush()
+                next_tick += period
+                self._stop_event.wait(max(0.0, next_tick - time.monotonic()))
+        except Exception as e:
+            logger.error(f"Simulated backend error: {e}")
+        finally:
+            if log_file:
+                log_file.close()
+
+    def _log_lines(self, count):
+        """
+        Generates Renode-style log lines.
+
+        Args:
+            count (int): The number of lines.
+
+        Returns:
+            str: The lines, newline-terminated.
+        """
+        vtime = self.virtual_time()
+        stamp = time.strftime("%H:%M:%S", time.localtime()) + f".{int(time.time() * 10000) % 10000:04d}"
+        lines = []
+        for i in range(count):
+            level = LOG_LEVELS[self.rng.randrange(len(LOG_LEVELS))]
+            lines.append(f"{stamp} [{level}] {self.name}/sysbus.uart: simulated event {i} at virtual time {vtime:.6f}\n")
+        return "".join(lines)
+
+    def _uart_output(self, count):
+        """
+        Generates boot-console style UART output, with colored status lines.
+
+        Args:
+            count (int): The number of bytes.
+
+        Returns:
+            bytes: The output.
+        """
+        while len(self._uart_pending) < count:
+            n = self._uart_lines
+            self._uart_lines += 1
+            if n % 16 == 15:
+                line = f"[  \x1b[32mOK\x1b[0m  ] Started simulated service {n}.\r\n"
+            else:
+                line = f"[{self.virtual_time():12.6f}] {self.name}: simulated boot message {n}\r\n"
+            self._uart_pending += line.encode()
+        data = bytes(self._uart_pending[:count])
+        del self._uart_pending[:count]
+        return data
+
+class SimulatedEmulation:
+    """
+    Several `SimulatedRenode` machines driven together, like a multi-machine
+    Renode emulation.
+
+    Control commands apply to every machine; `mach set` selects the machine that
+    other monitor commands (e.g. `sysbus` accesses) go to. Saving and loading
+    the state is not supported.
+    """
+
+    def __init__(self, machines):
+        """
+        Initializes the SimulatedEmulation.
+
+        Args:
+            machines (list): The `SimulatedRenode` machines; names must be unique.
+        """
+        self.machines = {machine.name: machine for machine in machines}
+        self.current = machines[0]
+        # Terminals belong to the emulation, UART connections to the machines
+        self.terminals = {}
+        for machine in machines:
+            machine.terminals = self.terminals
+
+    @property
+    def running(self):
+        """
+        Returns whether any machine is running.
+
+        Returns:
+            bool: True if a machine is running.
+        """
+        return any(machine.running for machine in self.machines.values())
+
+    def attach_log_file(self, path):
+        """
+        Directs the log lines of every machine to a file.
+
+        Args:
+            path (str): The log file path.
+        """
+        for machine in self.machines.values():
+            machine.attach_log_file(path)
+
+    def load_script(self, path):
+        """
+        Simulates loading a script on every machine.
+
+        Args:
+            path (str): The script path.
+        """
+        for machine in self.machines.values():
+            machine.load_script(path)
+
+    def start(self):
+        """
+        Starts every machine.
+        """
+        for machine in self.machines.values():
+            machine.start()
+
+    def pause(self):
+        """
+        Pauses every machine.
+        """
+        for machine in self.machines.values():
+            machine.pause()
+
+    def reset(self):
+        """
+        Resets every machine.
+        """
+        for machine in self.machines.values():
+            machine.reset()
+
+    def run_for(self, seconds):
+        """
+        Advances every machine by an amount of virtual time.
+
+        Args:
+            seconds (float): The virtual time to run for.
+        """
+        for machine in self.machines.values():
+            machine.run_for(seconds)
+
+    def virtual_time(self):
+        """
+        Returns the virtual time of the first machine.
+
+        Returns:
+            float: The virtual time in seconds.
+        """
+        return next(iter(self.machines.values())).virtual_time()
+
+    def read_bytes(self, addr, count):
+        """
+        Reads a range of memory of the first machine.
+
+        Args:
+            addr (int): The start address.
+            count (int): The number of bytes.
+
+        Returns:
+            bytes: The memory contents.
+        """
+        return next(iter(self.machines.values())).read_bytes(addr, count)
+
+    def execute(self, command):
+        """
+        Executes a monitor command against the machines.
+
+        Args:
+            command (str): The monitor command.
+
+        Returns:
+            tuple: (output, error) strings.
+        """
+        words = command.split()
+        if words[:2] == ["mach", "set"] and len(words) > 2:
+            name = command.split(None, 2)[2].strip().strip('"')
+            if name not in self.machines:
+                return "", f"No machine named {name}"
+            self.current = self.machines[name]
+            return "", ""
+        if words and words[0] in ("start", "pause", "Clear"):
+            for machine in self.machines.values():
+                machine.execute(command)
+            return "", ""
+        if words[:2] == ["emulation", "RunFor"]:
+            for machine in self.machines.values():
+                output, error = machine.execute(command)
+                if error:
+                    return output, error
+            return "", ""
+        if words and words[0] in ("Save", "Load"):
+            return "", "Saving the state of a multi-machine simulation is not supported"
+        return self.current.execute(command)
+
+def load_simulation(path):
+    """
+    Builds a simulation from a JSON configuration file.
+
+    The file configures a single `SimulatedRenode` (see `from_config`), or holds
+    a 'machines' list of such configurations, each with a distinct 'name', for
+    a `SimulatedEmulation`.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        SimulatedRenode or SimulatedEmulation: The configured simulation.
+    """
+    with open(path) as f:
+        config = json.load(f)
+    if "machines" in config:
+        return SimulatedEmulation([SimulatedRenode.from_config(machine) for machine in config["machines"]])
+    return SimulatedRenode.from_config(config)
@@ -0,0 +1,190 @@
+"""
+Snapshot Cache Module.
+
+This module manages an on-disk cache of emulation snapshots taken right after a
+script has been loaded. A snapshot is keyed by a hash of the script and of every
+file it references, so editing the script, the platform description or the
+firmware produces a new key. The cache is bounded in total size; the least
+recently used snapshots are evicted first.
+"""
+
+import hashlib
+import logging
+import os
+import re
+
+from .elf_symbols import resolve_script_path
+
+logger = logging.getLogger(__name__)
+
+# Default location and size bound of the snapshot cache.
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "renode-ui", "snapshots")
+DEFAULT_SNAPSHOT_CACHE_BYTES = 2 << 30
+SNAPSHOT_SUFFIX = ".save"
+# Suffix of a snapshot being written; such files are never looked up.
+PARTIAL_SUFFIX = ".partial"
+
+# File references in Renode scripts, e.g. `@platforms/board.repl` or `@"my file.elf"`.
+REFERENCE_PATTERN = re.compile(r"@(\"[^\"]+\"|[^\s\"]+)")
+
+def script_fingerprint(script_path, salt=""):
+    """
+    Hashes a script together with the files it references.
+
+    Referenced scripts (`.resc`) are followed recursively. References that do
+    not resolve to an existing file are hashed by their text only.
+
+    Args:
+        script_path (str): The path of the .resc script.
+        salt (str, optional): Extra text mixed into the hash, e.g. the backend
+            kind and its parameters.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256(salt.encode())
+    visited = set()
+    pending = [os.path.abspath(script_path)]
+    while pending:
+        path = pending.pop()
+        if path in visited:
+            continue
+        visited.add(path)
+        digest.update(path.encode() + b"\0")
+        with open(path, "rb") as f:
+            content = f.read()
+        digest.update(hashlib.sha256(content).digest())
+        if not path.endswith(".resc"):
+            continue
+        script_dir = os.path.dirname(path)
+        for line in content.decode(errors="replace").splitlines():
+            line = line.split("#", 1)[0]
+            for match in REFERENCE_PATTERN.finditer(line):
+                reference = resolve_script_path("@" + match.group(1), script_dir)
+                if reference is None:
+                    digest.update(match.group(1).encode() + b"\0")
+                elif os.path.isfile(reference):
+                    pending.append(reference)
+    return digest.hexdigest()
+
+class SnapshotCache:
+    """
+    A size-bounded directory of snapshot files, one per key.
+
+    Recency is tracked with file modification times, so it survives restarts.
+    """
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR, max_bytes=DEFAULT_SNAPSHOT_CACHE_BYTES):
+        """
+        Initializes the SnapshotCache.
+
+        Args:
+            directory (str, optional): The cache directory, created if missing.
+            max_bytes (int, optional): Maximum total size of the cached snapshots.
+                Defaults to 2 GiB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key):
+        """
+        Returns the snapshot file path for a key.
+
+        Args:
+            key (str): The snapshot key.
+
+        Returns:
+            str: The file path; the file may not exist yet.
+        """
+        return os.path.join(self.directory, key + SNAPSHOT_SUFFIX)
+
+    def partial_path_for(self, key):
+        """
+        Returns the path a snapshot for a key is written to before `commit`.
+
+        The path is unique per process, so processes sharing the cache (e.g.
+        batch runner workers) never write to the same file.
+
+        Args:
+            key (str): The snapshot key.
+
+        Returns:
+            str: The file path of the snapshot being written.
+        """
+        return f"{self.path_for(key)}.{os.getpid()}{PARTIAL_SUFFIX}"
+
+    def lookup(self, key):
+        """
+        Returns the snapshot for a key and marks it as recently used.
+
+        Args:
+            key (str): The snapshot key.
+
+        Returns:
+            str: The snapshot file path, or None on a miss.
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def commit(self, key):
+        """
+        Moves a snapshot written to `partial_path_for(key)` into the cache and
+        enforces the size bound.
+
+        The move is atomic, so an interrupted save never leaves a snapshot that
+        `lookup` would return.
+
+        Args:
+            key (str): The snapshot key.
+
+        Returns:
+            str: The path of the cached snapshot.
+        """
+        path = self.path_for(key)
+        os.replace(self.partial_path_for(key), path)
+        self.evict(keep=path)
+        return path
+
+    def discard(self, key):
+        """
+        Deletes what a failed save left at `partial_path_for(key)`.
+
+        Args:
+            key (str): The snapshot key.
+        """
+        try:
+            os.remove(self.partial_path_for(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete partial snapshot for {key}: {e}")
+
+    def evict(self, keep=None):
+        """
+        Deletes the least recently used snapshots until the cache fits its bound.
+
+        Args:
+            keep (str, optional): A snapshot path that is never deleted.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SNAPSHOT_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                logger.info(f"Evicted snapshot {path}")
+            except OSError as e:
+                logger.warning(f"Failed to evict snapshot {path}: {e}")
@@ -0,0 +1,554 @@
+"""
+Socket Bridge Module.
+
+This module provides `SocketRenodeBridge`, an alternative to `RenodeBridge` that
+drives a separate Renode process through its socket monitor (`renode --port N`)
+instead of hosting Renode in the UI process. A crash of Renode (or of its .NET
+runtime) then only drops the connection: calls fail with
+`MonitorDisconnectedError` while the bridge reconnects in the background, and
+the UI reattaches once Renode is back on the same port.
+
+Every operation is a monitor command sent over one persistent `MonitorClient`
+connection. Commands are pipelined, so a poll of many watches is written at
+once and costs a single round trip. Reads and per-machine control run through
+`MonitorClient.execute_on`, so they never change the machine selected in the
+monitor, e.g. by the user. The Renode log is written by Renode to a
+file that is tailed as with the in-process backend, so Renode must run on the
+same host. Bus watchpoints are not available over the monitor; push watches are
+polled instead.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import tempfile
+import time
+
+from .log_tail import LogTailer
+from .metrics import MetricsRegistry
+from .monitor_client import MonitorClient, DEFAULT_MONITOR_PORT
+from .renode_wrapper import _path_token
+from .uart_stream import UartTerminalRegistry, uart_terminal_name
+
+logger = logging.getLogger(__name__)
+
+# Monitor method reading a value of each width.
+READ_COMMANDS = {1: "ReadByte", 2: "ReadWord", 4: "ReadDoubleWord", 8: "ReadQuadWord"}
+HEX_PATTERN = re.compile(r"0x[0-9a-fA-F]+")
+# A machine in the output of `mach`, e.g. "\t0: machine-0".
+MACHINE_LINE_PATTERN = re.compile(r"^\s+(?:\d+:\s*)?(\S.*?)\s*$")
+
+class SocketRenodeBridge:
+    """
+    Asynchronous bridge to a Renode process over its socket monitor.
+
+    Offers the interface of `RenodeBridge` used by the UI. Calls made before the
+    first connection wait for it; calls made while reconnecting fail with
+    `MonitorDisconnectedError`. Calls are timed in `metrics`, the "exec" phase
+    covering the monitor round trip.
+    """
+
+    def __init__(self, host="localhost", port=DEFAULT_MONITOR_PORT, metrics=None):
+        """
+        Initializes the SocketRenodeBridge and starts connecting.
+
+        Args:
+            host (str, optional): The Renode monitor host. Defaults to "localhost".
+            port (int, optional): The Renode monitor port. Defaults to 1234.
+            metrics (MetricsRegistry, optional): Receives the call latencies.
+                Defaults to a new registry.
+        """
+        self.loop = asyncio.get_event_loop()
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.client = MonitorClient(host, port, on_connection=self._on_connection)
+        self.machines = [] # Machine names, refreshed by `list_machines`
+        self.uart_terminals = UartTerminalRegistry()
+        self.script_path = None
+        self.log_file_path = None
+        self.log_tailer = None
+        self._log_sink = None
+        self._connection_listener = None
+        self._created = time.perf_counter()
+        # Resolves to the startup timings once the monitor first answers
+        self.ready = self.loop.create_future()
+        self.client.start()
+
+    def _on_connection(self, connected):
+        """
+        Re-establishes logging on every connection and informs the listener.
+
+        Args:
+            connected (bool): Whether the monitor is now connected.
+        """
+        if connected:
+            if not self.ready.done():
+                self.ready.set_result({"connect": time.perf_counter() - self._created})
+            if self.log_file_path is not None:
+                asyncio.ensure_future(self._attach_log_file())
+        if self._connection_listener is not None:
+            self._connection_listener(connected)
+
+    def set_connection_listener(self, callback):
+        """
+        Registers a function told about connection losses and reconnections.
+
+        Args:
+            callback (callable): Called on the loop with True after a
+                (re)connection and False when the connection drops.
+        """
+        self._connection_listener = callback
+
+    async def _execute(self, command, name=None):
+        """
+        Executes a monitor command and times its round trip.
+
+        Args:
+            command (str): The command line.
+            name (str, optional): The operation name for the metrics.
+
+        Returns:
+            tuple: (output, error) strings.
+        """
+        await self.ready
+        start = time.perf_counter()
+        try:
+            return await self.client.execute(command)
+        finally:
+            self.metrics.observe(name or command.split(maxsplit=1)[0], "exec", time.perf_counter() - start)
+
+    async def _execute_many(self, commands, name, machine=None):
+        """
+        Executes pipelined monitor commands and times their round trip.
+
+        Args:
+            commands (list): The command lines.
+            name (str): The operation name for the metrics.
+            machine (str, optional): Run the commands on this machine, leaving
+                the monitor's machine selection as it was. Defaults to None, the
+                current machine of the monitor.
+
+        Returns:
+            list: One (output, error) tuple per command.
+        """
+        await self.ready
+        start = time.perf_counter()
+        try:
+            if machine is not None:
+                return await self.client.execute_on(machine, commands)
+            return await self.client.execute_many(commands)
+        finally:
+            self.metrics.observe(name, "exec", time.perf_counter() - start)
+
+    def _log(self, lines):
+        """
+        Appends lines to the Renode log, as the in-process backend does for
+        monitor commands and their output.
+
+        Args:
+            lines (list): The lines.
+        """
+        if lines and self._log_sink is not None:
+            self._log_sink(lines)
+
+    async def _execute_and_log(self, command, name=None):
+        """
+        Executes a monitor command, echoing it and its output to the Renode log.
+
+        Args:
+            command (str): The command line.
+            name (str, optional): The operation name for the metrics.
+
+        Returns:
+            tuple: (output, error) strings.
+        """
+        self._log([f"({self.client.context or 'monitor'}) {command}"])
+        output, error = await self._execute(command, name)
+        lines = []
+        _append_response(lines, output, error)
+        self._log(lines)
+        return output, error
+
+    async def _control(self, commands, name):
+        """
+        Runs control commands, raising on the first error.
+
+        Args:
+            commands (list): The command lines.
+            name (str): The operation name for the metrics.
+
+        Raises:
+            Exception: If Renode reports an error.
+        """
+        for command in commands:
+            output, error = await self._execute_and_log(command, name)
+            if error:
+                raise Exception(f"Renode Error: {error}")
+
+    async def _control_machine(self, machine, command, name):
+        """
+        Runs a control command on one machine, raising on error.
+
+        Args:
+            machine (str): The machine name.
+            command (str): The command line, e.g. "machine Start".
+            name (str): The operation name for the metrics.
+
+        Raises:
+            Exception: If Renode reports an error.
+        """
+        _, error = (await self._execute_on_machine(machine, [command], name))[0]
+        if error:
+            raise Exception(f"Renode Error: {error}")
+
+    async def _execute_on_machine(self, machine, commands, name):
+        """
+        Executes pipelined commands on a machine, echoing them and their output
+        to the Renode log as one batch.
+
+        Args:
+            machine (str): The machine name, or None for the machine currently
+                selected in the monitor.
+            commands (list): The command lines.
+            name (str): The operation name for the metrics.
+
+        Returns:
+            list: One (output, error) tuple per command.
+        """
+        context = machine or self.client.context or "monitor"
+        responses = await self._execute_many(commands, name, machine)
+        lines = []
+        for command, response in zip(commands, responses):
+            lines.append(f"({context}) {command}")
+            _append_response(lines, *response)
+        self._log(lines)
+        return responses
+
+    def _target(self, machine):
+        """
+        Returns the machine a read applies to.
+
+        Args:
+            machine (str): The machine name, or None for the first machine.
+
+        Returns:
+            str: The machine name, or None if no machine is known.
+        """
+        return machine or (self.machines[0] if self.machines else None)
+
+    def queue_stats(self):
+        """
+        Returns the number of commands awaiting a response.
+
+        Returns:
+            dict: 'pending' commands.
+        """
+        return {"pending": len(self.client._pending)}
+
+    def close(self):
+        """
+        Closes the connection and stops the log tailing.
+        """
+        self.client.close()
+        if self.log_tailer:
+            self.log_tailer.stop(timeout=1.0)
+        if self.log_file_path and os.path.exists(self.log_file_path):
+            try:
+                os.remove(self.log_file_path)
+            except OSError:
+                pass
+
+    async def load_script(self, path: str):
+        """
+        Clears the emulation and includes a Renode script.
+
+        Args:
+            path (str): The path to the script file.
+
+        Raises:
+            Exception: If Renode reports an error.
+        """
+        logger.info(f"Loading script: {path}")
+        self.uart_terminals.clear()
+        await self._control(["Clear", f"i {_path_token(os.path.abspath(path))}"], "load_script")
+        self.script_path = path
+        await self.list_machines()
+        logger.info("Script loaded successfully")
+
+    async def start(self, machine=None):
+        """
+        Starts the emulation, or a single machine.
+
+        Args:
+            machine (str, optional): The machine. Defaults to None, all machines.
+        """
+        if machine is None:
+            await self._control(["start"], "start")
+        else:
+            await self._control_machine(machine, "machine Start", "start")
+
+    async def pause(self, machine=None):
+        """
+        Pauses the emulation, or a single machine.
+
+        Args:
+            machine (str, optional): The machine. Defaults to None, all machines.
+        """
+        if machine is None:
+            await self._control(["pause"], "pause")
+        else:
+            await self._control_machine(machine, "machine Pause", "pause")
+
+    async def reset(self, machine=None):
+        """
+        Resets the emulation by clearing it and including the script again, or
+        resets a single machine.
+
+        Args:
+            machine (str, optional): The machine. Defaults to None, all machines.
+        """
+        if machine is not None:
+            await self._control_machine(machine, "machine Reset", "reset")
+            return
+        self.uart_terminals.clear()
+        commands = ["Clear"]
+        if self.script_path is not None:
+            commands.append(f"i {_path_token(os.path.abspath(self.script_path))}")
+        await self._control(commands, "reset")
+
+    async def list_machines(self) -> list:
+        """
+        Returns the names of the machines in the emulation.
+
+        Returns:
+            list: The machine names, in creation order.
+        """
+        output, error = await self._execute("mach", "list_machines")
+        if error:
+            raise Exception(f"Renode Error: {error}")
+        self.machines = [match.group(1) for match in map(MACHINE_LINE_PATTERN.match, output.splitlines()[1:]) if match]
+        return list(self.machines)
+
+    async def read_many(self, requests, machine=None) -> list:
+        """
+        Reads many values with one pipelined batch of monitor commands.
+
+        Args:
+            requests (list): A list of (address, width) tuples.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The values in the same order as `requests`, None where unreadable.
+        """
+        commands = [
+            f"sysbus {READ_COMMANDS[width]} {hex(addr)}" if width in READ_COMMANDS else f"sysbus ReadBytes {hex(addr)} {width}"
+            for addr, width in requests
+        ]
+        responses = await self._execute_many(commands, "read_many", self._target(machine))
+        values = []
+        for (addr, width), (output, error) in zip(requests, responses):
+            numbers = HEX_PATTERN.findall(output) if not error else []
+            if width in READ_COMMANDS and numbers:
+                values.append(int(numbers[0], 16))
+            elif len(numbers) == width:
+                values.append(int.from_bytes(bytes(int(number, 16) for number in numbers), "little"))
+            else:
+                values.append(None)
+        return values
+
+    async def read_pages(self, addresses, page_size, machine=None) -> list:
+        """
+        Reads whole memory pages with one pipelined batch of `ReadBytes` commands.
+
+        Args:
+            addresses (list): The start addresses of the pages.
+            page_size (int): The page size in bytes.
+            machine (str, optional): The machine to read from. Defaults to the
+                first machine.
+
+        Returns:
+            list: The page contents as bytes, in the same order as `addresses`,
+                None for pages that cannot be read.
+        """
+        commands = [f"sysbus ReadBytes {hex(addr)} {page_size}" for addr in addresses]
+        responses = await self._execute_many(commands, "read_pages", self._target(machine))
+        pages = []
+        for output, error in responses:
+            numbers = HEX_PATTERN.findall(output) if not error else []
+            pages.append(bytes(int(number, 16) for number in numbers) if len(numbers) == page_size else None)
+        return pages
+
+    def setup_logging(self, callback, max_batch=1000, flush_interval=0.02, prepare=None):
+        """
+        Makes Renode log to a temporary file and tails it, as `RenodeBridge.setup_logging`.
+
+        The log file is set up again after every reconnection.
+
+        Args:
+            callback (callable): The function to call with a list of log lines.
+            max_batch (int, optional): Maximum number of lines per callback. Defaults to 1000.
+            flush_interval (float, optional): Minimum time in seconds between two
+                partial batches. Defaults to 0.02.
+            prepare (callable, optional): A function applied to each batch before
+                the callback, on the log tailing thread.
+        """
+        def deliver(lines):
+            if prepare is not None:
+                try:
+                    lines = prepare(lines)
+                except Exception as e:
+                    logger.error(f"Failed to prepare log lines: {e}")
+                    return
+            self.loop.call_soon_threadsafe(callback, lines)
+
+        self._log_sink = deliver
+        fd, self.log_file_path = tempfile.mkstemp(prefix="renode_log_", suffix=".txt")
+        os.close(fd)
+        logger.info(f"Renode logging to: {self.log_file_path}")
+        self.log_tailer = LogTailer(self.log_file_path, deliver, max_batch=max_batch, flush_interval=flush_interval)
+        self.log_tailer.start()
+        if self.client.connected:
+            asyncio.ensure_future(self._attach_log_file())
+
+    async def _attach_log_file(self):
+        """
+        Tells Renode to log everything to the tailed file.
+        """
+        try:
+            responses = await self._execute_many([f"logFile {_path_token(self.log_file_path)}", "logLevel 0"], "setup_logging")
+        except ConnectionError as e:
+            logger.warning(f"Failed to set up the Renode log file: {e}")
+            return
+        for _, error in responses:
+            if error:
+                logger.error(f"Failed to setup logFile: {error}")
+
+    async def execute_batch(self, commands, stop_on_error=False) -> list:
+        """
+        Executes several monitor commands, pipelined in one write.
+
+        Their echo and output reach the Renode log as a single batch. With
+        `stop_on_error`, the commands are sent one at a time instead, since a
+        pipelined command cannot be withdrawn once an earlier one fails.
+
+        Args:
+            commands (list): The monitor commands, in order.
+            stop_on_error (bool, optional): Skip the remaining commands after a
+                command fails. Defaults to False.
+
+        Returns:
+            list: One (output, error) tuple per command; None for skipped commands.
+
+        Raises:
+            MonitorDisconnectedError: If the monitor is or gets disconnected.
+        """
+        context = self.client.context or "monitor"
+        if stop_on_error:
+            responses = []
+            failed = False
+            for command in commands:
+                if failed:
+                    responses.append(None)
+                    continue
+                responses.append(await self._execute(command, "execute_batch"))
+                failed = bool(responses[-1][1])
+        else:
+            responses = await self._execute_many(commands, "execute_batch")
+        lines = []
+        for command, response in zip(commands, responses):
+            if response is not None:
+                lines.append(f"({context}) {command}")
+                _append_response(lines, *response)
+        self._log(lines)
+        return responses
+
+    async def open_uart(self, uart, machine=None):
+        """
+        Exposes a UART on a TCP port of the Renode host.
+
+        The port is picked among the free ports of this host, which is the
+        Renode host too. A UART opened before keeps its terminal and port.
+
+        Args:
+            uart (str): The UART peripheral, e.g. "sysbus.uart0".
+            machine (str, optional): The machine of the UART. Defaults to None,
+                the current machine of the monitor.
+
+        Returns:
+            tuple: The (host, port) of the terminal.
+
+        Raises:
+            Exception: If Renode reports an error.
+        """
+        port, commands = self.uart_terminals.open_commands(uart, machine)
+        if commands:
+            errors = [error for _, error in await self._execute_on_machine(machine, commands, "open_uart") if error]
+            self.uart_terminals.opened(uart, machine, port, not errors)
+            if errors:
+                raise Exception(f"Renode Error: {errors[0]}")
+        return self.client.host, port
+
+    async def close_uart(self, uart, port, machine=None):
+        """
+        Disconnects a UART from the terminal opened by `open_uart`, which is
+        kept for the next `open_uart` of the UART.
+
+        Args:
+            uart (str): The UART peripheral.
+            port (int): The port of the terminal.
+            machine (str, optional): The machine of the UART. Defaults to None.
+        """
+        command = f"connector Disconnect {uart} {uart_terminal_name(port)}"
+        errors = [error for _, error in await self._execute_on_machine(machine, [command], "close_uart") if error]
+        self.uart_terminals.closed(uart, machine, not errors)
+        for error in errors:
+            logger.warning(f"Failed to disconnect {uart}: {error}")
+
+    def setup_watch_push(self, callback):
+        """
+        Accepts a push callback for interface compatibility; the socket monitor
+        cannot report bus writes, so it is never called.
+
+        Args:
+            callback (callable): Unused.
+        """
+
+    async def sync_watchpoints(self, requests) -> list:
+        """
+        Reports every push watch as polled, since watchpoints need the in-process backend.
+
+        Args:
+            requests (list): A list of (address, width, machine) tuples.
+
+        Returns:
+            list: False for every request.
+        """
+        return [False] * len(requests)
+
+    async def monitor_command(self, command: str):
+        """
+        Executes a monitor command, echoing it and its output to the Renode log.
+
+        Args:
+            command (str): The monitor command to execute.
+        """
+        logger.info(f"Executing monitor command: {command}")
+        try:
+            await self._execute_and_log(command, "monitor_command")
+        except Exception as e:
+            logger.error(f"Error executing monitor command: {e}")
+
+def _append_response(lines, output, error):
+    """
+    Appends the output and error of a command to log lines.
+
+    Args:
+        lines (list): The log lines.
+        output (str): The command output.
+        error (str): The command error.
+    """
+    if output:
+        lines.append(output.strip())
+    if error:
+        lines.append(f"Error: {error.strip()}")
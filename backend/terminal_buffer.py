@@ -0,0 +1,330 @@
+"""
+Terminal Buffer Module.
+
+This module turns the raw byte stream of a UART into lines of text for display.
+Bytes are fed in chunks as they arrive; the buffer decodes them incrementally,
+applies the control characters and ANSI escape sequences a serial console
+typically emits (carriage returns, backspaces, tabs, SGR colors, line and screen
+erasure, horizontal cursor moves) and collects the finished lines until the view
+takes them. Pending lines are held in a ring bounded by the scrollback size, so
+a burst of output larger than the scrollback costs no more to display than the
+scrollback itself. Full-screen cursor addressing is not emulated.
+"""
+
+import codecs
+import re
+from collections import deque
+
+# Default number of lines kept by a terminal.
+DEFAULT_SCROLLBACK = 10000
+# Control characters other than line feed, and escape sequences.
+CONTROL_PATTERN = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b[@-Z\\-_]|[\x00-\x09\x0b-\x1f\x7f]")
+# An incomplete escape sequence at the end of a chunk.
+PARTIAL_ESCAPE_PATTERN = re.compile(r"\x1b(?:\[[0-9;?]*[ -/]*)?\Z")
+TAB_WIDTH = 8
+# Lines longer than this are wrapped, so output without line feeds stays bounded.
+MAX_LINE_LENGTH = 4096
+
+class TerminalBuffer:
+    """
+    Applies a UART byte stream to a current line and a ring of finished lines.
+
+    A line is a (text, runs) tuple, where runs is a list of (start, color)
+    pairs marking where the foreground color changes; color is an SGR color
+    code (30-37, 90-97) or None for the default color. Lines without color
+    have no runs.
+    """
+
+    def __init__(self, scrollback=DEFAULT_SCROLLBACK):
+        """
+        Initializes the TerminalBuffer.
+
+        Args:
+            scrollback (int, optional): Maximum number of finished lines held
+                until taken. Defaults to 10000.
+        """
+        self.scrollback = scrollback
+        self.received = 0 # Bytes fed in total
+        self.dirty = False # Whether anything changed since the last `take`
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._escape = "" # An incomplete escape sequence held back
+        self._finished = deque(maxlen=scrollback)
+        self._dropped = 0
+        self._cleared = False
+        self._text = ""
+        self._runs = []
+        self._column = 0
+        self._color = None
+
+    def feed(self, data):
+        """
+        Applies a chunk of the byte stream.
+
+        Args:
+            data (bytes): The bytes received.
+        """
+        self.received += len(data)
+        text = self._escape + self._decoder.decode(data)
+        partial = PARTIAL_ESCAPE_PATTERN.search(text)
+        if partial is not None:
+            text, self._escape = text[:partial.start()], text[partial.start():]
+        else:
+            self._escape = ""
+        if not text:
+            return
+        self.dirty = True
+        text = text.replace("\r\n", "\n")
+        if CONTROL_PATTERN.search(text) is None:
+            # Plain text, the bulk of a boot log: whole lines at once
+            lines = text.split("\n")
+            self._write(lines[0])
+            if len(lines) > 1:
+                self._new_line()
+                finish = self._finish_plain if self._color is None else self._finish_colored
+                for line in lines[1:-1]:
+                    finish(line)
+                self._write(lines[-1])
+            return
+        position = 0
+        for control in CONTROL_PATTERN.finditer(text):
+            self._write_lines(text[position:control.start()])
+            self._control(control.group())
+            position = control.end()
+        self._write_lines(text[position:])
+
+    def take(self):
+        """
+        Returns what changed since the last call.
+
+        Returns:
+            tuple: (cleared, lines, dropped, current): whether the screen was
+                cleared first, the finished lines, the number of finished lines
+                dropped from the ring before they were taken, and the current
+                (unfinished) line.
+        """
+        update = (self._cleared, list(self._finished), self._dropped, (self._text, list(self._runs)))
+        self._finished.clear()
+        self._dropped = 0
+        self._cleared = False
+        self.dirty = False
+        return update
+
+    def clear(self):
+        """
+        Drops all lines, as an ANSI screen clear does.
+        """
+        self._finished.clear()
+        self._dropped = 0
+        self._cleared = True
+        self._text = ""
+        self._runs = []
+        self._column = 0
+        self.dirty = True
+
+    def _finish(self, line):
+        """
+        Adds a finished line to the ring.
+
+        Args:
+            line (tuple): The (text, runs) line.
+        """
+        if len(self._finished) == self.scrollback:
+            self._dropped += 1
+        self._finished.append(line)
+
+    def _finish_plain(self, text):
+        """
+        Adds a finished line without color.
+
+        Args:
+            text (str): The line text.
+        """
+        self._finish((text, []))
+
+    def _finish_colored(self, text):
+        """
+        Adds a finished line in the current color.
+
+        Args:
+            text (str): The line text.
+        """
+        self._finish((text, [(0, self._color)]))
+
+    def _new_line(self):
+        """
+        Finishes the current line and starts an empty one.
+        """
+        self._finish((self._text, self._runs))
+        self._text = ""
+        self._runs = []
+        self._column = 0
+
+    def _write_lines(self, text):
+        """
+        Writes text that may contain line feeds.
+
+        Args:
+            text (str): The text, without other control characters.
+        """
+        if not text:
+            return
+        lines = text.split("\n")
+        self._write(lines[0])
+        for line in lines[1:]:
+            self._new_line()
+            self._write(line)
+
+    def _write(self, text):
+        """
+        Writes printable text at the cursor, overwriting what is there.
+
+        Args:
+            text (str): The text, without control characters.
+        """
+        if not text:
+            return
+        length = len(self._text)
+        if self._column > length:
+            self._append(" " * (self._column - length), None)
+            length = self._column
+        if self._column == length:
+            self._append(text, self._color)
+        else:
+            colors = self._colors()
+            end = self._column + len(text)
+            colors[self._column:end] = [self._color] * len(text)
+            self._text = self._text[:self._column] + text + self._text[end:]
+            self._runs = _compress(colors)
+        self._column += len(text)
+        if len(self._text) >= MAX_LINE_LENGTH:
+            self._new_line()
+
+    def _append(self, text, color):
+        """
+        Appends text to the current line in a color.
+
+        Args:
+            text (str): The text.
+            color (int): The SGR color code, or None.
+        """
+        current = self._runs[-1][1] if self._runs else None
+        if color != current:
+            if self._runs and self._runs[-1][0] == len(self._text):
+                self._runs.pop()
+            if not self._runs or self._runs[-1][1] != color:
+                self._runs.append((len(self._text), color))
+        self._text += text
+
+    def _colors(self):
+        """
+        Returns the color of every character of the current line.
+
+        Returns:
+            list: One SGR color code (or None) per character.
+        """
+        colors = [None] * len(self._text)
+        bounds = self._runs + [(len(self._text), None)]
+        for (start, color), (end, _) in zip(bounds, bounds[1:]):
+            colors[start:end] = [color] * (end - start)
+        return colors
+
+    def _truncate(self, end):
+        """
+        Cuts the current line at a column.
+
+        Args:
+            end (int): The new line length.
+        """
+        self._text = self._text[:end]
+        self._runs = [run for run in self._runs if run[0] < end]
+
+    def _control(self, sequence):
+        """
+        Applies a control character or escape sequence.
+
+        Args:
+            sequence (str): The control character or escape sequence.
+        """
+        if sequence == "\r":
+            self._column = 0
+        elif sequence == "\b":
+            self._column = max(self._column - 1, 0)
+        elif sequence == "\t":
+            self._write(" " * (TAB_WIDTH - self._column % TAB_WIDTH))
+        elif sequence == "\x0c" or sequence == "\x1bc":
+            self.clear()
+        elif sequence.startswith("\x1b["):
+            self._csi(sequence[2:-1], sequence[-1])
+
+    def _csi(self, parameters, command):
+        """
+        Applies a CSI escape sequence.
+
+        Args:
+            parameters (str): The parameter characters.
+            command (str): The final character.
+        """
+        numbers = [int(p) if p.isdigit() else 0 for p in parameters.lstrip("?").split(";")]
+        count = max(numbers[0], 1)
+        if command == "m":
+            self._sgr(numbers)
+        elif command == "K":
+            if numbers[0] == 0:
+                self._truncate(self._column)
+            else:
+                # Erase to the start of the line (1) or the whole line (2)
+                tail = self._text[self._column:] if numbers[0] == 1 else ""
+                colors = self._colors()[self._column:] if numbers[0] == 1 else []
+                self._text = " " * self._column + tail
+                self._runs = _compress([None] * self._column + colors)
+        elif command == "J":
+            if numbers[0] in (2, 3):
+                self.clear()
+        elif command == "D":
+            self._column = max(self._column - count, 0)
+        elif command == "C":
+            self._column += count
+        elif command == "G":
+            self._column = count - 1
+        elif command in ("H", "f") and numbers[0] <= 1:
+            self._column = max(numbers[1] - 1, 0) if len(numbers) > 1 else 0
+
+    def _sgr(self, numbers):
+        """
+        Applies the color changes of an SGR sequence.
+
+        Args:
+            numbers (list): The SGR parameters.
+        """
+        i = 0
+        while i < len(numbers):
+            code = numbers[i]
+            if code == 0 or code == 39:
+                self._color = None
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                self._color = code
+            elif code == 38:
+                # 256-color and RGB colors are shown in the default color
+                self._color = None
+                i += 2 if numbers[i + 1:i + 2] == [5] else 4
+            elif code == 48:
+                i += 2 if numbers[i + 1:i + 2] == [5] else 4
+            i += 1
+
+def _compress(colors):
+    """
+    Turns per-character colors into color runs.
+
+    Args:
+        colors (list): One SGR color code (or None) per character.
+
+    Returns:
+        list: (start, color) pairs; empty if every character has the default color.
+    """
+    runs = []
+    current = None
+    for i, color in enumerate(colors):
+        if color != current:
+            runs.append((i, color))
+            current = color
+    return runs
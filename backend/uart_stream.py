@@ -0,0 +1,236 @@
+"""
+UART Stream Module.
+
+This module connects UI terminals to emulated UARTs. Renode exposes a UART on a
+TCP port through a server socket terminal (`emulation CreateServerSocketTerminal`
+plus `connector Connect`); `UartStream` reads that socket on the asyncio loop
+and hands the bytes over in chunks of whatever size arrived, rather than one
+callback per character. Keystrokes are written back to the UART.
+"""
+
+import asyncio
+import logging
+import socket
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the socket per read call.
+READ_CHUNK_SIZE = 1 << 16
+# Attempts and delay between them when connecting to a just created terminal.
+CONNECT_ATTEMPTS = 20
+CONNECT_RETRY_DELAY = 0.05
+
+def free_port(host="127.0.0.1"):
+    """
+    Returns a TCP port that is currently free.
+
+    Args:
+        host (str, optional): The address to check. Defaults to "127.0.0.1".
+
+    Returns:
+        int: The port number.
+    """
+    with socket.socket() as probe:
+        probe.bind((host, 0))
+        return probe.getsockname()[1]
+
+def uart_terminal_name(port):
+    """
+    Returns the name of the Renode terminal serving a UART on a port.
+
+    Args:
+        port (int): The terminal's port.
+
+    Returns:
+        str: The terminal name, a valid monitor identifier.
+    """
+    return f"ui_uart_{port}"
+
+def uart_terminal_commands(uart, port):
+    """
+    Returns the monitor commands exposing a UART on a TCP port.
+
+    The UART is looked up on the machine selected in the monitor; the caller
+    selects the machine around the commands.
+
+    Args:
+        uart (str): The UART peripheral, e.g. "sysbus.uart0".
+        port (int): The port of the server socket terminal.
+
+    Returns:
+        list: The commands, to be run in order.
+    """
+    name = uart_terminal_name(port)
+    # emitConfig false: a raw byte stream without telnet negotiation
+    return [
+        f'emulation CreateServerSocketTerminal {port} "{name}" false',
+        f"connector Connect {uart} {name}",
+    ]
+
+class UartTerminalRegistry:
+    """
+    Remembers the Renode terminal opened for each UART, so that reopening a
+    UART reuses its terminal instead of adding another one to the emulation;
+    terminals stay in the emulation until it is cleared.
+    """
+
+    def __init__(self):
+        """
+        Initializes the UartTerminalRegistry.
+        """
+        self._terminals = {} # (machine, uart) -> [port, connected]
+
+    def open_commands(self, uart, machine):
+        """
+        Returns the port serving a UART and the monitor commands needed first.
+
+        Args:
+            uart (str): The UART peripheral.
+            machine (str): The machine of the UART, or None.
+
+        Returns:
+            tuple: The port and the commands to run on the UART's machine; no
+                commands if the UART is still connected to its terminal.
+        """
+        entry = self._terminals.get((machine, uart))
+        if entry is None:
+            port = free_port()
+            return port, uart_terminal_commands(uart, port)
+        port, connected = entry
+        return port, [] if connected else [f"connector Connect {uart} {uart_terminal_name(port)}"]
+
+    def opened(self, uart, machine, port, ok):
+        """
+        Records the outcome of the commands returned by `open_commands`.
+
+        Args:
+            uart (str): The UART peripheral.
+            machine (str): The machine of the UART, or None.
+            port (int): The port of the terminal.
+            ok (bool): Whether every command succeeded. On failure the terminal
+                is forgotten and the next open creates a new one.
+        """
+        if ok:
+            self._terminals[(machine, uart)] = [port, True]
+        else:
+            self._terminals.pop((machine, uart), None)
+
+    def closed(self, uart, machine, ok):
+        """
+        Records that a UART was disconnected from its terminal.
+
+        Args:
+            uart (str): The UART peripheral.
+            machine (str): The machine of the UART, or None.
+            ok (bool): Whether the disconnection succeeded. On failure, e.g.
+                because the terminal is gone, the terminal is forgotten.
+        """
+        entry = self._terminals.get((machine, uart))
+        if entry is None:
+            return
+        if ok:
+            entry[1] = False
+        else:
+            del self._terminals[(machine, uart)]
+
+    def clear(self):
+        """
+        Forgets every terminal, e.g. because the emulation was cleared.
+        """
+        self._terminals.clear()
+
+class UartStream:
+    """
+    The byte stream of a UART exposed on a TCP port.
+    """
+
+    def __init__(self, host, port, on_data, on_closed=None):
+        """
+        Initializes the UartStream.
+
+        Args:
+            host (str): The host of the terminal.
+            port (int): The port of the terminal.
+            on_data (callable): Called on the loop with each chunk of bytes received.
+            on_closed (callable, optional): Called on the loop when the stream ends.
+        """
+        self.host = host
+        self.port = port
+        self.on_data = on_data
+        self.on_closed = on_closed
+        self._writer = None
+        self._task = None
+
+    @property
+    def connected(self):
+        """
+        Returns whether the stream is open.
+
+        Returns:
+            bool: True while connected.
+        """
+        return self._writer is not None
+
+    async def open(self):
+        """
+        Connects to the terminal and starts reading.
+
+        Raises:
+            OSError: If the terminal cannot be reached.
+        """
+        for attempt in range(CONNECT_ATTEMPTS):
+            try:
+                reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                break
+            except OSError:
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(CONNECT_RETRY_DELAY)
+        self._task = asyncio.ensure_future(self._read_loop(reader))
+
+    async def _read_loop(self, reader):
+        """
+        Delivers the received chunks until the connection ends.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+        """
+        try:
+            while True:
+                chunk = await reader.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.on_data(chunk)
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"UART stream on port {self.port} failed: {e}")
+        finally:
+            self._close_writer()
+            if self.on_closed is not None:
+                self.on_closed()
+
+    def write(self, data):
+        """
+        Sends bytes to the UART.
+
+        Args:
+            data (bytes): The bytes, e.g. keystrokes.
+        """
+        if self._writer is not None:
+            self._writer.write(data)
+
+    def close(self):
+        """
+        Closes the stream without calling `on_closed`.
+        """
+        self.on_closed = None
+        if self._task is not None:
+            self._task.cancel()
+        self._close_writer()
+
+    def _close_writer(self):
+        """
+        Closes the connection's writer.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,244 @@
+"""
+Batch Runner Entry Point.
+
+This module runs many Renode scripts headlessly, without the Qt UI. Every script
+runs in its own worker process with its own emulation for a fixed amount of
+virtual time, while a set of watches is sampled at a fixed virtual-time interval.
+The emulation is paused right after its script is loaded, even if the script
+ends with `start`, so samples are taken at exact virtual times.
+Each run writes `<name>.json` with the watch traces and `<name>.log` with the
+Renode log to the output directory, and a `summary.json` lists all runs.
+
+Example:
+
+    python batch_runner.py tests/*.resc --watches watches.json --time 2.0 --workers 8
+
+The watches file is a JSON list of objects with 'address' (hex string or symbol
+name), 'name' and 'type' ("Byte", "HalfWord" or "Word") keys, and optionally the
+'machine' to read from in multi-machine scripts.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import traceback
+
+from backend.elf_symbols import load_script_symbols
+from backend.renode_wrapper import RenodeWrapper
+from backend.simulated_backend import SimulatedRenode, load_simulation
+
+# Number of bytes read for each watch type, as in `widgets.memory_watch` (not
+# imported here to keep the runner free of Qt).
+WATCH_TYPE_WIDTHS = {"Byte": 1, "HalfWord": 2, "Word": 4}
+# Default virtual time between two samples of the watches, in seconds.
+DEFAULT_SAMPLE_INTERVAL = 0.01
+DEFAULT_OUTPUT_DIR = "batch_results"
+
+def load_watches(path):
+    """
+    Reads watch definitions from a JSON file.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        list: A list of dicts with 'address', 'name', 'type' and 'machine' keys.
+
+    Raises:
+        ValueError: If a watch is malformed.
+    """
+    with open(path) as f:
+        watches = json.load(f)
+    for watch in watches:
+        if "address" not in watch:
+            raise ValueError(f"Watch without an address: {watch}")
+        watch.setdefault("type", "Word")
+        watch.setdefault("name", str(watch["address"]))
+        watch.setdefault("machine", None)
+        if watch["type"] not in WATCH_TYPE_WIDTHS:
+            raise ValueError(f"Unknown watch type: {watch['type']}")
+    return watches
+
+def resolve_watches(watches, script_path):
+    """
+    Resolves watch addresses, looking up symbol names in the script's ELF files.
+
+    Args:
+        watches (list): Watch dicts as returned by `load_watches`.
+        script_path (str): The script the watches apply to.
+
+    Returns:
+        list: (name, address, width, machine) tuples.
+
+    Raises:
+        ValueError: If an address is neither a number nor a known symbol.
+    """
+    symbols = None
+    resolved = []
+    for watch in watches:
+        address = watch["address"]
+        if isinstance(address, str):
+            try:
+                address = int(address, 16)
+            except ValueError:
+                if symbols is None:
+                    symbols = load_script_symbols(script_path)
+                found = symbols.address_of(address) if symbols is not None else None
+                if found is None:
+                    raise ValueError(f"Unknown symbol '{address}'")
+                address = found
+        resolved.append((watch["name"], address, WATCH_TYPE_WIDTHS[watch["type"]], watch["machine"]))
+    return resolved
+
+def run_scenario(job):
+    """
+    Runs one script in the current worker process and writes its results.
+
+    Args:
+        job (dict): The run description with 'name', 'script', 'watches',
+            'run_time', 'sample_interval', 'output_dir', 'simulate' and
+            'log_level' keys.
+
+    Returns:
+        dict: A summary with 'name', 'script', 'status', 'error', 'wall_time'
+            and 'result' (the path of the JSON result file).
+    """
+    logging.getLogger().setLevel(job["log_level"])
+    started = time.perf_counter()
+    base = os.path.join(job["output_dir"], job["name"])
+    result = {
+        "name": job["name"],
+        "script": job["script"],
+        "status": "ok",
+        "error": None,
+        "run_time": job["run_time"],
+        "sample_interval": job["sample_interval"],
+        "watches": [],
+        "times": [],
+        "values": {},
+    }
+
+    simulator = None
+    if job["simulate"] is not None:
+        simulator = load_simulation(job["simulate"]) if job["simulate"] else SimulatedRenode()
+    wrapper = RenodeWrapper(simulator=simulator)
+
+    # Lines arrive from the log tailer thread and from monitor command echoes
+    log_lock = threading.Lock()
+    log_file = open(base + ".log", "w")
+
+    def write_log(lines):
+        with log_lock:
+            log_file.write("\n".join(lines) + "\n")
+
+    wrapper.setup_logging(write_log)
+    try:
+        wrapper.load_script(job["script"])
+        # Scripts often end with `start`; stop free-running so that only
+        # `run_for` advances virtual time between samples
+        wrapper.pause()
+        watches = resolve_watches(job["watches"], job["script"])
+        result["watches"] = [{"name": name, "address": hex(address), "width": width, "machine": machine}
+                             for name, address, width, machine in watches]
+        # One read per machine and sample
+        groups = {}
+        for name, address, width, machine in watches:
+            requests, traces = groups.setdefault(machine, ([], []))
+            requests.append((address, width))
+            traces.append(result["values"].setdefault(name, []))
+
+        elapsed = 0.0
+        while True:
+            vtime = wrapper.virtual_time()
+            result["times"].append(vtime if vtime is not None else elapsed)
+            for machine, (requests, traces) in groups.items():
+                for trace, value in zip(traces, wrapper.read_many(requests, machine=machine)):
+                    trace.append(value)
+            if elapsed >= job["run_time"] - 1e-9:
+                break
+            step = min(job["sample_interval"], job["run_time"] - elapsed)
+            wrapper.run_for(step)
+            elapsed += step
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+        result["traceback"] = traceback.format_exc()
+    finally:
+        wrapper.cleanup()
+        log_file.close()
+
+    result["wall_time"] = time.perf_counter() - started
+    with open(base + ".json", "w") as f:
+        json.dump(result, f)
+    return {
+        "name": job["name"],
+        "script": job["script"],
+        "status": result["status"],
+        "error": result["error"],
+        "wall_time": result["wall_time"],
+        "result": base + ".json",
+    }
+
+def main():
+    """
+    Parses the command line, runs all scripts across a process pool and writes
+    the summary.
+
+    Returns:
+        int: The exit status: 0 if every run succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Run Renode scripts headlessly in parallel")
+    parser.add_argument("scripts", nargs="+", help="The .resc scripts to run")
+    parser.add_argument("--watches", help="JSON file with the watches to sample in every run")
+    parser.add_argument("--time", type=float, required=True, help="Virtual time to run each script for, in seconds")
+    parser.add_argument("--sample-interval", type=float, default=DEFAULT_SAMPLE_INTERVAL,
+                        help=f"Virtual time between watch samples, in seconds (default: {DEFAULT_SAMPLE_INTERVAL})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of runs executed in parallel (default: number of CPUs)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR,
+                        help=f"Directory receiving the result and log files (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--simulate", nargs="?", const="", metavar="CONFIG",
+                        help="Run against a synthetic Renode stand-in, optionally configured by a JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show informational messages from the workers")
+    args = parser.parse_args()
+
+    if args.sample_interval <= 0:
+        parser.error("--sample-interval must be positive")
+    watches = load_watches(args.watches) if args.watches else []
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = [{
+        "name": f"{index:03d}_{os.path.splitext(os.path.basename(script))[0]}",
+        "script": os.path.abspath(script),
+        "watches": watches,
+        "run_time": args.time,
+        "sample_interval": args.sample_interval,
+        "output_dir": args.output_dir,
+        "simulate": args.simulate,
+        "log_level": logging.INFO if args.verbose else logging.WARNING,
+    } for index, script in enumerate(args.scripts)]
+
+    # Spawned workers running one task each: every run gets a fresh process and
+    # thus its own .NET runtime and emulation
+    started = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    summaries = []
+    with context.Pool(processes=max(1, min(args.workers, len(jobs))), maxtasksperchild=1) as pool:
+        for summary in pool.imap_unordered(run_scenario, jobs):
+            summaries.append(summary)
+            status = summary["status"] if summary["error"] is None else f"{summary['status']}: {summary['error']}"
+            print(f"[{len(summaries)}/{len(jobs)}] {summary['name']} {summary['wall_time']:.2f}s {status}")
+
+    summaries.sort(key=lambda summary: summary["name"])
+    with open(os.path.join(args.output_dir, "summary.json"), "w") as f:
+        json.dump({"wall_time": time.perf_counter() - started, "runs": summaries}, f, indent=2)
+    failed = sum(summary["status"] != "ok" for summary in summaries)
+    print(f"{len(summaries) - failed} passed, {failed} failed in {time.perf_counter() - started:.2f}s")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+"""
+Benchmark Suite.
+
+This script measures the hot paths of the UI headlessly (Qt "offscreen" platform)
+against the mock `RenodeWrapper`, or a `SimulatedRenode` with `--simulate`:
+
+*   `RenodeBridge` call overhead and latency, and monitor commands one by one
+    against one `execute_batch`.
+*   `MainWindow.monitor_loop` time to refresh every watch, against the watch count.
+*   `LogTailer` line throughput and end-to-end latency into a `LogView`.
+*   `LogStore` parsing throughput, filtering and search time.
+*   `MemoryWatchWidget` model update cost.
+*   `UartTerminal` throughput on a boot-log-like byte stream.
+*   `MonitorClient` round trips to a fake socket monitor, one by one and pipelined.
+
+Results are written as JSON so that runs can be compared, e.g.:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import re
+import statistics
+import subprocess
+import tempfile
+import time
+
+from PySide6.QtWidgets import QApplication
+from qasync import QEventLoop
+
+from backend.async_bridge import RenodeBridge
+from backend.command_executor import PRIORITY_USER
+from backend.fake_monitor import FakeMonitorServer
+from backend.log_store import LogStore
+from backend.log_tail import LogTailer
+from backend.monitor_client import MonitorClient
+from backend.simulated_backend import SimulatedRenode, load_simulation
+from main_window import MainWindow
+from widgets.log_view import LogView
+from widgets.memory_watch import MemoryWatchWidget
+from widgets.uart_terminal import UartTerminal
+
+def summarize(samples):
+    """
+    Summarizes a list of durations.
+
+    Args:
+        samples (list): Durations in seconds.
+
+    Returns:
+        dict: Count, mean, p50, p99 and max, in milliseconds.
+    """
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def make_watches(count):
+    """
+    Builds a list of contiguous word watches.
+
+    Args:
+        count (int): The number of watches.
+
+    Returns:
+        list: Watch dicts accepted by `WatchTableModel.add_watches`.
+    """
+    return [{"address": 0x80000000 + 4 * i, "name": f"w{i}", "type": "Word"} for i in range(count)]
+
+async def bench_bridge(bridge, calls):
+    """
+    Measures the round trip of bridge calls.
+
+    Args:
+        bridge (RenodeBridge): The bridge under test.
+        calls (int): The number of calls per measurement.
+
+    Returns:
+        dict: Latency summaries for a no-op call and for `read_many`, and the
+            time of 100 monitor commands sent one by one and as one batch.
+    """
+    noop = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await bridge._call(PRIORITY_USER, lambda: None, name="noop")
+        noop.append(time.perf_counter() - start)
+
+    reads = {}
+    for size in (1, 64, 1024):
+        requests = [(0x80000000 + 4 * i, 4) for i in range(size)]
+        samples = []
+        for _ in range(max(calls // 20, 5)):
+            start = time.perf_counter()
+            await bridge.read_many(requests)
+            samples.append(time.perf_counter() - start)
+        reads[str(size)] = summarize(samples)
+
+    commands = [f"sysbus ReadDoubleWord {hex(0x80000000 + 4 * i)}" for i in range(100)]
+    start = time.perf_counter()
+    for command in commands:
+        await bridge.monitor_command(command)
+    one_by_one = time.perf_counter() - start
+    start = time.perf_counter()
+    await bridge.execute_batch(commands)
+    batch = time.perf_counter() - start
+    return {"noop_call": summarize(noop), "read_many": reads,
+            "monitor_100": {"one_by_one_ms": one_by_one * 1000, "batch_ms": batch * 1000}}
+
+async def bench_monitor_loop(window, counts):
+    """
+    Measures how long the polling loop takes to refresh every watch once.
+
+    Args:
+        window (MainWindow): The window under test.
+        counts (list): The watch counts to measure.
+
+    Returns:
+        dict: Maps each watch count to the full-refresh time in milliseconds.
+    """
+    results = {}
+    model = window.memory_watch.model
+    for count in counts:
+        model.remove_rows(range(model.rowCount()))
+        model.add_watches(make_watches(count))
+        window.poll_budget = count
+        start = time.perf_counter()
+        task = asyncio.create_task(window.monitor_loop())
+        while not all(model.valid):
+            await asyncio.sleep(0.001)
+        results[str(count)] = (time.perf_counter() - start) * 1000
+        task.cancel()
+        await task
+    model.remove_rows(range(model.rowCount()))
+    return results
+
+async def bench_log(lines):
+    """
+    Measures log tailing throughput and end-to-end latency into a LogView.
+
+    Lines are written to a temporary file, tailed by `LogTailer`, posted to the
+    loop with `call_soon_threadsafe` (as `RenodeBridge.setup_logging` does) and
+    appended to a `LogView`; latency is measured up to the view's flush.
+
+    Args:
+        lines (int): The number of lines in the throughput run.
+
+    Returns:
+        dict: Throughput in lines per second and latency summary.
+    """
+    loop = asyncio.get_running_loop()
+    view = LogView()
+    received = [0]
+    marks = {}
+
+    def on_lines(batch):
+        received[0] += len(batch)
+        view.append_lines(batch)
+        for line in batch:
+            if line.startswith("mark "):
+                marks[line] = time.perf_counter()
+
+    fd, path = tempfile.mkstemp(prefix="bench_log_", suffix=".txt")
+    os.close(fd)
+    tailer = LogTailer(path, lambda batch: loop.call_soon_threadsafe(on_lines, batch))
+    tailer.start()
+    try:
+        with open(path, "a") as f:
+            start = time.perf_counter()
+            for i in range(lines):
+                f.write(f"12:00:00.0000 [INFO] sysbus.uart: benchmark line {i}\n")
+            f.flush()
+            while received[0] < lines:
+                await asyncio.sleep(0.001)
+            throughput = lines / (time.perf_counter() - start)
+
+            latencies = []
+            for i in range(50):
+                mark = f"mark {i}"
+                sent = time.perf_counter()
+                f.write(mark + "\n")
+                f.flush()
+                while mark not in marks:
+                    await asyncio.sleep(0.0005)
+                while view.pending:
+                    await asyncio.sleep(0.0005)
+                latencies.append(time.perf_counter() - sent)
+                await asyncio.sleep(0.005)
+    finally:
+        tailer.stop()
+        os.remove(path)
+    return {"lines": lines, "throughput_lines_per_s": throughput, "end_to_end": summarize(latencies)}
+
+def bench_log_store(lines):
+    """
+    Measures parsing, filtering and searching of Renode log lines in a LogStore.
+
+    Args:
+        lines (int): The number of lines stored.
+
+    Returns:
+        dict: Append throughput in lines per second, and the time of a level
+            filter, a combined level/machine/source filter and a regex search,
+            in milliseconds.
+    """
+    levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
+    text = [f"12:00:00.{i % 10000:04d} [{levels[i % 4]}] machine-{i % 2}/sysbus.uart{i % 8}: benchmark line {i}"
+            for i in range(lines)]
+    store = LogStore(capacity=lines)
+    start = time.perf_counter()
+    for offset in range(0, lines, 1000):
+        store.append(text[offset:offset + 1000])
+    throughput = lines / (time.perf_counter() - start)
+
+    timings = {}
+    for name, run in (
+            ("level_filter_ms", lambda: store.select(levels=["ERROR"])),
+            ("combined_filter_ms", lambda: store.select(levels=["WARNING", "ERROR"], machine="machine-1",
+                                                         sources=["sysbus.uart3"])),
+            ("regex_search_ms", lambda: store.search(re.compile(r"line 12\d{3}$")))):
+        start = time.perf_counter()
+        run()
+        timings[name] = (time.perf_counter() - start) * 1000
+    return {"lines": lines, "append_lines_per_s": throughput, **timings}
+
+def bench_watch_updates(counts):
+    """
+    Measures the cost of applying a poll result to the watch model.
+
+    Args:
+        counts (list): The watch counts to measure.
+
+    Returns:
+        dict: Per watch count, update time in milliseconds with all values
+            changed and with no value changed.
+    """
+    app = QApplication.instance()
+    results = {}
+    for count in counts:
+        widget = MemoryWatchWidget()
+        widget.show()
+        model = widget.model
+        model.add_watches(make_watches(count))
+        rows = list(range(count))
+        model.update_rows(rows, [0] * count)
+        app.processEvents()
+
+        start = time.perf_counter()
+        model.update_rows(rows, list(range(1, count + 1)))
+        app.processEvents()
+        changed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model.update_rows(rows, list(range(1, count + 1)))
+        app.processEvents()
+        unchanged = time.perf_counter() - start
+
+        results[str(count)] = {"all_changed_ms": changed * 1000, "unchanged_ms": unchanged * 1000}
+        widget.close()
+        widget.deleteLater()
+    return results
+
+def bench_uart_terminal(size, chunk_size=4096, chunks_per_frame=16):
+    """
+    Measures how fast a UART terminal consumes a boot log, including repaints.
+
+    The log mixes plain kernel messages with colored status lines and carriage
+    return progress updates. It arrives in chunks, with one view update every
+    `chunks_per_frame` chunks, as the frame timer would coalesce them.
+
+    Args:
+        size (int): The log size in bytes.
+        chunk_size (int, optional): The bytes per chunk. Defaults to 4096.
+        chunks_per_frame (int, optional): The chunks between two view updates.
+
+    Returns:
+        dict: Throughput in MiB per second and the slowest view update in milliseconds.
+    """
+    app = QApplication.instance()
+    lines = []
+    for i in range(size // 40 + 1):
+        if i % 16 == 15:
+            lines.append(f"[  \x1b[32mOK\x1b[0m  ] Started service {i}.\r\n")
+        elif i % 64 == 63:
+            lines.append(f"Loading {i}: 10%\r Loading {i}: 100%\r\n")
+        else:
+            lines.append(f"[{i * 0.000731:12.6f}] kernel: probing device {i % 97} at bus {i % 7}\r\n")
+    data = "".join(lines).encode()[:size]
+    terminal = UartTerminal("bench")
+    terminal.show()
+    app.processEvents()
+    slowest = 0.0
+    start = time.perf_counter()
+    for i, offset in enumerate(range(0, len(data), chunk_size), 1):
+        terminal.buffer.feed(data[offset:offset + chunk_size])
+        if i % chunks_per_frame == 0:
+            frame = time.perf_counter()
+            terminal.flush()
+            app.processEvents()
+            slowest = max(slowest, time.perf_counter() - frame)
+    terminal.flush()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    terminal.close()
+    terminal.deleteLater()
+    return {"bytes": len(data), "throughput_mib_per_s": len(data) / elapsed / (1 << 20), "max_update_ms": slowest * 1000}
+
+async def bench_monitor_socket(reads):
+    """
+    Measures monitor reads over a socket, one round trip each and pipelined.
+
+    Args:
+        reads (int): The number of reads.
+
+    Returns:
+        dict: Time of the reads issued one after the other and written at once,
+            in milliseconds.
+    """
+    server = FakeMonitorServer(SimulatedRenode(latency=0))
+    await server.start()
+    client = MonitorClient("127.0.0.1", server.port)
+    client.start()
+    await client.wait_connected()
+    commands = [f"sysbus ReadDoubleWord {hex(0x80000000 + 4 * (i % 1024))}" for i in range(reads)]
+    try:
+        start = time.perf_counter()
+        for command in commands:
+            await client.execute(command)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await client.execute_many(commands)
+        pipelined = time.perf_counter() - start
+    finally:
+        client.close()
+        await server.close()
+    return {"reads": reads, "sequential_ms": sequential * 1000, "pipelined_ms": pipelined * 1000}
+
+def git_revision():
+    """
+    Returns the current git commit, if available.
+
+    Returns:
+        str: The commit hash, or None.
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(current, baseline, path=""):
+    """
+    Prints the ratio of every numeric result against a baseline run.
+
+    Args:
+        current (dict): The current results.
+        baseline (dict): The baseline results.
+        path (str, optional): The key path, used for recursion.
+    """
+    for key, value in current.items():
+        old = baseline.get(key) if isinstance(baseline, dict) else None
+        name = f"{path}.{key}" if path else key
+        if isinstance(value, dict):
+            compare(value, old or {}, name)
+        elif isinstance(value, (int, float)) and isinstance(old, (int, float)) and old:
+            print(f"{name:60s} {old:12.3f} -> {value:12.3f}  ({value / old:5.2f}x)")
+
+def main():
+    """
+    Runs the benchmarks and writes the results.
+    """
+    parser = argparse.ArgumentParser(description="Renode UI benchmark suite")
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON results file")
+    parser.add_argument("--compare", help="Baseline JSON results file to compare against")
+    parser.add_argument("--quick", action="store_true", help="Use smaller sizes for a fast smoke run")
+    parser.add_argument("--simulate", metavar="CONFIG",
+                        help="Benchmark against a SimulatedRenode configured by this JSON file instead of the mock")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    watch_counts = [100, 1000] if args.quick else [100, 1000, 10000]
+    update_counts = [1000, 10000] if args.quick else [1000, 10000, 100000]
+
+    app = QApplication(sys.argv)
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
+    async def run():
+        simulator = load_simulation(args.simulate) if args.simulate else None
+        bridge = RenodeBridge(simulator=simulator)
+        window = MainWindow(bridge)
+        logging.getLogger().removeHandler(window.log_handler)
+        results = {
+            "bridge": await bench_bridge(bridge, 200 if args.quick else 2000),
+            "monitor_loop_full_refresh_ms": await bench_monitor_loop(window, watch_counts),
+            "log": await bench_log(20000 if args.quick else 200000),
+            "log_store": bench_log_store(20000 if args.quick else 200000),
+            "monitor_socket": await bench_monitor_socket(200 if args.quick else 2000),
+            "watch_updates": bench_watch_updates(update_counts),
+            "uart_terminal": bench_uart_terminal(1 << 20 if args.quick else 8 << 20),
+            "call_metrics": bridge.metrics.snapshot(),
+        }
+        bridge.close()
+        return results
+
+    with loop:
+        results = loop.run_until_complete(run())
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "simulate": args.simulate,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
+
+if __name__ == "__main__":
+    main()
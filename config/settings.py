@@ -0,0 +1,208 @@
+"""
+Settings Module.
+
+This module persists the UI session (the last loaded script and the watch list)
+as JSON, and imports and exports watch lists as JSON or CSV files. Watches are
+exchanged as plain dicts with 'address', 'name', 'type', 'mode', 'interval' and
+'machine' keys, so whole lists can be handed to `WatchTableModel.add_watches`
+in one call.
+"""
+
+import csv
+import json
+import logging
+import math
+import os
+
+logger = logging.getLogger(__name__)
+
+SESSION_VERSION = 1
+DEFAULT_SESSION_PATH = os.path.join(os.path.expanduser("~"), ".config", "renode-ui", "session.json")
+# Columns of exported CSV files, in order. Only 'address' is required on import.
+WATCH_FIELDS = ["address", "name", "type", "mode", "interval", "machine"]
+# Values of optional fields missing from imported watches.
+WATCH_DEFAULTS = {"type": "Word", "mode": "Poll", "interval": 0.5, "machine": ""}
+# Accepted types and modes, as in `widgets.memory_watch` (not imported here to
+# keep this module free of Qt).
+WATCH_TYPES = ("Byte", "HalfWord", "Word")
+WATCH_MODES = ("Poll", "Push")
+# Watch addresses are stored as unsigned 64-bit values.
+ADDRESS_LIMIT = 1 << 64
+
+def parse_watch(record, symbols=None):
+    """
+    Validates and normalizes a watch read from a file.
+
+    Args:
+        record (dict): The raw watch; values may be strings, as read from CSV.
+        symbols (SymbolTable, optional): Symbols used to resolve non-numeric addresses.
+
+    Returns:
+        dict: The watch with an int 'address', a float 'interval' and all
+            `WATCH_FIELDS` present.
+
+    Raises:
+        ValueError: If the watch is invalid.
+    """
+    address = record.get("address")
+    if isinstance(address, str):
+        # As in the add dialog: a symbol name first, then a hex number
+        text = address.strip()
+        found = symbols.address_of(text) if symbols is not None else None
+        if found is not None:
+            address = found
+            if not record.get("name"):
+                record = dict(record, name=text)
+        else:
+            try:
+                address = int(text, 16)
+            except ValueError:
+                raise ValueError(f"Invalid address '{text}'") from None
+    elif not isinstance(address, int):
+        raise ValueError(f"Invalid address {address!r}")
+    if not 0 <= address < ADDRESS_LIMIT:
+        raise ValueError(f"Address {address:#x} outside the 64-bit address space")
+    watch = {"address": address, "name": record.get("name") or ""}
+    for field, default in WATCH_DEFAULTS.items():
+        value = record.get(field)
+        watch[field] = default if value is None or value == "" else value
+    if watch["type"] not in WATCH_TYPES:
+        raise ValueError(f"Unknown watch type '{watch['type']}'")
+    if watch["mode"] not in WATCH_MODES:
+        raise ValueError(f"Unknown watch mode '{watch['mode']}'")
+    watch["interval"] = float(watch["interval"])
+    if not math.isfinite(watch["interval"]) or watch["interval"] <= 0:
+        raise ValueError(f"Invalid interval {watch['interval']}")
+    return watch
+
+def parse_watches(records, symbols=None):
+    """
+    Validates and normalizes a list of watches.
+
+    Args:
+        records (list): The raw watches.
+        symbols (SymbolTable, optional): Symbols used to resolve non-numeric addresses.
+
+    Returns:
+        list: The normalized watches.
+
+    Raises:
+        ValueError: If a watch is invalid; the message gives its position.
+    """
+    watches = []
+    for number, record in enumerate(records, 1):
+        try:
+            watches.append(parse_watch(record, symbols))
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValueError(f"Watch {number}: {e}") from None
+    return watches
+
+def import_watches(path, symbols=None):
+    """
+    Reads watches from a JSON or CSV file.
+
+    JSON files hold a list of watch objects, or a session with a 'watches' list.
+    CSV files have a header row naming the columns (see `WATCH_FIELDS`). The
+    format is chosen by the file extension.
+
+    Args:
+        path (str): The file path.
+        symbols (SymbolTable, optional): Symbols used to resolve non-numeric addresses.
+
+    Returns:
+        list: The normalized watches.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file or one of its watches is invalid.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or "address" not in reader.fieldnames:
+                raise ValueError("CSV file has no 'address' column")
+            return parse_watches(reader, symbols)
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("watches", [])
+    if not isinstance(data, list):
+        raise ValueError("JSON file holds no watch list")
+    return parse_watches(data, symbols)
+
+def export_watches(path, watches):
+    """
+    Writes watches to a JSON or CSV file, chosen by the file extension.
+
+    Addresses are written as hex strings.
+
+    Args:
+        path (str): The file path.
+        watches (list): Watch dicts with the `WATCH_FIELDS` keys.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    rows = [dict(watch, address=hex(watch["address"])) for watch in watches]
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=WATCH_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        _write_json(path, rows)
+
+def load_session(path=DEFAULT_SESSION_PATH):
+    """
+    Reads a saved session.
+
+    Args:
+        path (str, optional): The session file. Defaults to `DEFAULT_SESSION_PATH`.
+
+    Returns:
+        dict: 'script' (path or None) and 'watches' (normalized watch list), or
+            None if there is no usable session.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return {"script": data.get("script"), "watches": parse_watches(data.get("watches", []))}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable session {path}: {e}")
+        return None
+
+def save_session(script, watches, path=DEFAULT_SESSION_PATH):
+    """
+    Saves the session, replacing the file atomically.
+
+    Args:
+        script (str): The loaded script path, or None.
+        watches (list): Watch dicts with the `WATCH_FIELDS` keys.
+        path (str, optional): The session file. Defaults to `DEFAULT_SESSION_PATH`.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    _write_json(path, {
+        "version": SESSION_VERSION,
+        "script": script,
+        "watches": [dict(watch, address=hex(watch["address"])) for watch in watches],
+    })
+
+def _write_json(path, data):
+    """
+    Writes JSON to a file through a temporary file, creating the directory.
+
+    Args:
+        path (str): The file path.
+        data (object): The JSON-serializable data.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(temporary, path)
@@ -6,12 +6,24 @@ using `qasync`, and launches the main window. It also handles command-line argum
 for configuring the Renode system bus.
 """
 
+import time
+STARTED_AT = time.perf_counter()
+
 import sys
 import asyncio
 from PySide6.QtWidgets import QApplication
 from qasync import QEventLoop
-from main_window import MainWindow
+from main_window import MainWindow, DEFAULT_POLL_BUDGET
 from backend.async_bridge import RenodeBridge
+from backend.log_store import DEFAULT_LOG_CAPACITY
+from backend.metrics import MetricsExporter, DEFAULT_EXPORT_INTERVAL, EXPORT_FORMATS
+from backend.monitor_client import DEFAULT_MONITOR_PORT
+from backend.profiler import SamplingProfiler, DEFAULT_PROFILE_DIR, DEFAULT_PROFILE_INTERVAL
+from backend.simulated_backend import SimulatedRenode, load_simulation
+from backend.snapshot_cache import SnapshotCache, DEFAULT_SNAPSHOT_CACHE_BYTES
+from backend.socket_bridge import SocketRenodeBridge
+from config.settings import DEFAULT_SESSION_PATH
+from widgets.log_view import DEFAULT_MAX_LINES
 import argparse
 
 def main():
@@ -29,6 +41,42 @@ def main():
     parser = argparse.ArgumentParser(description="Pacer UI application")
     parser.add_argument("--sys-bus-params", type=str,
                         help="Comma-separated key=value pairs for system bus parameters (e.g., 'key1=value1,key2=value2')")
+    parser.add_argument("--log-lines", type=int, default=DEFAULT_MAX_LINES,
+                        help=f"Maximum number of lines kept in the application log view (default: {DEFAULT_MAX_LINES})")
+    parser.add_argument("--renode-log-lines", type=int, default=DEFAULT_LOG_CAPACITY,
+                        help=f"Maximum number of Renode log lines kept (default: {DEFAULT_LOG_CAPACITY})")
+    parser.add_argument("--poll-budget", type=int, default=DEFAULT_POLL_BUDGET,
+                        help=f"Maximum number of watches read per polling cycle (default: {DEFAULT_POLL_BUDGET})")
+    parser.add_argument("--simulate", nargs="?", const="", metavar="CONFIG",
+                        help="Run against a synthetic Renode stand-in instead of Renode, optionally "
+                             "configured by a JSON file (see backend/simulated_backend.py)")
+    parser.add_argument("--transport", choices=("inprocess", "socket"), default="inprocess",
+                        help="Host Renode in this process, or drive a Renode started with --port over "
+                             "its socket monitor (default: inprocess)")
+    parser.add_argument("--monitor-host", default="localhost",
+                        help="Host of the Renode socket monitor (default: localhost)")
+    parser.add_argument("--monitor-port", type=int, default=DEFAULT_MONITOR_PORT,
+                        help=f"Port of the Renode socket monitor (default: {DEFAULT_MONITOR_PORT})")
+    parser.add_argument("--snapshot-cache-mb", type=int, default=DEFAULT_SNAPSHOT_CACHE_BYTES >> 20,
+                        help="Disk space for snapshots used to reset without reloading the script; "
+                             f"0 disables them (default: {DEFAULT_SNAPSHOT_CACHE_BYTES >> 20})")
+    parser.add_argument("--metrics-export", metavar="PATH",
+                        help="Periodically write call latency metrics to this file")
+    parser.add_argument("--metrics-format", choices=EXPORT_FORMATS,
+                        help="Format of the metrics file (default: prometheus for .prom files, json otherwise)")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_EXPORT_INTERVAL,
+                        help=f"Seconds between two metrics exports (default: {DEFAULT_EXPORT_INTERVAL:g})")
+    parser.add_argument("--session", default=DEFAULT_SESSION_PATH,
+                        help=f"Session file restored at startup and saved at exit (default: {DEFAULT_SESSION_PATH})")
+    parser.add_argument("--no-session", action="store_true",
+                        help="Neither restore nor save the session")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the UI loop and all worker threads from startup until exit "
+                             "(also available from the Tools menu)")
+    parser.add_argument("--profile-dir", default=DEFAULT_PROFILE_DIR,
+                        help=f"Directory receiving the collapsed-stack profiles (default: {DEFAULT_PROFILE_DIR})")
+    parser.add_argument("--profile-interval", type=float, default=DEFAULT_PROFILE_INTERVAL * 1000,
+                        help=f"Milliseconds between two profiler samples (default: {DEFAULT_PROFILE_INTERVAL * 1000:g})")
     args = parser.parse_args()
 
     sys_bus_params = {}
@@ -41,18 +89,43 @@ def main():
                 print(f"Warning: Invalid system bus parameter format: {param}. Skipping.")
 
 
+    profiler = SamplingProfiler(interval=args.profile_interval / 1000, directory=args.profile_dir)
+    if args.profile:
+        profiler.start()
+
     app = QApplication(sys.argv)
     from styles import DARK_THEME_QSS
     app.setStyleSheet(DARK_THEME_QSS)
     loop = QEventLoop(app)
     asyncio.set_event_loop(loop)
 
-    bridge = RenodeBridge(sys_bus_params=sys_bus_params)
-    window = MainWindow(bridge)
+    simulator = None
+    if args.simulate is not None:
+        simulator = load_simulation(args.simulate) if args.simulate else SimulatedRenode()
+
+    snapshot_cache = SnapshotCache(max_bytes=args.snapshot_cache_mb << 20) if args.snapshot_cache_mb > 0 else None
+
+    if args.transport == "socket":
+        bridge = SocketRenodeBridge(args.monitor_host, args.monitor_port)
+    else:
+        bridge = RenodeBridge(sys_bus_params=sys_bus_params, simulator=simulator, snapshot_cache=snapshot_cache)
+    window = MainWindow(bridge, log_max_lines=args.log_lines, poll_budget=args.poll_budget, started_at=STARTED_AT,
+                        profiler=profiler, session_path=None if args.no_session else args.session,
+                        renode_log_capacity=args.renode_log_lines)
     window.show()
 
+    exporter = None
+    if args.metrics_export:
+        exporter = MetricsExporter(bridge.metrics, args.metrics_export, args.metrics_format, args.metrics_interval)
+        exporter.start()
+
     with loop:
         loop.run_forever()
 
+    bridge.close()
+    if exporter is not None:
+        exporter.stop()
+    profiler.stop()
+
 if __name__ == "__main__":
     main()
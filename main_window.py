@@ -8,17 +8,45 @@ the communication with the Renode backend via the bridge.
 
 import asyncio
 import logging
-from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QFileDialog, QMessageBox, QTextEdit, QTabWidget, QLineEdit
-from PySide6.QtGui import QFont
-
+import os
+import time
+from PySide6.QtCore import Qt, QObject, Signal
+from PySide6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QFileDialog, QMessageBox, QTabWidget, QComboBox, QInputDialog
+from PySide6.QtGui import QAction
+
+from backend.command_executor import StaleRequestError
+from backend.elf_symbols import load_script_symbols
+from backend.log_store import LogStore, DEFAULT_LOG_CAPACITY
+from backend.monitor_client import MonitorDisconnectedError
+from backend.poll_scheduler import PollScheduler
+from backend.profiler import SamplingProfiler
+from backend.uart_stream import UartStream
+from config.settings import load_session, save_session
 from widgets.memory_watch import MemoryWatchWidget
+from widgets.log_view import LogView, DEFAULT_MAX_LINES
+from widgets.monitor_input import MonitorInput
+from widgets.renode_log_view import RenodeLogView
+from widgets.performance_view import PerformanceView
+from widgets.uart_terminal import UartTerminal
+from widgets.hex_viewer import MemoryViewerWidget
+
+# Seconds between watchpoint re-synchronizations, to pick up demoted push watches.
+WATCHPOINT_RESYNC_INTERVAL = 2.0
+# Bounds of the polling loop's sleep between cycles, in seconds.
+MIN_POLL_SLEEP = 0.02
+MAX_POLL_SLEEP = 0.5
+# Default maximum number of watches read per polling cycle.
+DEFAULT_POLL_BUDGET = 512
+# UART peripherals offered when opening a terminal; any other path can be typed.
+DEFAULT_UARTS = ["sysbus.uart0", "sysbus.uart", "sysbus.uart1", "sysbus.usart1"]
+# Seconds before reconnecting a terminal whose stream ended, e.g. on a reset.
+UART_RECONNECT_DELAY = 0.5
 
 class LogHandler(logging.Handler, QObject):
     """
     Custom logging handler that emits a signal for each log record.
 
-    This allows log messages to be displayed in the UI (QTextEdit) in a thread-safe manner.
+    This allows log messages to be displayed in the UI (LogView) in a thread-safe manner.
     """
     log_signal = Signal(str)
 
@@ -48,24 +76,52 @@ class MainWindow(QMainWindow):
     asynchronous operations for communicating with the Renode backend.
     """
 
-    def __init__(self, bridge):
+    def __init__(self, bridge, log_max_lines=DEFAULT_MAX_LINES, poll_budget=DEFAULT_POLL_BUDGET, started_at=None,
+                 profiler=None, session_path=None, renode_log_capacity=DEFAULT_LOG_CAPACITY):
         """
         Initializes the MainWindow.
 
         Args:
-            bridge (RenodeBridge): The bridge instance for communicating with Renode.
+            bridge (RenodeBridge or SocketRenodeBridge): The bridge instance for
+                communicating with Renode.
+            log_max_lines (int, optional): Maximum number of lines kept in the application log view.
+            poll_budget (int, optional): Maximum number of watches read per polling cycle.
+            started_at (float, optional): `time.perf_counter()` at process start, used
+                to report how long the window took to appear.
+            profiler (SamplingProfiler, optional): The profiler toggled from the
+                Tools menu. Defaults to a new profiler with default settings.
+            session_path (str, optional): Session file restored now and saved when
+                the window closes. Defaults to None, which disables sessions.
+            renode_log_capacity (int, optional): Maximum number of Renode log lines kept.
         """
         super().__init__()
         self.bridge = bridge
+        self.poll_budget = poll_budget
+        self.started_at = started_at
+        self.ui_time = None
+        self.profiler = profiler if profiler is not None else SamplingProfiler()
+        self.session_path = session_path
+        self.script_path = None
         self.setWindowTitle("Renode UI")
         self.resize(800, 600)
 
+        # Tools Menu
+        tools_menu = self.menuBar().addMenu("Tools")
+        self.profile_action = QAction("Profile", self)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setChecked(self.profiler.running)
+        self.profile_action.toggled.connect(self.toggle_profiler)
+        tools_menu.addAction(self.profile_action)
+        self.uart_action = QAction("Open UART Terminal...", self)
+        self.uart_action.triggered.connect(self.open_uart_dialog)
+        tools_menu.addAction(self.uart_action)
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         self.layout = QVBoxLayout(central_widget)
 
         # Status Label
-        self.status_label = QLabel("Status: Stopped")
+        self.status_label = QLabel("Status: Connecting...")
         self.layout.addWidget(self.status_label)
 
         # Controls Layout
@@ -90,6 +146,13 @@ class MainWindow(QMainWindow):
         self.reset_btn.clicked.connect(lambda: asyncio.ensure_future(self.reset_simulation()))
         controls_layout.addWidget(self.reset_btn)
 
+        # Machine the controls and the Renode log apply to; shown for multi-machine emulations
+        self.machine_select = QComboBox()
+        self.machine_select.addItem("All machines", None)
+        self.machine_select.setVisible(False)
+        self.machine_select.currentIndexChanged.connect(self.on_machine_changed)
+        controls_layout.addWidget(self.machine_select)
+
         # Memory Watch Widget
         self.memory_watch = MemoryWatchWidget()
         self.layout.addWidget(self.memory_watch)
@@ -99,61 +162,244 @@ class MainWindow(QMainWindow):
         self.layout.addWidget(self.tabs)
 
         # Tab 1: App Logs
-        self.log_view = QTextEdit()
-        self.log_view.setReadOnly(True)
+        self.log_view = LogView(max_lines=log_max_lines)
         self.tabs.addTab(self.log_view, "App Logs")
 
         # Tab 2: Renode Monitor
         monitor_widget = QWidget()
         monitor_layout = QVBoxLayout(monitor_widget)
         
-        self.renode_monitor = QTextEdit()
-        self.renode_monitor.setReadOnly(True)
-        # self.renode_monitor.setStyleSheet("background-color: #1e1e1e; color: #00ff00; font-family: monospace;")
-        self.renode_monitor.setFont(QFont("Monospace"))
+        # Parsed and indexed on the log tailing thread, filtered per machine in the view
+        self.renode_log = LogStore(renode_log_capacity)
+        self.renode_monitor = RenodeLogView(self.renode_log)
         monitor_layout.addWidget(self.renode_monitor)
         
         # Monitor Input Controls
         input_layout = QHBoxLayout()
-        self.monitor_input = QLineEdit()
+        # Multi-line pastes are sent as one batch
+        self.monitor_input = MonitorInput()
         self.monitor_input.setPlaceholderText("Enter monitor command...")
-        self.monitor_input.returnPressed.connect(self.send_monitor_command)
+        self.monitor_input.commands_entered.connect(self.send_monitor_commands)
         input_layout.addWidget(self.monitor_input)
         
         self.monitor_send_btn = QPushButton("Send")
-        self.monitor_send_btn.clicked.connect(self.send_monitor_command)
-        input_layout.addWidget(self.monitor_send_btn)
+        self.monitor_send_btn.clicked.connect(self.monitor_input.submit)
+        input_layout.addWidget(self.monitor_send_btn, 0, Qt.AlignTop)
         
         monitor_layout.addLayout(input_layout)
         
         self.tabs.addTab(monitor_widget, "Renode Monitor")
 
+        # Tab 3: Memory viewer of the selected machine
+        self.memory_viewer = MemoryViewerWidget(
+            lambda pages, page_size: self.bridge.read_pages(pages, page_size, self.selected_machine()))
+        self.tabs.addTab(self.memory_viewer, "Memory")
+
+        # Tab 4: Call latencies
+        self.performance_view = PerformanceView(self.bridge.metrics)
+        self.tabs.addTab(self.performance_view, "Performance")
+
         # Setup Logging
         self.log_handler = LogHandler()
-        self.log_handler.log_signal.connect(self.log_view.append)
+        self.log_handler.log_signal.connect(self.log_view.append_line)
         logging.getLogger().addHandler(self.log_handler)
         logging.getLogger().setLevel(logging.INFO)
 
+        # Symbols of the ELF files loaded by the current script
+        self.symbols = None
+
         # Setup Renode Logging
-        self.bridge.setup_logging(self.append_renode_log)
+        self.bridge.setup_logging(self.append_renode_log, prepare=self.store_renode_log)
+
+        # Push-based watches
+        self.bridge.setup_watch_push(self.apply_push_events)
+
+        # Connection losses of an out-of-process Renode
+        self.status_before_disconnect = None
+        self.bridge.set_connection_listener(self.on_connection_changed)
 
         # Monitoring Task
         self.monitor_task = None
 
-    def append_renode_log(self, msg):
+        # UART terminal tabs by (machine, UART)
+        self.uart_terminals = {}
+
+        if session_path:
+            self.restore_session()
+
+        asyncio.ensure_future(self.wait_for_backend())
+
+    def restore_session(self):
+        """
+        Restores the watches of the saved session and queues its script for loading.
+
+        The script is loaded once the backend is up, since bridge calls queue
+        behind the backend startup.
+        """
+        session = load_session(self.session_path)
+        if session is None:
+            return
+        self.memory_watch.model.add_watches(session["watches"])
+        script = session["script"]
+        if script and os.path.exists(script):
+            asyncio.ensure_future(self.load_script(script))
+        elif script:
+            logging.warning(f"Script of the last session not found: {script}")
+        logging.info(f"Restored session with {len(session['watches'])} watches")
+
+    def save_current_session(self):
+        """
+        Saves the loaded script and the watch list to the session file.
+        """
+        try:
+            save_session(self.script_path, self.memory_watch.model.watch_records(), self.session_path)
+        except OSError as e:
+            logging.error(f"Failed to save the session: {e}")
+
+    def closeEvent(self, event):
         """
-        Appends a log message to the Renode monitor view.
+        Saves the session when the window closes.
 
         Args:
-            msg (str): The message to append.
+            event (QCloseEvent): The close event.
         """
-        self.renode_monitor.append(msg)
-        # Auto scroll
-        sb = self.renode_monitor.verticalScrollBar()
-        sb.setValue(sb.maximum())
+        if self.session_path:
+            self.save_current_session()
+        super().closeEvent(event)
 
-        # Monitoring Task
-        self.monitor_task = None
+    def toggle_profiler(self, enabled):
+        """
+        Starts or stops a profiling session of the UI loop and the worker threads.
+
+        Args:
+            enabled (bool): Whether profiling should run.
+        """
+        try:
+            if enabled and not self.profiler.running:
+                self.profiler.start()
+            elif not enabled and self.profiler.running:
+                path = self.profiler.stop()
+                self.status_label.setText(f"Status: Profile written to {path}")
+        except (OSError, RuntimeError) as e:
+            logging.error(f"Profiler error: {e}")
+
+    def showEvent(self, event):
+        """
+        Records when the window was first shown.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        if self.ui_time is None and self.started_at is not None:
+            self.ui_time = time.perf_counter() - self.started_at
+
+    async def wait_for_backend(self):
+        """
+        Waits for the backend to start and logs the startup timing breakdown.
+
+        Commands issued meanwhile are queued by the bridge and run afterwards.
+        """
+        try:
+            timings = await self.bridge.ready
+        except Exception as e:
+            logging.error(f"Failed to start the Renode backend: {e}")
+            self.status_label.setText("Status: Error")
+            return
+        if self.status_label.text() == "Status: Connecting...":
+            self.status_label.setText("Status: Stopped")
+        if self.ui_time is not None:
+            timings["ui"] = self.ui_time
+        if timings:
+            logging.info("Startup timing: " + ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in timings.items()))
+        await self.refresh_machines()
+
+    def on_connection_changed(self, connected):
+        """
+        Reports a lost connection to Renode and reattaches once it is back.
+
+        Args:
+            connected (bool): Whether Renode is now connected.
+        """
+        if not connected:
+            if self.status_before_disconnect is None:
+                self.status_before_disconnect = self.status_label.text()
+            self.status_label.setText("Status: Disconnected, reconnecting...")
+            return
+        if self.status_before_disconnect is None:
+            return # First connection, handled by wait_for_backend
+        logging.info("Reconnected to Renode")
+        self.status_label.setText(self.status_before_disconnect)
+        self.status_before_disconnect = None
+        asyncio.ensure_future(self.refresh_machines())
+        self.reconnect_uart_terminals()
+
+    async def refresh_machines(self):
+        """
+        Updates the machine selector and the watch dialog with the emulation's machines.
+        """
+        try:
+            machines = await self.bridge.list_machines()
+        except Exception as e:
+            logging.warning(f"Could not list machines: {e}")
+            return
+        selected = self.selected_machine()
+        self.machine_select.blockSignals(True)
+        self.machine_select.clear()
+        self.machine_select.addItem("All machines", None)
+        for machine in machines:
+            self.machine_select.addItem(machine, machine)
+        index = self.machine_select.findData(selected)
+        self.machine_select.setCurrentIndex(max(index, 0))
+        self.machine_select.blockSignals(False)
+        self.machine_select.setVisible(len(machines) > 1)
+        self.memory_watch.set_machines(machines)
+        if self.machine_select.currentData() != selected:
+            self.on_machine_changed()
+
+    def on_machine_changed(self):
+        """
+        Shows the Renode log and the memory of the newly selected machine.
+        """
+        self.renode_monitor.set_machine(self.selected_machine())
+        self.memory_viewer.viewer.clear_cache()
+
+    def selected_machine(self):
+        """
+        Returns the machine selected for the controls and the Renode log.
+
+        Returns:
+            str: The machine name, or None for all machines.
+        """
+        return self.machine_select.currentData()
+
+    def store_renode_log(self, lines):
+        """
+        Annotates, parses and stores a batch of Renode log messages.
+
+        Runs on the log tailing thread, so the UI thread only lists the new lines.
+
+        Args:
+            lines (list): The messages.
+
+        Returns:
+            range: The sequence numbers of the stored lines.
+        """
+        with self.bridge.metrics.timer("renode_log", "exec"):
+            symbols = self.symbols
+            if symbols is not None:
+                lines = [symbols.annotate(line) for line in lines]
+            return self.renode_log.append(lines)
+
+    def append_renode_log(self, seqs):
+        """
+        Shows a batch of stored log messages in the Renode monitor view.
+
+        Args:
+            seqs (range): The sequence numbers of the new lines.
+        """
+        with self.bridge.metrics.timer("renode_log", "apply"):
+            self.renode_monitor.append(seqs)
 
     def load_script_handler(self):
         """
@@ -172,19 +418,51 @@ class MainWindow(QMainWindow):
         """
         try:
             await self.bridge.load_script(path)
+            self.script_path = os.path.abspath(path)
             self.status_label.setText(f"Status: Loaded {path}")
+            self.memory_viewer.viewer.clear_cache()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
+            return
+        asyncio.ensure_future(self.load_symbols(path))
+        await self.refresh_machines()
+        self.reconnect_uart_terminals()
+
+    async def load_symbols(self, path):
+        """
+        Reads the symbols of the ELF files loaded by a script in the background.
+
+        Parsing runs on a thread pool thread, off both the UI thread and the
+        Renode worker. The symbols then label addresses in the watch table and
+        the Renode log, and complete symbol names when adding watches.
+
+        Args:
+            path (str): The path to the script file.
+        """
+        try:
+            symbols = await asyncio.get_running_loop().run_in_executor(None, load_script_symbols, path)
+        except OSError as e:
+            logging.warning(f"Could not read symbols for {path}: {e}")
+            symbols = None
+        self.symbols = symbols
+        self.memory_watch.model.set_symbols(symbols)
+        self.memory_viewer.symbols = symbols
+        if symbols is not None:
+            logging.info(f"Loaded {len(symbols)} symbols")
 
     async def start_simulation(self):
         """
-        Asynchronously starts the simulation.
+        Asynchronously starts the simulation, or only the selected machine.
         """
+        machine = self.selected_machine()
         try:
-            self.start_btn.setEnabled(False)
+            # With a single machine selected the others may be in any state, so
+            # both buttons stay available
+            self.start_btn.setEnabled(machine is not None)
             self.pause_btn.setEnabled(True)
-            self.status_label.setText("Status: Running")
-            await self.bridge.start()
+            self.status_label.setText("Status: Running" if machine is None else f"Status: Started {machine}")
+            await self.bridge.start(machine)
+            self.memory_viewer.viewer.set_live(True)
             
             if not self.monitor_task or self.monitor_task.done():
                 self.monitor_task = asyncio.create_task(self.monitor_loop())
@@ -196,13 +474,22 @@ class MainWindow(QMainWindow):
 
     async def pause_simulation(self):
         """
-        Asynchronously pauses the simulation.
+        Asynchronously pauses the simulation, or only the selected machine.
+
+        Polling stops only when the whole simulation is paused.
         """
+        machine = self.selected_machine()
         try:
+            if machine is not None:
+                self.status_label.setText(f"Status: Paused {machine}")
+                await self.bridge.pause(machine)
+                self.memory_viewer.viewer.invalidate()
+                return
             self.start_btn.setEnabled(True)
             self.pause_btn.setEnabled(False)
             self.status_label.setText("Status: Paused")
             await self.bridge.pause()
+            self.memory_viewer.viewer.set_live(False)
             # Monitor loop will check bridge status or we can cancel it.
             # For now, let it run but it might just read same values or we can stop it.
             # Better to let it run if we want to see state changes, but usually we stop polling if paused?
@@ -215,60 +502,284 @@ class MainWindow(QMainWindow):
 
     async def reset_simulation(self):
         """
-        Asynchronously resets the simulation.
+        Asynchronously resets the simulation, or only the selected machine.
         """
+        machine = self.selected_machine()
         try:
+            if machine is not None:
+                self.status_label.setText(f"Status: Reset {machine}")
+                await self.bridge.reset(machine)
+                self.memory_viewer.viewer.invalidate()
+                return
             self.start_btn.setEnabled(True)
             self.pause_btn.setEnabled(False)
             self.status_label.setText("Status: Stopped")
             await self.bridge.reset()
+            self.memory_viewer.viewer.set_live(False)
             if self.monitor_task:
                 self.monitor_task.cancel()
+            await self.refresh_machines()
+            self.reconnect_uart_terminals()
         except Exception as e:
             self.status_label.setText("Status: Error")
             QMessageBox.critical(self, "Error", str(e))
 
     async def monitor_loop(self):
         """
-        Background task that periodically polls memory watches while the simulation is running.
+        Background task that polls memory watches while the simulation is running.
+
+        Push-mode watches get watchpoint hooks, re-synchronized whenever the watch list
+        changes. The remaining watches are read when `PollScheduler` says they are due:
+        unchanged values are backed off, and each cycle reads at most `poll_budget`
+        watches with one bridge call per machine. The reads of different machines
+        run concurrently and are applied as each completes, so a busy machine does
+        not hold back the others. Push-mode watches are read once when the loop
+        starts, since their hooks may have been re-registered since the last run.
         """
+        scheduler = PollScheduler(budget=self.poll_budget)
+        synced_revision = None
+        scheduled_revision = None
+        last_sync = 0.0
+        loop = asyncio.get_running_loop()
+        reads = set()
+        self.memory_watch.model.reread_push_watches()
         try:
             while True:
                 # In a real app, check if simulation is actually running
                 # For now, we assume if this task is running, we should poll
                 
-                # Iterate over watches
-                # We need to access watches safely. 
-                # Since we are in the same thread (asyncio on main thread), it's safe to read self.memory_watch.watches
-                for i, watch in enumerate(self.memory_watch.watches):
+                # Since we are in the same thread (asyncio on main thread), it's safe to read the model
+                model = self.memory_watch.model
+                now = loop.time()
+                if model.revision != synced_revision or now - last_sync > WATCHPOINT_RESYNC_INTERVAL:
                     try:
-                        val = await self.bridge.read_memory(watch['address'], 4) # Default to 4 bytes for now
-                        self.memory_watch.update_value(watch['row'], val)
+                        revision = model.revision
+                        ids, requests = model.push_requests()
+                        flags = await self.bridge.sync_watchpoints(requests)
+                        model.set_push_active(ids, flags)
+                        synced_revision, last_sync = revision, now
                     except Exception as e:
-                        logging.error(f"Error reading memory: {e}")
-                
-                await asyncio.sleep(0.5)
+                        logging.error(f"Error registering watchpoints: {e}")
+
+                if model.poll_revision != scheduled_revision:
+                    scheduled_revision = model.poll_revision
+                    scheduler.sync(*model.poll_ids(), loop.time())
+
+                # Read the due watches with a single bridge call per machine and cycle.
+                ids = scheduler.due(loop.time()) + model.take_rereads()
+                for machine, group in model.ids_by_machine(ids).items():
+                    task = asyncio.create_task(self._poll_machine(scheduler, machine, group, model.requests_for(group)))
+                    reads.add(task)
+                    task.add_done_callback(reads.discard)
+
+                deadline = scheduler.next_deadline()
+                delay = MAX_POLL_SLEEP if deadline is None else deadline - loop.time()
+                await asyncio.sleep(min(max(delay, MIN_POLL_SLEEP), MAX_POLL_SLEEP))
         except asyncio.CancelledError:
-            pass
+            for task in list(reads):
+                task.cancel()
 
-    def send_monitor_command(self):
+    async def _poll_machine(self, scheduler, machine, ids, requests):
         """
-        Sends the user-entered monitor command to the backend.
+        Reads watches of one machine and applies the values.
 
-        This method retrieves the command from the input field, clears the field,
-        and schedules the command execution asynchronously.
+        Args:
+            scheduler (PollScheduler): The scheduler of the polling loop.
+            machine (str): The machine, or None for the default machine.
+            ids (list): The watch ids to read.
+            requests (list): The matching (address, width) tuples.
         """
-        cmd = self.monitor_input.text().strip()
-        if not cmd:
+        model = self.memory_watch.model
+        try:
+            values = await self.bridge.read_many(requests, machine)
+        except (StaleRequestError, MonitorDisconnectedError):
+            model.finish_rereads(ids, False)
+            return # Superseded, waited too long or reconnecting; the scheduler retries later
+        except asyncio.CancelledError:
+            model.finish_rereads(ids, False)
+            raise
+        except Exception as e:
+            model.finish_rereads(ids, True)
+            logging.error(f"Error reading memory{f' of {machine}' if machine else ''}: {e}")
             return
-        
-        self.monitor_input.clear()
-        
+        with self.bridge.metrics.timer("read_many", "apply"):
+            changed = model.update_values(ids, values)
+        model.finish_rereads(ids, True)
+        scheduler.report(ids, changed, asyncio.get_running_loop().time())
+
+    def apply_push_events(self, events):
+        """
+        Applies watch values pushed by watchpoints to the watch table.
+
+        Args:
+            events (list): (address, value, virtual_time, machine) tuples.
+        """
+        with self.bridge.metrics.timer("watch_push", "apply"):
+            self.memory_watch.model.apply_push_events(events)
+
+    def open_uart_dialog(self):
+        """
+        Asks for a UART peripheral and opens a terminal for it on the selected machine.
+        """
+        uart, ok = QInputDialog.getItem(self, "UART Terminal", "UART peripheral:", DEFAULT_UARTS, 0, True)
+        if ok and uart.strip():
+            asyncio.ensure_future(self.open_uart_terminal(uart.strip(), self.selected_machine()))
+
+    async def open_uart_terminal(self, uart, machine=None):
+        """
+        Opens a terminal tab for a UART, or shows the existing one.
+
+        Args:
+            uart (str): The UART peripheral, e.g. "sysbus.uart0".
+            machine (str, optional): The machine of the UART. Defaults to None.
+        """
+        key = (machine, uart)
+        terminal = self.uart_terminals.get(key)
+        if terminal is None:
+            terminal = UartTerminal(f"{machine}: {uart}" if machine else uart)
+            terminal.close_requested.connect(lambda: self.close_uart_terminal(key))
+            terminal.reconnect_requested.connect(lambda: asyncio.ensure_future(self.connect_uart_terminal(key)))
+            self.uart_terminals[key] = terminal
+            self.tabs.addTab(terminal, uart.rsplit(".", 1)[-1])
+        self.tabs.setCurrentWidget(terminal)
+        await self.connect_uart_terminal(key)
+
+    async def connect_uart_terminal(self, key):
+        """
+        Exposes a terminal's UART on a port and connects the terminal to it,
+        unless it is connected or connecting already.
+
+        Args:
+            key (tuple): The (machine, UART) of the terminal.
+        """
+        terminal = self.uart_terminals.get(key)
+        if terminal is None or terminal.connected or terminal.connecting:
+            return
+        machine, uart = key
+        terminal.connecting = True
+        port = None
         try:
-            asyncio.ensure_future(self._send_monitor_command_async(cmd))
+            host, port = await self.bridge.open_uart(uart, machine)
+            stream = UartStream(host, port, lambda data: self.feed_uart_terminal(terminal, data),
+                                on_closed=lambda: self.on_uart_closed(key))
+            await stream.open()
+        except Exception as e:
+            logging.warning(f"Could not open a terminal on {uart}: {e}")
+            terminal.set_disconnected(f"Disconnected: {e}")
+            if port is not None:
+                # Renode's side is set up; don't leave it connected to nothing
+                await self._disconnect_uart(uart, port, machine)
+            return
+        finally:
+            terminal.connecting = False
+        if self.uart_terminals.get(key) is not terminal:
+            # Closed while connecting
+            stream.close()
+            await self._disconnect_uart(uart, port, machine)
+            return
+        terminal.attach(stream)
+
+    def feed_uart_terminal(self, terminal, data):
+        """
+        Hands bytes received from a UART to its terminal.
+
+        Args:
+            terminal (UartTerminal): The terminal.
+            data (bytes): The bytes.
+        """
+        with self.bridge.metrics.timer("uart", "apply"):
+            terminal.feed(data)
+
+    def on_uart_closed(self, key):
+        """
+        Marks a terminal as disconnected and tries to reconnect it shortly,
+        as its stream also ends when the emulation is reset.
+
+        Args:
+            key (tuple): The (machine, UART) of the terminal.
+        """
+        terminal = self.uart_terminals.get(key)
+        if terminal is None:
+            return
+        terminal.set_disconnected()
+        asyncio.get_running_loop().call_later(
+            UART_RECONNECT_DELAY, lambda: asyncio.ensure_future(self.connect_uart_terminal(key)))
+
+    def reconnect_uart_terminals(self):
+        """
+        Reconnects the disconnected terminals, e.g. after a script was loaded.
+        """
+        for key in list(self.uart_terminals):
+            asyncio.ensure_future(self.connect_uart_terminal(key))
+
+    def close_uart_terminal(self, key):
+        """
+        Closes a terminal tab and disconnects its UART.
+
+        Args:
+            key (tuple): The (machine, UART) of the terminal.
+        """
+        terminal = self.uart_terminals.pop(key, None)
+        if terminal is None:
+            return
+        stream = terminal.stream
+        if stream is not None:
+            stream.close()
+            asyncio.ensure_future(self._disconnect_uart(key[1], stream.port, key[0]))
+        self.tabs.removeTab(self.tabs.indexOf(terminal))
+        terminal.deleteLater()
+
+    async def _disconnect_uart(self, uart, port, machine):
+        """
+        Disconnects a UART from its terminal in Renode, logging failures.
+
+        Args:
+            uart (str): The UART peripheral.
+            port (int): The port of the terminal.
+            machine (str): The machine of the UART, or None.
+        """
+        try:
+            await self.bridge.close_uart(uart, port, machine)
+        except Exception as e:
+            logging.warning(f"Could not disconnect {uart}: {e}")
+
+    def send_monitor_commands(self, commands):
+        """
+        Sends the user-entered monitor commands to the backend.
+
+        A single command goes through `monitor_command`; several commands, e.g.
+        a pasted script snippet, are sent with one `execute_batch` call.
+
+        Args:
+            commands (list): The commands, in order.
+        """
+        try:
+            if len(commands) == 1:
+                asyncio.ensure_future(self._send_monitor_command_async(commands[0]))
+            else:
+                asyncio.ensure_future(self._send_monitor_batch_async(commands))
         except Exception as e:
              QMessageBox.critical(self, "Error", str(e))
 
+    async def _send_monitor_batch_async(self, commands):
+        """
+        Helper method to execute a batch of monitor commands asynchronously.
+
+        The output and errors of every command appear in the Renode log.
+
+        Args:
+            commands (list): The commands to execute.
+        """
+        logging.info(f"Executing {len(commands)} monitor commands")
+        try:
+            results = await self.bridge.execute_batch(commands)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        failed = sum(1 for result in results if result is not None and result[1])
+        if failed:
+            logging.warning(f"{failed} of {len(commands)} monitor commands failed")
+
     async def _send_monitor_command_async(self, cmd):
         """
         Helper method to execute the monitor command asynchronously.
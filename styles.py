@@ -40,7 +40,7 @@ QPushButton:disabled {
 }
 
 /* Input Fields */
-QLineEdit, QTextEdit {
+QLineEdit, QTextEdit, QPlainTextEdit {
     background-color: #2d2d2d;
     border: 1px solid #3e3e3e;
     border-radius: 4px;
@@ -50,7 +50,7 @@ QLineEdit, QTextEdit {
     selection-color: #ffffff;
 }
 
-QLineEdit:focus, QTextEdit:focus {
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
     border: 1px solid #0078d4;
 }
 
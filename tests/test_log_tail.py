@@ -0,0 +1,61 @@
+"""
+Tests of the Renode log tailer.
+"""
+
+import os
+import threading
+import time
+
+from backend.log_tail import LogTailer
+
+def wait_for(condition, timeout=5.0):
+    """
+    Waits until a condition holds.
+
+    Args:
+        condition (callable): Returns True once satisfied.
+        timeout (float, optional): Seconds to wait. Defaults to 5.
+
+    Returns:
+        bool: Whether the condition held in time.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_lines_are_delivered_and_the_last_partial_line_on_stop(tmp_path):
+    path = tmp_path / "renode.log"
+    path.write_bytes(b"")
+    lines = []
+    lock = threading.Lock()
+
+    def deliver(batch):
+        with lock:
+            lines.extend(batch)
+
+    tailer = LogTailer(str(path), deliver)
+    tailer.start()
+    with open(path, "ab") as f:
+        f.write(b"first\nsecond\nno newline")
+    assert wait_for(lambda: len(lines) == 2)
+    tailer.stop()
+    assert not tailer.thread.is_alive()
+    assert lines == ["first", "second", "no newline"]
+    # Stopping again is harmless
+    tailer.stop()
+
+def test_stop_without_start_closes_the_wake_pipe(tmp_path):
+    path = tmp_path / "renode.log"
+    path.write_bytes(b"")
+    tailer = LogTailer(str(path), lambda batch: None)
+    read_fd = tailer._wake_r
+    tailer.stop()
+    try:
+        os.fstat(read_fd)
+        closed = False
+    except OSError:
+        closed = True
+    assert closed
@@ -0,0 +1,255 @@
+"""
+Tests of the socket monitor transport against local monitor servers.
+
+`FakeMonitorServer` serves simulated machines the way `renode --port N` serves
+its monitor; a raw server covers byte streams the fake does not produce, such
+as telnet commands and escapes split across reads.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from backend.fake_monitor import FakeMonitorServer
+from backend.monitor_client import MonitorClient, MonitorDisconnectedError
+from backend.simulated_backend import SimulatedRenode, load_simulation
+from backend.socket_bridge import SocketRenodeBridge
+from backend.uart_stream import uart_terminal_name
+
+MULTI_SIMULATION = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "simulation_multi.json")
+
+def run(coroutine):
+    """
+    Runs a test coroutine on a fresh event loop, with a timeout.
+
+    Args:
+        coroutine (coroutine): The test body.
+
+    Returns:
+        object: The coroutine's result.
+    """
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=20))
+
+async def connected_client(port):
+    """
+    Returns a started client once it is connected.
+
+    Args:
+        port (int): The monitor port.
+
+    Returns:
+        MonitorClient: The client.
+    """
+    client = MonitorClient("127.0.0.1", port)
+    client.start()
+    await client.wait_connected()
+    return client
+
+async def serve_chunks(chunks, responses):
+    """
+    Starts a raw monitor that sends a greeting in separate writes, then one
+    canned response per command line.
+
+    Args:
+        chunks (list): The greeting, as bytes written one after the other.
+        responses (list): The bytes answering each command, in order; each
+            entry is a list of bytes written one after the other.
+
+    Returns:
+        asyncio.Server: The server.
+    """
+    async def serve(reader, writer):
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.02)
+        for parts in responses:
+            if not await reader.readline():
+                break
+            for part in parts:
+                writer.write(part)
+                await writer.drain()
+                await asyncio.sleep(0.02)
+        await reader.read()
+        writer.close()
+    return await asyncio.start_server(serve, "127.0.0.1", 0)
+
+def test_pipelined_responses_are_split_at_prompts_without_echo():
+    async def body():
+        server = FakeMonitorServer(SimulatedRenode())
+        await server.start()
+        client = await connected_client(server.port)
+        try:
+            responses = await client.execute_many([
+                "sysbus WriteDoubleWord 0x80000000 0x1234",
+                "sysbus ReadDoubleWord 0x80000000",
+                "sysbus ReadByte 0x80000000",
+            ])
+            assert [error for _, error in responses] == ["", "", ""]
+            assert int(responses[1][0], 16) == 0x1234
+            assert int(responses[2][0], 16) == 0x34
+            assert client.context == "monitor"
+        finally:
+            client.close()
+            await server.close()
+    run(body())
+
+def test_red_text_is_reported_as_error():
+    async def body():
+        server = FakeMonitorServer(SimulatedRenode())
+        await server.start()
+        client = await connected_client(server.port)
+        try:
+            output, error = await client.execute("sysbus ReadDoubleWord 0x10")
+            assert output == ""
+            assert "Unmapped memory access" in error
+            # The connection stays usable after an error
+            output, error = await client.execute("sysbus ReadByte 0x80000000")
+            assert error == "" and int(output, 16) == 0
+        finally:
+            client.close()
+            await server.close()
+    run(body())
+
+def test_telnet_and_ansi_sequences_split_across_reads():
+    async def body():
+        greeting = [
+            b"\xff\xfb",                          # IAC WILL, option in the next read
+            b"\x01\xff\xfb\x03Renode\r\n\x1b[34",  # Prompt color split mid-escape
+            b";1m(monitor) \x1b[0m",
+        ]
+        responses = [[
+            b"version\r\nRenode v1\r\n\x1b[3",     # Red split mid-escape
+            b"1;1mbad thing\x1b[0m\r\n\xff",        # IAC split from its command
+            b"\xf1\x1b[34;1m(mach-0) \x1b[0m",
+        ]]
+        server = await serve_chunks(greeting, responses)
+        client = await connected_client(server.sockets[0].getsockname()[1])
+        try:
+            output, error = await client.execute("version")
+            assert output == "Renode v1"
+            assert error == "bad thing"
+            assert client.context == "mach-0"
+        finally:
+            client.close()
+            server.close()
+    run(body())
+
+def test_reconnects_after_the_server_drops_clients():
+    async def body():
+        server = FakeMonitorServer(SimulatedRenode())
+        await server.start()
+        changes = []
+        client = MonitorClient("127.0.0.1", server.port, on_connection=changes.append)
+        client.start()
+        await client.wait_connected()
+        try:
+            server.drop_clients()
+            with pytest.raises(MonitorDisconnectedError):
+                await client.execute("sysbus ReadByte 0x80000000")
+            await client.wait_connected()
+            output, error = await client.execute("sysbus ReadByte 0x80000000")
+            assert error == "" and int(output, 16) == 0
+            assert client.connects == 2
+            assert changes == [True, False, True]
+        finally:
+            client.close()
+            await server.close()
+    run(body())
+
+def test_machine_commands_do_not_race_with_polling():
+    async def body():
+        simulation = load_simulation(MULTI_SIMULATION)
+        server = FakeMonitorServer(simulation)
+        await server.start()
+        bridge = SocketRenodeBridge("127.0.0.1", server.port)
+        stop = asyncio.Event()
+
+        async def poll():
+            while not stop.is_set():
+                await bridge.read_many([(0x80000000, 4)], machine="node-a")
+
+        try:
+            await bridge.ready
+            assert await bridge.list_machines() == ["node-a", "node-b"]
+            # The user's selection survives background reads
+            await bridge.monitor_command('mach set "node-b"')
+            poller = asyncio.ensure_future(poll())
+            await asyncio.sleep(0.05)
+            await bridge.start("node-b")
+            await bridge.pause("node-b")
+            await bridge.start("node-b")
+            stop.set()
+            await poller
+            assert simulation.machines["node-b"].running
+            assert not simulation.machines["node-a"].running
+            assert bridge.client.context == "node-b"
+            output, error = await bridge.client.execute("sysbus ReadDoubleWord 0x80010000")
+            assert error == ""
+        finally:
+            stop.set()
+            simulation.pause()
+            bridge.close()
+            await server.close()
+    run(body())
+
+def test_unknown_machine_runs_nothing():
+    async def body():
+        simulation = load_simulation(MULTI_SIMULATION)
+        server = FakeMonitorServer(simulation)
+        await server.start()
+        client = await connected_client(server.port)
+        try:
+            responses = await client.execute_on("node-c", ["machine Start"])
+            assert responses == [("", "No machine named node-c")]
+            assert not simulation.running
+            assert client.context == "monitor"
+        finally:
+            client.close()
+            await server.close()
+    run(body())
+
+def test_uart_terminal_connects_the_requested_machine():
+    async def body():
+        simulation = load_simulation(MULTI_SIMULATION)
+        server = FakeMonitorServer(simulation)
+        await server.start()
+        bridge = SocketRenodeBridge("127.0.0.1", server.port)
+        stop = asyncio.Event()
+
+        async def poll():
+            while not stop.is_set():
+                await bridge.read_many([(0x80000000, 4)], machine="node-a")
+
+        try:
+            await bridge.ready
+            await bridge.list_machines()
+            await bridge.monitor_command('mach set "node-a"')
+            poller = asyncio.ensure_future(poll())
+            await asyncio.sleep(0.05)
+            host, port = await bridge.open_uart("sysbus.uart0", "node-b")
+            stop.set()
+            await poller
+            assert [terminal.port for terminal in simulation.machines["node-b"].uart_terminals] == [port]
+            assert simulation.machines["node-a"].uart_terminals == []
+            assert bridge.client.context == "node-a"
+            await bridge.close_uart("sysbus.uart0", port, "node-b")
+            assert simulation.machines["node-b"].uart_terminals == []
+            assert bridge.client.context == "node-a"
+            # Reopening reuses the terminal instead of adding another one
+            assert await bridge.open_uart("sysbus.uart0", "node-b") == (host, port)
+            assert await bridge.open_uart("sysbus.uart0", "node-b") == (host, port)
+            assert list(simulation.terminals) == [uart_terminal_name(port)]
+            assert [terminal.port for terminal in simulation.machines["node-b"].uart_terminals] == [port]
+            # Terminals go with the cleared emulation
+            await bridge.reset()
+            _, new_port = await bridge.open_uart("sysbus.uart0", "node-b")
+            assert list(simulation.terminals) == [uart_terminal_name(new_port)]
+        finally:
+            stop.set()
+            for terminal in simulation.terminals.values():
+                terminal.close()
+            bridge.close()
+            await server.close()
+    run(body())
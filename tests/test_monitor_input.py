@@ -0,0 +1,29 @@
+"""
+Tests of the splitting of monitor input into commands.
+"""
+
+from widgets.monitor_input import split_commands
+
+def test_blank_lines_and_comments_are_dropped():
+    assert split_commands("  mach create \n\n# a comment\nstart\n") == ["mach create", "start"]
+
+def test_multiline_strings_stay_in_their_command():
+    text = "\n".join([
+        "macro reset",
+        '"""',
+        "    sysbus LoadELF $bin",
+        "",
+        "    # not a comment here",
+        '"""',
+        'set name """first',
+        'second"""',
+        "runMacro $reset",
+    ])
+    assert split_commands(text) == [
+        'macro reset\n"""\n    sysbus LoadELF $bin\n\n    # not a comment here\n"""',
+        'set name """first\nsecond"""',
+        "runMacro $reset",
+    ]
+
+def test_single_line_strings_do_not_open_a_block():
+    assert split_commands('set name """value"""\nstart') == ['set name """value"""', "start"]
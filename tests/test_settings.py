@@ -0,0 +1,63 @@
+"""
+Tests of the validation of imported watches.
+"""
+
+import pytest
+
+from backend.elf_symbols import SymbolTable
+from config.settings import parse_watch, parse_watches
+
+SYMBOLS = SymbolTable([("counter", 0x80000010, 4), ("ready_flag", 0x80000020, 1)])
+
+def test_defaults_fill_missing_fields():
+    watch = parse_watch({"address": "0x80000000"})
+    assert watch == {"address": 0x80000000, "name": "", "type": "Word", "mode": "Poll",
+                     "interval": 0.5, "machine": ""}
+
+def test_csv_strings_are_converted():
+    watch = parse_watch({"address": "80000004", "name": "x", "type": "Byte", "mode": "Push",
+                         "interval": "0.25", "machine": "node-b"})
+    assert watch["address"] == 0x80000004
+    assert watch["interval"] == 0.25
+    assert (watch["type"], watch["mode"], watch["machine"]) == ("Byte", "Push", "node-b")
+
+@pytest.mark.parametrize("address", [-1, 1 << 64, "-0x1", "0x10000000000000000"])
+def test_addresses_outside_the_address_space_are_rejected(address):
+    with pytest.raises(ValueError):
+        parse_watch({"address": address})
+
+def test_largest_address_is_accepted():
+    assert parse_watch({"address": "0xffffffffffffffff"})["address"] == (1 << 64) - 1
+
+@pytest.mark.parametrize("address", ["not-hex", None, 1.5, ["0x10"]])
+def test_invalid_addresses_are_rejected(address):
+    with pytest.raises(ValueError):
+        parse_watch({"address": address})
+
+@pytest.mark.parametrize("field, value", [("type", "DoubleWord"), ("type", "word"), ("mode", "Interrupt")])
+def test_unknown_types_and_modes_are_rejected(field, value):
+    with pytest.raises(ValueError):
+        parse_watch({"address": 0x10, field: value})
+
+@pytest.mark.parametrize("interval", ["nan", "inf", "-inf", float("nan"), float("inf"), 0, "-0.5", "soon"])
+def test_invalid_intervals_are_rejected(interval):
+    with pytest.raises(ValueError):
+        parse_watch({"address": 0x10, "interval": interval})
+
+def test_symbols_resolve_addresses_and_name_the_watch():
+    watch = parse_watch({"address": " counter "}, SYMBOLS)
+    assert watch["address"] == 0x80000010
+    assert watch["name"] == "counter"
+    # An explicit name is kept
+    assert parse_watch({"address": "ready_flag", "name": "flag"}, SYMBOLS)["name"] == "flag"
+
+def test_hex_numbers_are_used_when_no_symbol_matches():
+    assert parse_watch({"address": "10"}, SYMBOLS)["address"] == 0x10
+    with pytest.raises(ValueError):
+        parse_watch({"address": "missing_symbol"}, SYMBOLS)
+
+def test_errors_give_the_watch_position():
+    with pytest.raises(ValueError, match="Watch 2:"):
+        parse_watches([{"address": 0x10}, {"address": 0x20, "interval": "nan"}])
+    with pytest.raises(ValueError, match="Watch 1:"):
+        parse_watches(["0x10"])
@@ -0,0 +1,434 @@
+"""
+Hex Viewer Module.
+
+This module provides a hex/ASCII memory viewer that can scroll through a whole
+address space. Only the rows in view are painted, and memory is fetched on demand
+in fixed-size pages through `RenodeBridge.read_pages`. Fetched pages are kept in
+an LRU cache, pages next to the viewport are prefetched, and while the simulation
+runs the cache is invalidated periodically; stale pages stay on screen until
+their refreshed contents arrive, so the view does not flicker.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QPainter, QFont, QFontMetrics
+
+# Bytes fetched per request unit and kept per cache entry.
+PAGE_SIZE = 4096
+BYTES_PER_ROW = 16
+# Default number of cached pages (1 MiB with 4 KiB pages).
+DEFAULT_PAGE_CACHE_PAGES = 256
+# Pages fetched ahead of the viewport, in both directions.
+PREFETCH_PAGES = 2
+# Maximum number of pages read by one bridge call.
+MAX_PAGES_PER_FETCH = 16
+# Interval between two cache invalidations while the simulation runs, in milliseconds.
+LIVE_REFRESH_MS = 250
+# Scroll bar ranges are ints; larger row counts are scaled down.
+MAX_SCROLL_ROWS = 1 << 30
+
+class PageCache:
+    """
+    An LRU cache of memory pages.
+
+    Entries carry the generation they were fetched in. `invalidate` only bumps
+    the generation, so invalidating is O(1) and stale contents remain available
+    for display until they are replaced.
+    """
+
+    def __init__(self, capacity=DEFAULT_PAGE_CACHE_PAGES):
+        """
+        Initializes the PageCache.
+
+        Args:
+            capacity (int, optional): Maximum number of pages kept. Defaults to 256.
+        """
+        self.capacity = capacity
+        self.generation = 0
+        self._pages = OrderedDict() # page address -> (generation, bytes or None)
+
+    def __len__(self):
+        """
+        Returns the number of cached pages.
+
+        Returns:
+            int: The number of pages.
+        """
+        return len(self._pages)
+
+    def get(self, page):
+        """
+        Looks up a page and marks it as recently used.
+
+        Args:
+            page (int): The page start address.
+
+        Returns:
+            tuple: (fresh, data) where `fresh` tells whether the page was fetched
+                in the current generation and `data` is its bytes, None if it is
+                unreadable; None if the page is not cached.
+        """
+        entry = self._pages.get(page)
+        if entry is None:
+            return None
+        self._pages.move_to_end(page)
+        return entry[0] == self.generation, entry[1]
+
+    def put(self, page, data, generation):
+        """
+        Stores a page, evicting the least recently used one when full.
+
+        Args:
+            page (int): The page start address.
+            data (bytes): The page contents, or None if unreadable.
+            generation (int): The generation the fetch was started in.
+        """
+        self._pages[page] = (generation, data)
+        self._pages.move_to_end(page)
+        while len(self._pages) > self.capacity:
+            self._pages.popitem(last=False)
+
+    def invalidate(self):
+        """
+        Marks all cached pages as stale.
+        """
+        self.generation += 1
+
+    def clear(self):
+        """
+        Drops all cached pages.
+        """
+        self._pages.clear()
+        self.generation += 1
+
+class HexViewer(QAbstractScrollArea):
+    """
+    A virtualized hex/ASCII view of a memory range.
+
+    Rows are painted straight from the page cache; pages that are missing or
+    stale are queued for fetching, visible ones first.
+    """
+
+    def __init__(self, fetch_pages=None, start=0, size=1 << 32, cache_pages=DEFAULT_PAGE_CACHE_PAGES, parent=None):
+        """
+        Initializes the HexViewer.
+
+        Args:
+            fetch_pages (callable, optional): Coroutine function taking a list of
+                page addresses and the page size and returning their contents,
+                e.g. `RenodeBridge.read_pages`.
+            start (int, optional): The first address of the range. Defaults to 0.
+            size (int, optional): The size of the range in bytes. Defaults to 4 GiB.
+            cache_pages (int, optional): Capacity of the page cache.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.fetch_pages = fetch_pages
+        self.cache = PageCache(cache_pages)
+        self.first_row = 0
+        self._wanted = [] # Page addresses to fetch, most urgent first
+        self._fetch_task = None
+
+        font = QFont("Monospace")
+        font.setStyleHint(QFont.TypeWriter)
+        self.setFont(font)
+        self.viewport().setFont(font)
+        metrics = QFontMetrics(font)
+        self.char_width = metrics.horizontalAdvance("0")
+        self.line_height = metrics.height()
+        self.ascent = metrics.ascent()
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self.set_range(start, size)
+
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(LIVE_REFRESH_MS)
+        self.live_timer.timeout.connect(self.invalidate)
+
+    def set_range(self, start, size):
+        """
+        Sets the address range shown by the viewer.
+
+        Args:
+            start (int): The first address; rounded down to a row boundary.
+            size (int): The size of the range in bytes.
+        """
+        self.start = start - start % BYTES_PER_ROW
+        self.total_rows = max(1, -(-size // BYTES_PER_ROW))
+        self.scale = -(-self.total_rows // MAX_SCROLL_ROWS)
+        self.address_digits = max(8, len(f"{self.start + self.total_rows * BYTES_PER_ROW - 1:x}"))
+        self.first_row = 0
+        self._update_scrollbar()
+        self.viewport().update()
+
+    def visible_rows(self):
+        """
+        Returns the number of rows that fit in the viewport.
+
+        Returns:
+            int: The number of rows, at least 1.
+        """
+        return max(1, self.viewport().height() // self.line_height)
+
+    def go_to(self, address):
+        """
+        Scrolls so that an address is in the first visible row.
+
+        Args:
+            address (int): The address.
+        """
+        row = (address - self.start) // BYTES_PER_ROW
+        self.first_row = max(0, min(row, self.total_rows - self.visible_rows()))
+        scrollbar = self.verticalScrollBar()
+        scrollbar.blockSignals(True)
+        scrollbar.setValue(self.first_row // self.scale)
+        scrollbar.blockSignals(False)
+        self.viewport().update()
+
+    def set_live(self, live):
+        """
+        Enables or disables periodic cache invalidation, e.g. while the simulation runs.
+
+        Args:
+            live (bool): Whether memory is expected to change.
+        """
+        if live:
+            self.live_timer.start()
+        else:
+            self.live_timer.stop()
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Marks all cached pages as stale; the visible ones are fetched again.
+        """
+        self.cache.invalidate()
+        if self.isVisible():
+            self.viewport().update()
+
+    def clear_cache(self):
+        """
+        Drops all cached pages, e.g. after a different machine or script was selected.
+        """
+        self.cache.clear()
+        self._wanted = []
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        """
+        Updates the scroll bar range when the viewport is resized.
+
+        Args:
+            event (QResizeEvent): The resize event.
+        """
+        super().resizeEvent(event)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """
+        Sets the scroll bar range and steps from the row count and viewport height.
+        """
+        rows = self.visible_rows()
+        scrollbar = self.verticalScrollBar()
+        scrollbar.blockSignals(True)
+        scrollbar.setRange(0, max(0, (self.total_rows - rows) // self.scale))
+        scrollbar.setPageStep(max(1, rows // self.scale))
+        scrollbar.setSingleStep(1)
+        scrollbar.blockSignals(False)
+        self.first_row = max(0, min(self.first_row, self.total_rows - rows))
+
+    def _on_scroll(self, value):
+        """
+        Follows the scroll bar.
+
+        Args:
+            value (int): The scroll bar value.
+        """
+        self.first_row = max(0, min(value * self.scale, self.total_rows - self.visible_rows()))
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        """
+        Paints the visible rows from the page cache and queues missing pages.
+
+        Args:
+            event (QPaintEvent): The paint event.
+        """
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        painter.fillRect(self.viewport().rect(), palette.base())
+        text_color = palette.text().color()
+        dim_color = palette.placeholderText().color()
+
+        rows = min(self.visible_rows() + 1, self.total_rows - self.first_row)
+        first_address = self.start + self.first_row * BYTES_PER_ROW
+        missing = []
+        page_data = {}
+        for row in range(rows):
+            address = first_address + row * BYTES_PER_ROW
+            page = address - address % PAGE_SIZE
+            if page not in page_data:
+                entry = self.cache.get(page)
+                if entry is None or not entry[0]:
+                    missing.append(page)
+                page_data[page] = entry
+            entry = page_data[page]
+            offset = address - page
+            data = entry[1][offset:offset + BYTES_PER_ROW] if entry is not None and entry[1] is not None else None
+
+            y = row * self.line_height + self.ascent
+            painter.setPen(dim_color)
+            painter.drawText(self.char_width, y, f"{address:0{self.address_digits}x}")
+            x = (self.address_digits + 3) * self.char_width
+            if data is None:
+                painter.drawText(x, y, self._placeholder("--" if entry is not None else ".."))
+                continue
+            painter.setPen(text_color)
+            painter.drawText(x, y, self._hex(data))
+            painter.drawText(x + (3 * BYTES_PER_ROW + 2) * self.char_width, y,
+                             "".join(chr(b) if 0x20 <= b < 0x7f else "." for b in data))
+        painter.end()
+
+        if missing:
+            self._request(missing)
+
+    @staticmethod
+    def _hex(data):
+        """
+        Formats a row of bytes as hex, with a gap after every 8 bytes.
+
+        Args:
+            data (bytes): The row contents.
+
+        Returns:
+            str: The hex text.
+        """
+        text = data.hex(" ")
+        return text[:23] + "  " + text[24:] if len(data) > 8 else text
+
+    @staticmethod
+    def _placeholder(token):
+        """
+        Formats a row of placeholder tokens in the hex column.
+
+        Args:
+            token (str): The two-character placeholder.
+
+        Returns:
+            str: The placeholder row.
+        """
+        return " ".join([token] * 8) + "  " + " ".join([token] * 8)
+
+    def _window(self):
+        """
+        Returns the page addresses around the viewport, visible pages first.
+
+        Returns:
+            list: The page addresses to keep cached.
+        """
+        first = self.start + self.first_row * BYTES_PER_ROW
+        last = first + (self.visible_rows() + 1) * BYTES_PER_ROW - 1
+        first_page, last_page = first - first % PAGE_SIZE, last - last % PAGE_SIZE
+        end = self.start + self.total_rows * BYTES_PER_ROW
+        pages = list(range(first_page, last_page + 1, PAGE_SIZE))
+        for step in range(1, PREFETCH_PAGES + 1):
+            for page in (last_page + step * PAGE_SIZE, first_page - step * PAGE_SIZE):
+                if self.start - PAGE_SIZE < page < end:
+                    pages.append(page)
+        return pages
+
+    def _request(self, visible):
+        """
+        Queues the missing visible pages and the prefetch window for fetching.
+
+        Args:
+            visible (list): Page addresses in view that are missing or stale.
+        """
+        if self.fetch_pages is None:
+            return
+        wanted = list(visible)
+        for page in self._window():
+            if page in visible:
+                continue
+            entry = self.cache.get(page)
+            if entry is None or not entry[0]:
+                wanted.append(page)
+        self._wanted = wanted
+        if self._fetch_task is None or self._fetch_task.done():
+            self._fetch_task = asyncio.ensure_future(self._fetch_loop())
+
+    async def _fetch_loop(self):
+        """
+        Fetches queued pages in batches until none are wanted.
+
+        Before every batch, pages that scrolled out of the prefetch window are
+        dropped, so fast scrolling does not build a backlog.
+        """
+        while self._wanted:
+            window = set(self._window())
+            batch = []
+            for page in self._wanted:
+                if page in window and page not in batch:
+                    entry = self.cache.get(page)
+                    if entry is None or not entry[0]:
+                        batch.append(page)
+                if len(batch) >= MAX_PAGES_PER_FETCH:
+                    break
+            self._wanted = [page for page in self._wanted if page not in batch and page in window]
+            if not batch:
+                break
+            generation = self.cache.generation
+            try:
+                pages = await self.fetch_pages(batch, PAGE_SIZE)
+            except Exception as e:
+                logging.error(f"Error reading memory pages: {e}")
+                break
+            for page, data in zip(batch, pages):
+                self.cache.put(page, data, generation)
+            self.viewport().update()
+
+class MemoryViewerWidget(QWidget):
+    """
+    A hex viewer with a "Go to" field accepting hex addresses or symbol names.
+    """
+
+    def __init__(self, fetch_pages=None, parent=None):
+        """
+        Initializes the MemoryViewerWidget.
+
+        Args:
+            fetch_pages (callable, optional): Page reader passed to `HexViewer`.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.symbols = None
+        self.layout = QVBoxLayout(self)
+
+        goto_layout = QHBoxLayout()
+        goto_layout.addWidget(QLabel("Go to:"))
+        self.goto_input = QLineEdit()
+        self.goto_input.setPlaceholderText("0x80000000 or symbol name")
+        self.goto_input.returnPressed.connect(self.go_to_input)
+        goto_layout.addWidget(self.goto_input)
+        self.layout.addLayout(goto_layout)
+
+        self.viewer = HexViewer(fetch_pages)
+        self.layout.addWidget(self.viewer)
+
+    def go_to_input(self):
+        """
+        Scrolls to the address or symbol typed in the "Go to" field.
+        """
+        text = self.goto_input.text().strip()
+        address = self.symbols.address_of(text) if self.symbols is not None else None
+        try:
+            if address is None:
+                address = int(text, 16)
+        except ValueError:
+            self.goto_input.selectAll()
+            return
+        self.viewer.go_to(address)
@@ -0,0 +1,103 @@
+"""
+Log View Widget Module.
+
+This module provides a read-only log view that stays responsive under heavy logging.
+Lines are queued and inserted in bulk at most once per frame, the document is capped
+at a configurable number of lines, and autoscroll pauses while the user looks at
+older output.
+"""
+
+from collections import deque
+
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtCore import QTimer
+
+# Default number of lines kept in the view.
+DEFAULT_MAX_LINES = 10000
+# Minimum time between two flushes of queued lines, in milliseconds (~60 fps).
+FRAME_INTERVAL_MS = 16
+
+class LogView(QPlainTextEdit):
+    """
+    A bounded, frame-coalesced log view.
+
+    Incoming lines are collected in a ring buffer holding at most `max_lines`
+    entries and flushed into the document as a single insertion per frame. The
+    document itself drops its oldest lines once it exceeds `max_lines`.
+    """
+
+    def __init__(self, max_lines=DEFAULT_MAX_LINES, parent=None):
+        """
+        Initializes the LogView.
+
+        Args:
+            max_lines (int, optional): Maximum number of lines kept. Defaults to 10000.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+        self.pending = deque(maxlen=max_lines)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def set_max_lines(self, max_lines):
+        """
+        Changes the line cap of the view.
+
+        Args:
+            max_lines (int): Maximum number of lines kept.
+        """
+        self.setMaximumBlockCount(max_lines)
+        self.pending = deque(self.pending, maxlen=max_lines)
+
+    def append_line(self, line):
+        """
+        Queues a single line for display.
+
+        Args:
+            line (str): The line to append.
+        """
+        self.pending.append(line)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def append_lines(self, lines):
+        """
+        Queues a batch of lines for display.
+
+        Args:
+            lines (list): The lines to append.
+        """
+        self.pending.extend(lines)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """
+        Inserts all queued lines into the document in one operation.
+
+        The view follows new output only if it was scrolled to the bottom before
+        the insertion; otherwise the user's scroll position is kept.
+        """
+        if not self.pending:
+            return
+        text = "\n".join(self.pending)
+        self.pending.clear()
+
+        sb = self.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum() - 1
+        position = sb.value()
+        self.appendPlainText(text)
+        sb.setValue(sb.maximum() if at_bottom else min(position, sb.maximum()))
+
+    def clear(self):
+        """
+        Clears the view and drops any queued lines.
+        """
+        self.pending.clear()
+        super().clear()
@@ -2,34 +2,63 @@
 Memory Watch Widget Module.
 
 This module provides the UI components for watching memory addresses in the Renode simulation.
-It includes a dialog for adding new watches and a main widget for displaying and managing
-the list of watched addresses.
+It includes a dialog for adding new watches, a table model holding the watch list in compact
+arrays, and a main widget for displaying and managing the list of watched addresses.
 """
 
+import logging
+import math
+import time
+from array import array
+from itertools import compress
+from operator import itemgetter
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QHeaderView, QDialog, QFormLayout, QLineEdit, QComboBox,
-    QDialogButtonBox, QMessageBox
+    QDialogButtonBox, QMessageBox, QSpinBox, QSplitter, QCompleter, QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QStringListModel, QTimer
+from PySide6.QtGui import QColor
+
+from config.settings import import_watches, export_watches
+from widgets.watch_history import SampleRing, HistoryPlotWidget, DEFAULT_HISTORY_CAPACITY
+
+# Number of bytes read for each watch type.
+WATCH_TYPE_WIDTHS = {"Byte": 1, "HalfWord": 2, "Word": 4}
+# Update modes: "Poll" reads the value periodically, "Push" relies on bus watchpoints.
+WATCH_MODES = ["Poll", "Push"]
+# Default target polling interval of a watch, in seconds.
+DEFAULT_POLL_INTERVAL = 0.5
+# Changed values are highlighted in this color, fading out over HIGHLIGHT_FADE_SECONDS.
+HIGHLIGHT_COLOR = QColor(255, 200, 0)
+HIGHLIGHT_FADE_SECONDS = 1.5
+# Repaint interval of fading highlights, in milliseconds.
+HIGHLIGHT_FADE_TICK_MS = 50
 
 class AddWatchDialog(QDialog):
     """
     A dialog for adding a new memory watch.
 
-    Allows the user to input the memory address (in hex), a descriptive name,
-    and the data type (Word, Byte, HalfWord).
+    Allows the user to input the memory address (in hex, or a symbol name when a
+    symbol table is loaded), a descriptive name, the data type (Word, Byte,
+    HalfWord), the update mode (Poll, Push), the target polling interval and,
+    when the emulation has several machines, the machine.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, symbols=None, machines=None):
         """
         Initializes the AddWatchDialog.
 
         Args:
             parent (QWidget, optional): The parent widget. Defaults to None.
+            symbols (SymbolTable, optional): Symbols offered as address completions.
+            machines (list, optional): Machine names to choose from. The machine
+                field is only shown for more than one machine.
         """
         super().__init__(parent)
         self.setWindowTitle("Add Memory Watch")
+        self.symbols = symbols
         
         self.layout = QVBoxLayout(self)
         self.form_layout = QFormLayout()
@@ -38,10 +67,32 @@ class AddWatchDialog(QDialog):
         self.name_input = QLineEdit()
         self.type_input = QComboBox()
         self.type_input.addItems(["Word", "Byte", "HalfWord"])
+        self.mode_input = QComboBox()
+        self.mode_input.addItems(WATCH_MODES)
+        self.interval_input = QSpinBox()
+        self.interval_input.setRange(10, 60000)
+        self.interval_input.setSuffix(" ms")
+        self.interval_input.setValue(int(DEFAULT_POLL_INTERVAL * 1000))
+        self.machine_input = QComboBox()
+        self.machine_input.addItems(machines or [])
         
-        self.form_layout.addRow("Address (Hex):", self.address_input)
+        if symbols is not None:
+            # Completions are looked up per keystroke instead of filtering a model
+            # holding every symbol, which stays fast for very large symbol tables
+            self.completion_model = QStringListModel(self)
+            completer = QCompleter(self.completion_model, self)
+            completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+            self.address_input.setCompleter(completer)
+            self.address_input.textEdited.connect(self._update_completions)
+            self.address_input.setPlaceholderText("0x80000000 or symbol name")
+        
+        if machines and len(machines) > 1:
+            self.form_layout.addRow("Machine:", self.machine_input)
+        self.form_layout.addRow("Address (Hex):" if symbols is None else "Address (Hex or Symbol):", self.address_input)
         self.form_layout.addRow("Name:", self.name_input)
         self.form_layout.addRow("Type:", self.type_input)
+        self.form_layout.addRow("Mode:", self.mode_input)
+        self.form_layout.addRow("Poll Interval:", self.interval_input)
         
         self.layout.addLayout(self.form_layout)
         
@@ -50,24 +101,704 @@ class AddWatchDialog(QDialog):
         self.buttons.rejected.connect(self.reject)
         self.layout.addWidget(self.buttons)
 
+    def _update_completions(self, text):
+        """
+        Offers the symbols starting with the typed text as completions.
+
+        Args:
+            text (str): The current address text.
+        """
+        self.completion_model.setStringList(self.symbols.complete(text) if text else [])
+        if text:
+            self.address_input.completer().complete()
+
     def get_data(self):
         """
         Retrieves the data entered by the user.
 
         Returns:
-            dict: A dictionary containing 'address', 'name', and 'type'.
+            dict: A dictionary containing 'address', 'name', 'type', 'mode',
+                'interval' (in seconds) and 'machine' ("" for the default machine).
         """
         return {
+            "machine": self.machine_input.currentText() if self.machine_input.count() > 1 else "",
             "address": self.address_input.text(),
             "name": self.name_input.text(),
-            "type": self.type_input.currentText()
+            "type": self.type_input.currentText(),
+            "mode": self.mode_input.currentText(),
+            "interval": self.interval_input.value() / 1000
         }
 
+class WatchTableModel(QAbstractTableModel):
+    """
+    Table model holding the watch list in compact column arrays.
+
+    Addresses, widths and values are stored in `array` columns so that tens of
+    thousands of watches stay cheap to hold, poll and update. Each watch gets a
+    stable id; an id-to-row index is rebuilt lazily after removals.
+
+    Push-mode watches are updated from watchpoint events; they are polled only
+    while their watchpoint is not active or when an event asks for a re-read.
+
+    Every watch belongs to a machine; the empty name stands for the first
+    machine of the emulation.
+    """
+
+    COLUMNS = ["Machine", "Address", "Name", "Type", "Mode", "Value"]
+    MACHINE_COLUMN = 0
+    ADDRESS_COLUMN = 1
+    MODE_COLUMN = 4
+    VALUE_COLUMN = 5
+    # Above this many contiguous blocks, removals are applied as a model reset
+    MAX_REMOVE_RUNS = 32
+    # Above this many rows, insertions are applied as a model reset
+    BULK_INSERT_ROWS = 256
+    # Values are compared in blocks of this many rows; only differing blocks are walked
+    COMPARE_BLOCK = 256
+
+    def __init__(self, parent=None):
+        """
+        Initializes the WatchTableModel.
+
+        Args:
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.ids = array('Q')
+        self.addresses = array('Q')
+        self.widths = array('B')
+        self.values = array('Q')
+        self.valid = array('B')
+        self.modes = array('B') # Index into WATCH_MODES
+        self.push_active = array('B')
+        self.vtimes = array('d') # Virtual time of the last pushed update, NaN if unknown
+        self.intervals = array('d') # Target polling interval in seconds
+        self.changed_at = array('d') # Monotonic time of the last value change, -inf if none
+        self.names = []
+        self.types = []
+        self.machines = [] # Machine name, "" for the default machine
+        self.revision = 0 # Bumped on every structural change
+        self.poll_revision = 0 # Bumped whenever the set of polled watches may change
+        self._next_id = 1
+        self._row_index = {}
+        self._index_dirty = False
+        self._push_rows = None # (machine, address) -> rows of push-mode watches, rebuilt lazily
+        self.history_capacity = DEFAULT_HISTORY_CAPACITY
+        self.histories = {} # id -> SampleRing
+        self._reread = set() # ids of push-mode watches that need one poll
+        self._rereading = set() # ids of flagged watches whose read is in flight
+        self.symbols = None # SymbolTable used to label addresses
+        self._fading = {} # id -> monotonic time of the change, for highlighted watches
+        self._fade_timer = QTimer(self)
+        self._fade_timer.setInterval(HIGHLIGHT_FADE_TICK_MS)
+        self._fade_timer.timeout.connect(self._fade_highlights)
+
+    def _columns(self):
+        """
+        Returns all per-row columns, for structural edits.
+
+        Returns:
+            tuple: The column arrays and lists.
+        """
+        return (self.ids, self.addresses, self.widths, self.values, self.valid, self.modes,
+                self.push_active, self.vtimes, self.intervals, self.changed_at, self.names, self.types,
+                self.machines)
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of watches.
+
+        Args:
+            parent (QModelIndex, optional): Unused; the model is flat.
+
+        Returns:
+            int: The number of rows.
+        """
+        return 0 if parent.isValid() else len(self.ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Returns the number of columns.
+
+        Args:
+            parent (QModelIndex, optional): Unused; the model is flat.
+
+        Returns:
+            int: The number of columns.
+        """
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Returns the header labels.
+
+        Args:
+            section (int): The column or row number.
+            orientation (Qt.Orientation): The header orientation.
+            role (int, optional): The data role.
+
+        Returns:
+            str: The header label, or None.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns the display text for a cell, computed on demand from the columns.
+
+        Value cells also get a fading background after their value changed.
+
+        Args:
+            index (QModelIndex): The cell index.
+            role (int, optional): The data role.
+
+        Returns:
+            str: The cell text (or a QColor for the background role), or None.
+        """
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ToolTipRole and column == self.VALUE_COLUMN and self.vtimes[row] == self.vtimes[row]:
+            return f"Pushed at virtual time {self.vtimes[row]:.6f} s"
+        if role == Qt.BackgroundRole and column == self.VALUE_COLUMN:
+            return self._highlight_color(row)
+        if role != Qt.DisplayRole:
+            return None
+        if column == self.MACHINE_COLUMN:
+            return self.machines[row]
+        if column == self.ADDRESS_COLUMN:
+            label = self.symbols.label(self.addresses[row]) if self.symbols is not None else None
+            return f"{hex(self.addresses[row])} <{label}>" if label else hex(self.addresses[row])
+        if column == self.ADDRESS_COLUMN + 1:
+            return self.names[row]
+        if column == self.ADDRESS_COLUMN + 2:
+            return self.types[row]
+        if column == self.MODE_COLUMN:
+            if self.modes[row] and not self.push_active[row]:
+                return "Push (polled)"
+            return WATCH_MODES[self.modes[row]]
+        return hex(self.values[row]) if self.valid[row] else "N/A"
+
+    def add_watches(self, watches):
+        """
+        Appends watches to the model with a single row insertion.
+
+        Large lists are inserted with a single model reset instead, which saves
+        views the per-row bookkeeping of an insertion.
+
+        Args:
+            watches (list): A list of dicts with 'address', 'name' and 'type' keys,
+                and optionally 'mode' ("Poll" or "Push", default "Poll"),
+                'interval' (target polling interval in seconds) and 'machine'
+                (default "", the first machine).
+
+        Returns:
+            list: The ids assigned to the new watches.
+
+        Raises:
+            ValueError: If an address is outside the 64-bit address space, a
+                mode is unknown or an interval is not a positive, finite number.
+        """
+        if not watches:
+            return []
+        # Build the columns that can fail first, so a bad watch leaves the model untouched
+        try:
+            addresses = array('Q', (w["address"] for w in watches))
+        except OverflowError:
+            raise ValueError("Watch address must be between 0 and 0xffffffffffffffff") from None
+        modes = array('B')
+        for w in watches:
+            mode = w.get("mode", "Poll")
+            if mode not in WATCH_MODES:
+                raise ValueError(f"Unknown watch mode '{mode}'")
+            modes.append(WATCH_MODES.index(mode))
+        try:
+            intervals = array('d', (w.get("interval", DEFAULT_POLL_INTERVAL) for w in watches))
+        except TypeError:
+            raise ValueError("Watch interval must be a number") from None
+        if not all(math.isfinite(interval) and interval > 0 for interval in intervals):
+            raise ValueError("Watch interval must be a positive number of seconds")
+        first = len(self.ids)
+        new_ids = list(range(self._next_id, self._next_id + len(watches)))
+        self._next_id += len(watches)
+        bulk = len(watches) > self.BULK_INSERT_ROWS
+        if bulk:
+            self.beginResetModel()
+        else:
+            self.beginInsertRows(QModelIndex(), first, first + len(watches) - 1)
+        self.ids.extend(new_ids)
+        self.addresses.extend(addresses)
+        self.widths.extend(WATCH_TYPE_WIDTHS.get(w["type"], 4) for w in watches)
+        self.values.extend([0] * len(watches))
+        self.valid.extend([0] * len(watches))
+        self.modes.extend(modes)
+        self.push_active.extend([0] * len(watches))
+        self.vtimes.extend([float("nan")] * len(watches))
+        self.intervals.extend(intervals)
+        self.changed_at.extend([float("-inf")] * len(watches))
+        self.names.extend(w["name"] for w in watches)
+        self.types.extend(w["type"] for w in watches)
+        self.machines.extend(w.get("machine") or "" for w in watches)
+        if not self._index_dirty:
+            self._row_index.update(zip(new_ids, range(first, first + len(watches))))
+        self._push_rows = None
+        self.revision += 1
+        self.poll_revision += 1
+        if bulk:
+            self.endResetModel()
+        else:
+            self.endInsertRows()
+        return new_ids
+
+    def watch_records(self):
+        """
+        Returns the definitions of all watches, e.g. for saving them.
+
+        Returns:
+            list: Dicts with 'address', 'name', 'type', 'mode', 'interval' and
+                'machine' keys, in row order, as accepted by `add_watches`.
+        """
+        return [
+            {"address": address, "name": name, "type": watch_type, "mode": WATCH_MODES[mode],
+             "interval": interval, "machine": machine}
+            for address, name, watch_type, mode, interval, machine
+            in zip(self.addresses, self.names, self.types, self.modes, self.intervals, self.machines)
+        ]
+
+    def set_symbols(self, symbols):
+        """
+        Sets the symbol table used to label watch addresses.
+
+        Args:
+            symbols (SymbolTable): The symbols, or None to show raw addresses.
+        """
+        self.symbols = symbols
+        if self.ids:
+            self.dataChanged.emit(self.index(0, self.ADDRESS_COLUMN), self.index(len(self.ids) - 1, self.ADDRESS_COLUMN),
+                                  [Qt.DisplayRole])
+
+    def remove_rows(self, rows):
+        """
+        Removes the given rows, one removal per contiguous block.
+
+        Scattered selections with many blocks are removed with a single model
+        reset instead, which is cheaper for views than many small removals.
+
+        Args:
+            rows (iterable): The row numbers to remove.
+        """
+        runs = self._runs(sorted(set(rows)))
+        for first, last in runs:
+            for watch_id in self.ids[first:last + 1]:
+                self.histories.pop(watch_id, None)
+        columns = self._columns()
+        if len(runs) > self.MAX_REMOVE_RUNS:
+            keep = bytearray([1]) * len(self.ids)
+            for first, last in runs:
+                keep[first:last + 1] = bytes(last - first + 1)
+            self.beginResetModel()
+            for column in columns:
+                kept = compress(column, keep)
+                column[:] = array(column.typecode, kept) if isinstance(column, array) else list(kept)
+            self.endResetModel()
+        else:
+            for first, last in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                for column in columns:
+                    del column[first:last + 1]
+                self.endRemoveRows()
+        self._index_dirty = True
+        self._push_rows = None
+        self.revision += 1
+        self.poll_revision += 1
+
+    def row_for_id(self, watch_id):
+        """
+        Returns the current row of a watch.
+
+        Args:
+            watch_id (int): The watch id.
+
+        Returns:
+            int: The row number, or None if the watch no longer exists.
+        """
+        return self._rows_by_id().get(watch_id)
+
+    def _rows_by_id(self):
+        """
+        Returns the id-to-row index, rebuilding it after removals.
+
+        Returns:
+            dict: Maps watch ids to row numbers.
+        """
+        if self._index_dirty:
+            self._row_index = dict(zip(self.ids, range(len(self.ids))))
+            self._index_dirty = False
+        return self._row_index
+
+    def read_requests(self):
+        """
+        Returns the (address, width) pairs of all watches in row order.
+
+        Returns:
+            list: A list of (address, width) tuples.
+        """
+        return list(zip(self.addresses, self.widths))
+
+    def poll_ids(self):
+        """
+        Returns the watches that must be read by the polling loop.
+
+        These are poll-mode watches and push-mode watches without an active
+        watchpoint.
+
+        Returns:
+            tuple: A list of watch ids and a matching list of target intervals.
+        """
+        rows = [row for row, (mode, active) in enumerate(zip(self.modes, self.push_active)) if not (mode and active)]
+        return [self.ids[row] for row in rows], [self.intervals[row] for row in rows]
+
+    def take_rereads(self):
+        """
+        Returns the push-mode watches flagged for a single re-read.
+
+        The watches stay flagged until `finish_rereads` reports their read as
+        applied, and are not returned again while the read is in flight.
+
+        Returns:
+            list: The ids of the flagged watches that still exist.
+        """
+        self._reread = {watch_id for watch_id in self._reread if self.row_for_id(watch_id) is not None}
+        ids = list(self._reread - self._rereading)
+        self._rereading.update(ids)
+        return ids
+
+    def finish_rereads(self, watch_ids, applied):
+        """
+        Ends the reads of watches returned by `take_rereads`.
+
+        Args:
+            watch_ids (list): The watch ids that were read; ids that were not
+                flagged are ignored.
+            applied (bool): Whether the values were applied. If not, the watches
+                stay flagged and are returned again by `take_rereads`.
+        """
+        self._rereading.difference_update(watch_ids)
+        if applied:
+            self._reread.difference_update(watch_ids)
+
+    def reread_push_watches(self):
+        """
+        Flags every push-mode watch for a single re-read, e.g. because values
+        may have changed while no watchpoint hooks were registered.
+        """
+        self._reread.update(self.ids[row] for row, mode in enumerate(self.modes) if mode)
+
+    def requests_for(self, watch_ids):
+        """
+        Returns the (address, width) pairs of the given watches.
+
+        Args:
+            watch_ids (list): The watch ids; all must exist.
+
+        Returns:
+            list: A list of (address, width) tuples.
+        """
+        rows = [self.row_for_id(watch_id) for watch_id in watch_ids]
+        return [(self.addresses[row], self.widths[row]) for row in rows]
+
+    def ids_by_machine(self, watch_ids):
+        """
+        Groups watches by machine.
+
+        Args:
+            watch_ids (list): The watch ids; all must exist.
+
+        Returns:
+            dict: Maps machine names (None for the default machine) to lists of
+                watch ids, in the order given.
+        """
+        groups = {}
+        for watch_id in watch_ids:
+            groups.setdefault(self.machines[self.row_for_id(watch_id)] or None, []).append(watch_id)
+        return groups
+
+    def push_requests(self):
+        """
+        Returns the push-mode watches.
+
+        Returns:
+            tuple: A list of watch ids and a matching list of (address, width,
+                machine) tuples, with None for the default machine.
+        """
+        rows = [row for row, mode in enumerate(self.modes) if mode]
+        return ([self.ids[row] for row in rows],
+                [(self.addresses[row], self.widths[row], self.machines[row] or None) for row in rows])
+
+    def set_push_active(self, watch_ids, flags):
+        """
+        Records which push-mode watches have an active watchpoint.
+
+        Args:
+            watch_ids (list): The watch ids.
+            flags (list): One bool per watch id.
+        """
+        changed = []
+        for watch_id, flag in zip(watch_ids, flags):
+            row = self.row_for_id(watch_id)
+            if row is not None and self.push_active[row] != flag:
+                self.push_active[row] = 1 if flag else 0
+                changed.append(row)
+                if flag:
+                    # Polling stops here; read once so the watch has a current value
+                    self._reread.add(watch_id)
+        if changed:
+            self.poll_revision += 1
+        changed.sort()
+        for first, last in self._runs(changed):
+            self.dataChanged.emit(self.index(first, self.MODE_COLUMN), self.index(last, self.MODE_COLUMN), [Qt.DisplayRole])
+
+    def apply_push_events(self, events):
+        """
+        Applies value changes pushed by watchpoints.
+
+        Args:
+            events (list): A list of (address, value, virtual_time, machine)
+                tuples. A None value flags the watches at that address for a re-read.
+        """
+        if self._push_rows is None:
+            self._push_rows = {}
+            for row, mode in enumerate(self.modes):
+                if mode:
+                    self._push_rows.setdefault((self.machines[row], self.addresses[row]), []).append(row)
+        latest = {}
+        for addr, value, vtime, machine in events:
+            for row in self._push_rows.get((machine or "", addr), ()):
+                if value is None:
+                    self._reread.add(self.ids[row])
+                else:
+                    latest[row] = value
+                    if vtime is not None:
+                        self.vtimes[row] = vtime
+        if latest:
+            self.update_rows(list(latest), list(latest.values()))
+
+    def set_values(self, values):
+        """
+        Stores a full column of freshly read values.
+
+        Args:
+            values (list): One value per row (None where the read failed).
+        """
+        self.update_rows(range(len(values)), values)
+
+    def update_values(self, watch_ids, values):
+        """
+        Stores values for the given watches, skipping watches removed meanwhile.
+
+        Args:
+            watch_ids (list): The watch ids.
+            values (list): The values, in the same order as `watch_ids`.
+
+        Returns:
+            set: The ids of the watches whose value changed.
+        """
+        if not watch_ids:
+            return set()
+        index = self._rows_by_id()
+        first = index.get(watch_ids[0])
+        wanted = array('Q', watch_ids)
+        if first is not None and self.ids[first:first + len(wanted)] == wanted:
+            # The usual poll: a run of consecutive rows, compared without any gather
+            rows = range(first, first + len(wanted))
+        else:
+            rows = list(map(index.get, watch_ids))
+            if None in rows:
+                kept = [(row, value) for row, value in zip(rows, values) if row is not None]
+                rows, values = [row for row, _ in kept], [value for _, value in kept]
+        ids = self.ids
+        return {ids[row] for row in self.update_rows(rows, values)}
+
+    def update_rows(self, rows, values):
+        """
+        Stores values for the given rows and notifies views of the changed cells.
+
+        The new values are compared with the stored ones block by block, using
+        sequence comparisons that run in C; only blocks holding a difference (or a
+        never-read watch) are walked row by row. Consecutive rows are compared as
+        array slices, so a poll of mostly static watches costs a few memory
+        compares. Changed cells are highlighted, the highlight fading out over
+        `HIGHLIGHT_FADE_SECONDS`.
+
+        One `dataChanged` is emitted per contiguous range of rows whose value changed.
+
+        Args:
+            rows (iterable): The row numbers; consecutive rows are sliced rather
+                than gathered.
+            values (list): The values, in the same order as `rows` (None where the
+                read failed).
+
+        Returns:
+            list: The sorted row numbers whose value changed.
+        """
+        count = len(values)
+        if not count:
+            return []
+        current, valid = self.values, self.valid
+        if isinstance(rows, list) and count > 1 and rows[-1] - rows[0] == count - 1:
+            span = range(rows[0], rows[-1] + 1)
+            if array('Q', rows) == array('Q', span):
+                rows = span
+        if isinstance(rows, range) and rows.step == 1:
+            old, fresh = current[rows.start:rows.stop], bytes(valid[rows.start:rows.stop])
+            try:
+                new = array('Q', values)
+            except TypeError: # Failed reads (None) among the values
+                old, new = tuple(old), tuple(values)
+        else:
+            rows = rows if isinstance(rows, list) else list(rows)
+            if count == 1:
+                old, fresh = (current[rows[0]],), bytes((valid[rows[0]],))
+            else:
+                gather = itemgetter(*rows)
+                old, fresh = gather(current), bytes(gather(valid))
+            new = tuple(values)
+        if old == new and 0 not in fresh:
+            return []
+        changed = []
+        block = self.COMPARE_BLOCK
+        for start in range(0, count, block):
+            end = start + block
+            if new[start:end] == old[start:end] and 0 not in fresh[start:end]:
+                continue
+            for i in range(start, min(end, count)):
+                value = new[i]
+                if value is None or (fresh[i] and old[i] == value):
+                    continue
+                row = rows[i]
+                current[row] = value
+                valid[row] = 1
+                changed.append(row)
+        if not changed:
+            return changed
+        self._record_history(changed)
+        self._highlight(changed)
+        changed.sort()
+        for first, last in self._runs(changed):
+            self.dataChanged.emit(self.index(first, self.VALUE_COLUMN), self.index(last, self.VALUE_COLUMN),
+                                  [Qt.DisplayRole, Qt.BackgroundRole])
+        return changed
+
+    def _highlight(self, rows):
+        """
+        Marks rows as just changed and starts the fade timer.
+
+        Args:
+            rows (list): The rows whose value changed.
+        """
+        now = time.monotonic()
+        ids, changed_at = self.ids, self.changed_at
+        for row in rows:
+            changed_at[row] = now
+            self._fading[ids[row]] = now
+        if not self._fade_timer.isActive():
+            self._fade_timer.start()
+
+    def _highlight_color(self, row):
+        """
+        Returns the background of a value cell, fading since its last change.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            QColor: The highlight color, or None once the highlight has faded.
+        """
+        age = time.monotonic() - self.changed_at[row]
+        if age >= HIGHLIGHT_FADE_SECONDS:
+            return None
+        color = QColor(HIGHLIGHT_COLOR)
+        color.setAlphaF(1.0 - age / HIGHLIGHT_FADE_SECONDS)
+        return color
+
+    def _fade_highlights(self):
+        """
+        Repaints the value cells whose highlight is fading, and only those.
+
+        Rows whose highlight has expired get one last repaint and are then
+        dropped; the timer stops once no highlight is left.
+        """
+        expiry = time.monotonic() - HIGHLIGHT_FADE_SECONDS
+        rows = []
+        for watch_id, changed_at in list(self._fading.items()):
+            if changed_at <= expiry:
+                del self._fading[watch_id]
+            row = self.row_for_id(watch_id)
+            if row is not None:
+                rows.append(row)
+        if not self._fading:
+            self._fade_timer.stop()
+        rows.sort()
+        for first, last in self._runs(rows):
+            self.dataChanged.emit(self.index(first, self.VALUE_COLUMN), self.index(last, self.VALUE_COLUMN),
+                                  [Qt.BackgroundRole])
+
+    def history(self, watch_id):
+        """
+        Returns the value history of a watch.
+
+        Args:
+            watch_id (int): The watch id.
+
+        Returns:
+            SampleRing: The recorded samples, or None if the value never changed.
+        """
+        return self.histories.get(watch_id)
+
+    def _record_history(self, rows):
+        """
+        Appends the current value of the given rows to their history rings.
+
+        Rings are allocated on a watch's first value change, so static watches
+        cost no history memory.
+
+        Args:
+            rows (list): The rows whose value changed.
+        """
+        now = time.monotonic()
+        for row in rows:
+            ring = self.histories.get(self.ids[row])
+            if ring is None:
+                ring = self.histories[self.ids[row]] = SampleRing(self.history_capacity)
+            ring.append(now, self.values[row])
+
+    @staticmethod
+    def _runs(rows):
+        """
+        Splits sorted row numbers into contiguous (first, last) runs.
+
+        Args:
+            rows (list): Sorted row numbers.
+
+        Returns:
+            list: A list of (first, last) tuples.
+        """
+        runs = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1] = (runs[-1][0], row)
+            else:
+                runs.append((row, row))
+        return runs
+
 class MemoryWatchWidget(QWidget):
     """
     A widget for displaying and managing memory watches.
 
-    Provides a table view of watched memory addresses and buttons to add or remove watches.
+    Provides a table view of watched memory addresses, a history plot of the
+    selected watch, and buttons to add, remove, import and export watches.
     """
 
     def __init__(self):
@@ -78,11 +809,25 @@ class MemoryWatchWidget(QWidget):
         self.layout = QVBoxLayout(self)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Address", "Name", "Type", "Value"])
+        self.model = WatchTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.layout.addWidget(self.table)
+        # Fixed row heights keep scrolling cheap with very large watch lists
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.selectionModel().currentRowChanged.connect(self.show_history)
+        self.model.dataChanged.connect(self._on_data_changed)
+
+        # History plot of the selected watch
+        self.history_plot = HistoryPlotWidget()
+
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.history_plot)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+        self.layout.addWidget(splitter)
         
         # Buttons
         btn_layout = QHBoxLayout()
@@ -91,73 +836,102 @@ class MemoryWatchWidget(QWidget):
         self.remove_btn = QPushButton("Remove Watch")
         self.remove_btn.clicked.connect(self.remove_watch)
         
+        self.import_btn = QPushButton("Import...")
+        self.import_btn.clicked.connect(self.import_watches)
+        self.export_btn = QPushButton("Export...")
+        self.export_btn.clicked.connect(self.export_watches)
+
         btn_layout.addWidget(self.add_btn)
         btn_layout.addWidget(self.remove_btn)
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.import_btn)
+        btn_layout.addWidget(self.export_btn)
         self.layout.addLayout(btn_layout)
-        
-        self.watches = [] # List of dicts: {address, name, type, row_index}
+
+        # Machines of the emulation; the machine column is shown for more than one
+        self.machines = []
+        self.table.setColumnHidden(WatchTableModel.MACHINE_COLUMN, True)
+
+    def set_machines(self, machines):
+        """
+        Sets the machines watches can be added to.
+
+        Args:
+            machines (list): The machine names of the emulation.
+        """
+        self.machines = list(machines)
+        self.table.setColumnHidden(WatchTableModel.MACHINE_COLUMN,
+                                   len(self.machines) < 2 and not any(self.model.machines))
 
     def add_watch(self):
         """
         Opens the AddWatchDialog and adds a new watch if confirmed.
 
-        Validates that the address is a valid hex string before adding.
+        The address is resolved as a symbol name first, then as a hex string.
+        Watches added by symbol are named after the symbol unless a name is given.
         """
-        dialog = AddWatchDialog(self)
+        symbols = self.model.symbols
+        dialog = AddWatchDialog(self, symbols=symbols, machines=self.machines)
         if dialog.exec():
             data = dialog.get_data()
+            text = data["address"].strip()
+            addr_int = symbols.address_of(text) if symbols is not None else None
+            name = data["name"] or (text if addr_int is not None else "")
             try:
-                addr_int = int(data["address"], 16)
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                
-                self.table.setItem(row, 0, QTableWidgetItem(hex(addr_int)))
-                self.table.setItem(row, 1, QTableWidgetItem(data["name"]))
-                self.table.setItem(row, 2, QTableWidgetItem(data["type"]))
-                self.table.setItem(row, 3, QTableWidgetItem("N/A"))
-                
-                self.watches.append({
+                if addr_int is None:
+                    addr_int = int(text, 16)
+                self.model.add_watches([{
                     "address": addr_int,
-                    "name": data["name"],
+                    "name": name,
                     "type": data["type"],
-                    "row": row
-                })
+                    "mode": data["mode"],
+                    "interval": data["interval"],
+                    "machine": data["machine"]
+                }])
             except ValueError:
-                QMessageBox.warning(self, "Invalid Input", "Address must be a valid hex string (e.g., 0x1000)")
+                QMessageBox.warning(self, "Invalid Input", "Address must be a valid hex string (e.g., 0x1000) or a known symbol")
+
+    def import_watches(self):
+        """
+        Appends the watches of a JSON or CSV file chosen by the user.
+
+        The whole file is validated first and added in one model update;
+        symbol names are resolved with the current symbol table.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Import Watches", "", "Watch Lists (*.json *.csv);;All Files (*)")
+        if not path:
+            return
+        try:
+            watches = import_watches(path, self.model.symbols)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Import Failed", f"{path}: {e}")
+            return
+        self.model.add_watches(watches)
+        logging.info(f"Imported {len(watches)} watches from {path}")
+
+    def export_watches(self):
+        """
+        Writes all watches to a JSON or CSV file chosen by the user.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Export Watches", "watches.json", "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            export_watches(path, self.model.watch_records())
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"{path}: {e}")
+            return
+        logging.info(f"Exported {self.model.rowCount()} watches to {path}")
 
     def remove_watch(self):
         """
-        Removes the currently selected watch from the table and internal list.
-        """
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            self.table.removeRow(current_row)
-            # Remove from self.watches list - need to handle index shifting or rebuild list
-            # For simplicity, we'll just rebuild the list from the table or handle it carefully
-            # Actually, simpler to just remove by index if we track it, but row indices change.
-            # Let's just remove the item that matches the row.
-            # A better way for production is to store data in the item or use a model.
-            # For this MVP, let's just pop it if we can find it, or better:
-            # Rebuild self.watches from table content is safest for simple logic
-            self.rebuild_watches()
-
-    def rebuild_watches(self):
-        """
-        Rebuilds the internal list of watches from the table contents.
-
-        This ensures the internal state matches the UI state after row removal.
-        """
-        self.watches = []
-        for row in range(self.table.rowCount()):
-            addr_str = self.table.item(row, 0).text()
-            name = self.table.item(row, 1).text()
-            type_ = self.table.item(row, 2).text()
-            self.watches.append({
-                "address": int(addr_str, 16),
-                "name": name,
-                "type": type_,
-                "row": row
-            })
+        Removes the currently selected watches from the model.
+        """
+        rows = [index.row() for index in self.table.selectionModel().selectedRows()]
+        if not rows and self.table.currentIndex().isValid():
+            rows = [self.table.currentIndex().row()]
+        if rows:
+            self.model.remove_rows(rows)
 
     def update_value(self, row, value):
         """
@@ -167,4 +941,32 @@ class MemoryWatchWidget(QWidget):
             row (int): The row index to update.
             value (int): The new value to display (will be formatted as hex).
         """
-        self.table.setItem(row, 3, QTableWidgetItem(hex(value)))
+        self.model.update_rows([row], [value])
+
+    def show_history(self, current, previous=None):
+        """
+        Shows the history of the watch in the given row in the plot panel.
+
+        Args:
+            current (QModelIndex): The newly selected index.
+            previous (QModelIndex, optional): The previously selected index.
+        """
+        if not current.isValid():
+            self.history_plot.set_ring(None)
+            return
+        row = current.row()
+        title = self.model.names[row] or hex(self.model.addresses[row])
+        self.history_plot.set_ring(self.model.history(self.model.ids[row]), title)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        """
+        Attaches the plot to the selected watch's history once its ring exists.
+
+        Args:
+            top_left (QModelIndex): First changed cell.
+            bottom_right (QModelIndex): Last changed cell.
+            roles (list, optional): The changed roles.
+        """
+        current = self.table.currentIndex()
+        if self.history_plot.ring is None and current.isValid() and top_left.row() <= current.row() <= bottom_right.row():
+            self.show_history(current)
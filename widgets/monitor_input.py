@@ -0,0 +1,104 @@
+"""
+Monitor Input Widget Module.
+
+This module provides the command input of the Renode monitor tab. It behaves like
+a single-line field (Enter sends) but accepts multi-line text, so a pasted
+sequence of commands or a snippet of a `.resc` script is sent as one batch.
+"""
+
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtCore import Qt, Signal
+
+# Maximum number of lines shown before the input scrolls.
+MAX_VISIBLE_LINES = 8
+# Delimiter of the monitor's multi-line strings.
+MULTILINE_QUOTE = '"""'
+
+def split_commands(text):
+    """
+    Splits text into monitor commands, dropping blank lines and `#` comments.
+
+    Multi-line strings delimited by triple quotes, as used by `macro` and `set`
+    in scripts, stay in the command they belong to with their lines kept as
+    is; a delimiter opening a line continues the command of the previous line.
+
+    Args:
+        text (str): The text, one command per line.
+
+    Returns:
+        list: The commands, stripped; multi-line commands keep their line breaks.
+    """
+    commands = []
+    in_string = False
+    for line in text.splitlines():
+        if in_string:
+            commands[-1] += "\n" + line
+        else:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith(MULTILINE_QUOTE) and commands:
+                commands[-1] += "\n" + line
+            else:
+                commands.append(line)
+        if line.count(MULTILINE_QUOTE) % 2:
+            in_string = not in_string
+    return commands
+
+class MonitorInput(QPlainTextEdit):
+    """
+    A monitor command input growing with its content.
+
+    Enter sends the whole content as a list of commands; Shift+Enter inserts a
+    line break.
+    """
+
+    commands_entered = Signal(list)
+
+    def __init__(self, parent=None):
+        """
+        Initializes the MonitorInput.
+
+        Args:
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setTabChangesFocus(True)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.document().setDocumentMargin(2)
+        self.textChanged.connect(self._fit_height)
+        self._fit_height()
+
+    def keyPressEvent(self, event):
+        """
+        Sends the commands on Enter, unless Shift is held.
+
+        Args:
+            event (QKeyEvent): The key event.
+        """
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            if event.modifiers() & Qt.ShiftModifier:
+                # A new block rather than the line separator Qt inserts for Shift+Enter
+                self.insertPlainText("\n")
+            else:
+                self.submit()
+            return
+        super().keyPressEvent(event)
+
+    def submit(self):
+        """
+        Emits the entered commands and clears the input.
+        """
+        commands = split_commands(self.toPlainText())
+        self.clear()
+        if commands:
+            self.commands_entered.emit(commands)
+
+    def _fit_height(self):
+        """
+        Resizes the input to its line count, up to MAX_VISIBLE_LINES.
+        """
+        lines = min(max(self.document().blockCount(), 1), MAX_VISIBLE_LINES)
+        margins = self.contentsMargins()
+        height = lines * self.fontMetrics().lineSpacing() + 2 * self.document().documentMargin()
+        self.setFixedHeight(int(height) + margins.top() + margins.bottom() + 2)
@@ -0,0 +1,105 @@
+"""
+Performance View Module.
+
+This module provides a table of per-operation latencies of the Renode bridge: the
+p50, p99 and maximum of every call phase (queue wait, execution in Renode,
+delivery to the event loop and UI apply). The table is refreshed from the metrics
+registry on a timer, only while the view is visible.
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
+    QPushButton, QAbstractItemView
+)
+from PySide6.QtCore import Qt, QTimer
+
+# Table refresh interval while visible, in milliseconds.
+PERFORMANCE_REFRESH_MS = 1000
+
+class PerformanceView(QWidget):
+    """
+    A live table of call latency percentiles, one row per operation and phase.
+    """
+
+    COLUMNS = ["Operation", "Phase", "Count", "p50 (ms)", "p99 (ms)", "Max (ms)"]
+
+    def __init__(self, metrics, parent=None):
+        """
+        Initializes the PerformanceView.
+
+        Args:
+            metrics (MetricsRegistry): The registry to display.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.metrics = metrics
+        self.layout = QVBoxLayout(self)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.layout.addWidget(self.table)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self.reset_btn = QPushButton("Reset Metrics")
+        self.reset_btn.clicked.connect(self.reset_metrics)
+        btn_layout.addWidget(self.reset_btn)
+        self.layout.addLayout(btn_layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(PERFORMANCE_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        """
+        Refreshes the table and starts the refresh timer when the view is shown.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        """
+        Stops the refresh timer while the view is hidden.
+
+        Args:
+            event (QHideEvent): The hide event.
+        """
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def refresh(self):
+        """
+        Fills the table from a fresh metrics snapshot.
+        """
+        rows = [(operation, phase, summary)
+                for operation, phases in self.metrics.snapshot().items()
+                for phase, summary in phases.items()]
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, (operation, phase, summary) in enumerate(rows):
+            cells = [operation, phase, str(summary["count"]),
+                     f"{summary['p50'] * 1000:.3f}", f"{summary['p99'] * 1000:.3f}", f"{summary['max'] * 1000:.3f}"]
+            for column, text in enumerate(cells):
+                item = self.table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column >= 2:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.table.setItem(row, column, item)
+                item.setText(text)
+        self.table.setUpdatesEnabled(True)
+
+    def reset_metrics(self):
+        """
+        Drops all recorded samples and clears the table.
+        """
+        self.metrics.reset()
+        self.refresh()
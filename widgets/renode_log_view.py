@@ -0,0 +1,368 @@
+"""
+Renode Log View Module.
+
+This module provides a filterable table view of the Renode log held in a
+`LogStore`. The table model only lists the sequence numbers of the matching
+lines and fetches cell text on demand, so the view stays fast with hundreds of
+thousands of lines. Level, machine and source filters use the store's indexes;
+regex searches run on a worker thread and can be superseded while running.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+from array import array
+from bisect import bisect_left
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView, QHeaderView,
+    QComboBox, QLineEdit, QLabel
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QColor, QFont
+
+from backend.log_store import LOG_LEVELS
+
+# Text colors of the lines of a level.
+LEVEL_COLORS = {"WARNING": QColor(230, 180, 60), "ERROR": QColor(240, 90, 80)}
+# Delay between the last keystroke in the search field and the search, in milliseconds.
+SEARCH_DELAY_MS = 250
+
+class LogTableModel(QAbstractTableModel):
+    """
+    Table model listing the log lines that match the current filter.
+
+    Rows map to store sequence numbers; the model knows the lines delivered by
+    `append` only, so it stays consistent while the tailing thread keeps adding
+    lines to the store.
+    """
+
+    COLUMNS = ["Time", "Level", "Machine", "Source", "Message"]
+    LEVEL_COLUMN = 1
+    MACHINE_COLUMN = 2
+
+    def __init__(self, store, parent=None):
+        """
+        Initializes the LogTableModel.
+
+        Args:
+            store (LogStore): The log lines.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.store = store
+        self.rows = array('Q') # Sorted sequence numbers of the listed lines
+        self.end = store.end # Sequence number after the last delivered line
+        self.levels = None
+        self.machine = None
+        self.sources = None
+        self.pattern = None # Compiled search expression applied to new lines
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of listed lines.
+
+        Args:
+            parent (QModelIndex, optional): Unused; the model is flat.
+
+        Returns:
+            int: The number of rows.
+        """
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Returns the number of columns.
+
+        Args:
+            parent (QModelIndex, optional): Unused; the model is flat.
+
+        Returns:
+            int: The number of columns.
+        """
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Returns the header labels.
+
+        Args:
+            section (int): The column or row number.
+            orientation (Qt.Orientation): The header orientation.
+            role (int, optional): The data role.
+
+        Returns:
+            str: The header label, or None.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns the text of a cell, read from the store on demand.
+
+        Args:
+            index (QModelIndex): The cell index.
+            role (int, optional): The data role.
+
+        Returns:
+            str: The cell text (or a QColor for the foreground role), or None.
+        """
+        if not index.isValid():
+            return None
+        seq = self.rows[index.row()]
+        if role == Qt.ForegroundRole:
+            return LEVEL_COLORS.get(self.store.level(seq))
+        if role != Qt.DisplayRole:
+            return None
+        return self.store.cell(seq, index.column())
+
+    def filter(self):
+        """
+        Returns the current level, machine and source filter.
+
+        Returns:
+            dict: Keyword arguments for `LogStore.select`.
+        """
+        return {"levels": self.levels, "machine": self.machine, "sources": self.sources}
+
+    def candidates(self):
+        """
+        Returns the delivered lines passing the filter, ignoring the search.
+
+        Returns:
+            array: Sorted sequence numbers.
+        """
+        rows = self.store.select(**self.filter())
+        return rows[:bisect_left(rows, self.end)]
+
+    def set_rows(self, rows):
+        """
+        Replaces the listed lines.
+
+        Args:
+            rows (array): Sorted sequence numbers.
+        """
+        self.beginResetModel()
+        self.rows = rows[bisect_left(rows, self.store.first):]
+        self.endResetModel()
+
+    def append(self, seqs):
+        """
+        Lists the matching lines of a newly stored batch and unlists dropped lines.
+
+        Args:
+            seqs (range): The sequence numbers of the batch.
+        """
+        self.end = max(self.end, seqs.stop)
+        new = self.store.select(start=seqs.start, **self.filter())
+        new = new[:bisect_left(new, seqs.stop)]
+        if self.pattern is not None and new:
+            search, line = self.pattern.search, self.store.line
+            new = array('Q', [seq for seq in new if search(line(seq) or "")])
+        dropped = bisect_left(self.rows, self.store.first)
+        if dropped:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            del self.rows[:dropped]
+            self.endRemoveRows()
+        if new:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self.rows.extend(new)
+            self.endInsertRows()
+
+class RenodeLogView(QWidget):
+    """
+    The Renode log as a table, with level and source filters and a regex search.
+    """
+
+    def __init__(self, store, parent=None):
+        """
+        Initializes the RenodeLogView.
+
+        Args:
+            store (LogStore): The log lines.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.store = store
+        self.model = LogTableModel(store, self)
+        self._known_sources = 0
+        self._search_cancel = None
+        self._search_generation = 0
+        self._search_error = None
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        filter_layout = QHBoxLayout()
+        self.level_select = QComboBox()
+        self.level_select.addItem("All levels", None)
+        # Lines without a level, e.g. monitor output, pass every level filter
+        for i, level in enumerate(LOG_LEVELS[1:-1], 1):
+            self.level_select.addItem(f"{level} and above", LOG_LEVELS[:1] + LOG_LEVELS[i:])
+        self.level_select.addItem(LOG_LEVELS[-1], LOG_LEVELS[:1] + LOG_LEVELS[-1:])
+        self.level_select.currentIndexChanged.connect(self.refilter)
+        filter_layout.addWidget(self.level_select)
+
+        self.source_select = QComboBox()
+        self.source_select.addItem("All sources", None)
+        self.source_select.currentIndexChanged.connect(self.refilter)
+        filter_layout.addWidget(self.source_select)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search (regular expression)...")
+        self.search_input.textChanged.connect(self._schedule_search)
+        filter_layout.addWidget(self.search_input, 1)
+
+        self.status_label = QLabel()
+        filter_layout.addWidget(self.status_label)
+        self.layout.addLayout(filter_layout)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setFont(QFont("Monospace"))
+        self.table.setWordWrap(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        vertical = self.table.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(self.table.fontMetrics().height() + 4)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnHidden(LogTableModel.MACHINE_COLUMN, True)
+        self.layout.addWidget(self.table)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.refilter)
+
+    def append(self, seqs):
+        """
+        Shows the matching lines of a newly stored batch.
+
+        The view follows new lines only if it was scrolled to the bottom.
+
+        Args:
+            seqs (range): The sequence numbers of the batch.
+        """
+        scroll_bar = self.table.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 1
+        self.model.append(seqs)
+        if at_bottom:
+            self.table.scrollToBottom()
+        if len(self.store.source_names) != self._known_sources:
+            self._update_sources()
+        if self.table.isColumnHidden(LogTableModel.MACHINE_COLUMN) and len(self.store.machine_names) > 1:
+            self.table.setColumnHidden(LogTableModel.MACHINE_COLUMN, False)
+        self._update_status()
+
+    def set_machine(self, machine):
+        """
+        Shows the lines of a machine, plus the lines not tagged with a machine.
+
+        Args:
+            machine (str): The machine name, or None for all machines.
+        """
+        self.model.machine = machine
+        self.refilter()
+
+    def refilter(self):
+        """
+        Applies the current filters, starting a background search if needed.
+        """
+        self.search_timer.stop()
+        self.model.levels = self.level_select.currentData()
+        source = self.source_select.currentData()
+        self.model.sources = None if source is None else [source]
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+            self._search_cancel = None
+        self._search_generation += 1
+        candidates = self.model.candidates()
+        text = self.search_input.text()
+        self._search_error = None
+        self.search_input.setToolTip("")
+        if not text:
+            self.model.pattern = None
+            self._show(candidates)
+            return
+        try:
+            pattern = re.compile(text, re.IGNORECASE)
+        except re.error as e:
+            self._search_error = f"Invalid expression: {e}"
+            self.search_input.setToolTip(self._search_error)
+            self.status_label.setText("Invalid expression")
+            return
+        self.model.pattern = pattern
+        self._search_cancel = threading.Event()
+        self.status_label.setText("Searching...")
+        asyncio.ensure_future(self._search(pattern, candidates, self.model.end, self._search_generation, self._search_cancel))
+
+    async def _search(self, pattern, candidates, boundary, generation, cancelled):
+        """
+        Searches the candidate lines on a worker thread and shows the matches.
+
+        Lines delivered while the search runs are matched as they arrive and
+        kept after the search results.
+
+        Args:
+            pattern (re.Pattern): The search expression.
+            candidates (array): The lines passing the other filters.
+            boundary (int): The sequence number after the last candidate.
+            generation (int): The search generation; stale results are dropped.
+            cancelled (threading.Event): Set when the search is superseded.
+        """
+        try:
+            found = await asyncio.get_running_loop().run_in_executor(None, self.store.search, pattern, candidates, cancelled)
+        except Exception as e:
+            logging.error(f"Log search failed: {e}")
+            return
+        if found is None or generation != self._search_generation:
+            return
+        self._search_cancel = None
+        rows = self.model.rows
+        found.extend(rows[bisect_left(rows, boundary):])
+        self._show(found)
+
+    def _schedule_search(self):
+        """
+        Restarts the search delay after an edit of the search field.
+        """
+        self.search_timer.start()
+
+    def _show(self, rows):
+        """
+        Lists the given lines and scrolls to the newest.
+
+        Args:
+            rows (array): Sorted sequence numbers.
+        """
+        self.model.set_rows(rows)
+        self.table.scrollToBottom()
+        self._update_status()
+
+    def _update_sources(self):
+        """
+        Adds newly seen sources to the source filter.
+        """
+        sources = self.store.source_list()
+        self._known_sources = len(sources) + 1
+        selected = self.source_select.currentData()
+        self.source_select.blockSignals(True)
+        self.source_select.clear()
+        self.source_select.addItem("All sources", None)
+        for source in sources:
+            self.source_select.addItem(source, source)
+        self.source_select.setCurrentIndex(max(self.source_select.findData(selected), 0))
+        self.source_select.blockSignals(False)
+
+    def _update_status(self):
+        """
+        Shows how many lines are listed.
+        """
+        if self._search_cancel is None and self._search_error is None:
+            self.status_label.setText(f"{len(self.model.rows)} of {len(self.store)} lines")
@@ -0,0 +1,250 @@
+"""
+UART Terminal Widget Module.
+
+This module provides a terminal for one emulated UART. Received bytes are
+applied to a `TerminalBuffer` as they arrive and the view is repainted at most
+once per frame with everything that changed, so a fast console (e.g. a Linux
+boot log) costs one document update per frame rather than one per chunk. The
+view keeps a bounded scrollback; keystrokes are sent to the UART.
+"""
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QLabel, QApplication
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QKeySequence, QTextCharFormat, QTextCursor
+
+from backend.terminal_buffer import TerminalBuffer, DEFAULT_SCROLLBACK
+from widgets.log_view import FRAME_INTERVAL_MS
+
+# Text colors of the SGR color codes, readable on the dark theme.
+ANSI_COLORS = {
+    30: QColor(128, 128, 128), 31: QColor(205, 49, 49), 32: QColor(13, 188, 121), 33: QColor(229, 229, 16),
+    34: QColor(36, 114, 200), 35: QColor(188, 63, 188), 36: QColor(17, 168, 205), 37: QColor(229, 229, 229),
+    90: QColor(102, 102, 102), 91: QColor(241, 76, 76), 92: QColor(35, 209, 139), 93: QColor(245, 245, 67),
+    94: QColor(59, 142, 234), 95: QColor(214, 112, 214), 96: QColor(41, 184, 219), 97: QColor(255, 255, 255),
+}
+# Bytes sent for keys without text.
+KEY_SEQUENCES = {
+    Qt.Key_Return: b"\r", Qt.Key_Enter: b"\r", Qt.Key_Backspace: b"\x7f", Qt.Key_Tab: b"\t",
+    Qt.Key_Escape: b"\x1b", Qt.Key_Up: b"\x1b[A", Qt.Key_Down: b"\x1b[B", Qt.Key_Right: b"\x1b[C",
+    Qt.Key_Left: b"\x1b[D", Qt.Key_Home: b"\x1b[H", Qt.Key_End: b"\x1b[F", Qt.Key_Delete: b"\x1b[3~",
+}
+
+class TerminalView(QPlainTextEdit):
+    """
+    The read-only text area of a terminal, turning keystrokes into bytes.
+    """
+
+    input_bytes = Signal(bytes)
+
+    def keyPressEvent(self, event):
+        """
+        Sends keystrokes and pastes to the UART; copying a selection and
+        scrolling keep their usual meaning.
+
+        Args:
+            event (QKeyEvent): The key event.
+        """
+        if event.matches(QKeySequence.Copy) and self.textCursor().hasSelection():
+            super().keyPressEvent(event)
+            return
+        if event.matches(QKeySequence.Paste):
+            data = QApplication.clipboard().text().replace("\r\n", "\r").replace("\n", "\r").encode()
+        else:
+            data = KEY_SEQUENCES.get(event.key()) or event.text().encode()
+        if data:
+            self.input_bytes.emit(data)
+            return
+        super().keyPressEvent(event)
+
+class UartTerminal(QWidget):
+    """
+    A terminal showing the output of one UART.
+
+    The owner connects the byte stream with `attach` and feeds it the received
+    chunks through `feed`.
+    """
+
+    close_requested = Signal()
+    reconnect_requested = Signal()
+
+    def __init__(self, title, scrollback=DEFAULT_SCROLLBACK, parent=None):
+        """
+        Initializes the UartTerminal.
+
+        Args:
+            title (str): The name shown above the terminal, e.g. the UART path.
+            scrollback (int, optional): Maximum number of lines kept. Defaults to 10000.
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.scrollback = scrollback
+        self.buffer = TerminalBuffer(scrollback)
+        self.stream = None
+        self.connecting = False
+        self._formats = {None: QTextCharFormat()}
+        for code, color in ANSI_COLORS.items():
+            text_format = QTextCharFormat()
+            text_format.setForeground(color)
+            self._formats[code] = text_format
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel(title))
+        self.status_label = QLabel("Connecting...")
+        header_layout.addWidget(self.status_label, 1)
+        self.reconnect_btn = QPushButton("Reconnect")
+        self.reconnect_btn.setVisible(False)
+        self.reconnect_btn.clicked.connect(self.reconnect_requested)
+        header_layout.addWidget(self.reconnect_btn)
+        self.clear_btn = QPushButton("Clear")
+        self.clear_btn.clicked.connect(self.clear)
+        header_layout.addWidget(self.clear_btn)
+        self.close_btn = QPushButton("Close")
+        self.close_btn.clicked.connect(self.close_requested)
+        header_layout.addWidget(self.close_btn)
+        self.layout.addLayout(header_layout)
+
+        self.view = TerminalView()
+        self.view.setReadOnly(True)
+        self.view.setUndoRedoEnabled(False)
+        self.view.setFont(QFont("Monospace"))
+        self.view.input_bytes.connect(self.send)
+        self.layout.addWidget(self.view)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def attach(self, stream):
+        """
+        Shows the terminal as connected to a stream and sends keystrokes to it.
+
+        Args:
+            stream (UartStream): The open stream.
+        """
+        self.stream = stream
+        self.reconnect_btn.setVisible(False)
+        self._update_status()
+
+    def set_disconnected(self, reason="Disconnected"):
+        """
+        Shows the terminal as disconnected.
+
+        Args:
+            reason (str, optional): The status text. Defaults to "Disconnected".
+        """
+        self.stream = None
+        self.status_label.setText(reason)
+        self.reconnect_btn.setVisible(True)
+
+    @property
+    def connected(self):
+        """
+        Returns whether a stream is attached and open.
+
+        Returns:
+            bool: True while connected.
+        """
+        return self.stream is not None and self.stream.connected
+
+    def feed(self, data):
+        """
+        Applies received bytes; the view catches up at the next frame.
+
+        Args:
+            data (bytes): The bytes received.
+        """
+        self.buffer.feed(data)
+        if self.buffer.dirty and not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def send(self, data):
+        """
+        Sends bytes to the UART.
+
+        Args:
+            data (bytes): The bytes.
+        """
+        if self.stream is not None:
+            self.stream.write(data)
+
+    def clear(self):
+        """
+        Clears the terminal.
+        """
+        self.buffer.clear()
+        self.flush()
+
+    def flush(self):
+        """
+        Replaces the current line of the view and appends the finished lines,
+        in one edit.
+
+        The view follows new output only if it was scrolled to the bottom.
+        """
+        if not self.buffer.dirty:
+            return
+        cleared, lines, _, (text, runs) = self.buffer.take()
+        scroll_bar = self.view.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 1
+        position = scroll_bar.value()
+        if cleared:
+            self.view.clear()
+        document = self.view.document()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        # Trim the scrollback in one removal; QPlainTextEdit's own block limit
+        # removes blocks one at a time, which dominates the cost once full
+        excess = document.blockCount() + len(lines) - self.scrollback
+        if excess > 0:
+            end = document.findBlockByNumber(min(excess, document.blockCount() - 1))
+            cursor.setPosition(end.position(), QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+        # The last block holds the current line as shown at the last flush
+        cursor.movePosition(QTextCursor.End)
+        cursor.movePosition(QTextCursor.StartOfBlock, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        plain = []
+        for line_text, line_runs in lines:
+            if not line_runs:
+                plain.append(line_text)
+                continue
+            if plain:
+                cursor.insertText("\n".join(plain) + "\n", self._formats[None])
+                plain = []
+            self._insert(cursor, line_text, line_runs)
+            cursor.insertText("\n", self._formats[None])
+        if plain:
+            cursor.insertText("\n".join(plain) + "\n", self._formats[None])
+        self._insert(cursor, text, runs)
+        cursor.endEditBlock()
+        scroll_bar.setValue(scroll_bar.maximum() if at_bottom else min(position, scroll_bar.maximum()))
+        self._update_status()
+
+    def _insert(self, cursor, text, runs):
+        """
+        Inserts a line in its colors.
+
+        Args:
+            cursor (QTextCursor): Where to insert.
+            text (str): The line text.
+            runs (list): (start, color) pairs, see `TerminalBuffer`.
+        """
+        if not runs:
+            cursor.insertText(text, self._formats[None])
+            return
+        if runs[0][0] > 0:
+            cursor.insertText(text[:runs[0][0]], self._formats[None])
+        bounds = runs + [(len(text), None)]
+        for (start, color), (end, _) in zip(bounds, bounds[1:]):
+            if end > start:
+                cursor.insertText(text[start:end], self._formats.get(color, self._formats[None]))
+
+    def _update_status(self):
+        """
+        Shows the amount of data received.
+        """
+        if self.stream is not None:
+            self.status_label.setText(f"Connected, {self.buffer.received / 1024:.1f} KiB received")
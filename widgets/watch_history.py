@@ -0,0 +1,199 @@
+"""
+Watch History Module.
+
+This module keeps a bounded history of watch values and plots it. Each watch owns
+a fixed-capacity ring of (timestamp, value) samples in preallocated typed arrays,
+and the plot reduces any number of samples to a few per pixel column with min/max
+binning before drawing.
+"""
+
+import time
+from array import array
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QPointF, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+
+# Default number of samples kept per watch.
+DEFAULT_HISTORY_CAPACITY = 1024
+# Plot refresh interval while samples keep arriving, in milliseconds.
+PLOT_REFRESH_MS = 100
+
+class SampleRing:
+    """
+    Fixed-capacity ring buffer of (timestamp, value) samples.
+
+    Both columns are allocated up front, so memory use does not grow with the
+    length of the simulation; once full, the oldest samples are overwritten.
+    """
+
+    def __init__(self, capacity=DEFAULT_HISTORY_CAPACITY):
+        """
+        Initializes the SampleRing.
+
+        Args:
+            capacity (int, optional): Maximum number of samples kept. Defaults to 1024.
+        """
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self.head = 0 # Next slot to write
+        self.count = 0
+        self.version = 0 # Bumped on every append, for cheap change detection
+
+    def __len__(self):
+        """
+        Returns the number of stored samples.
+
+        Returns:
+            int: The number of samples.
+        """
+        return self.count
+
+    def append(self, timestamp, value):
+        """
+        Stores a sample, overwriting the oldest one when full.
+
+        Args:
+            timestamp (float): The sample time in seconds.
+            value (float): The sample value.
+        """
+        self.times[self.head] = timestamp
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.version += 1
+
+    def snapshot(self):
+        """
+        Returns the samples in chronological order.
+
+        Returns:
+            tuple: Two arrays, (times, values).
+        """
+        if self.count < self.capacity:
+            return self.times[:self.count], self.values[:self.count]
+        return (self.times[self.head:] + self.times[:self.head],
+                self.values[self.head:] + self.values[:self.head])
+
+def downsample_minmax(times, values, bins):
+    """
+    Reduces a series to at most two points per bin using min/max binning.
+
+    Samples are split into `bins` equal-count bins; each bin contributes its
+    minimum and maximum value in time order, so spikes survive the reduction.
+    The per-bin work is done by the built-in `min`/`max` over array slices.
+
+    Args:
+        times (array): Sample timestamps in ascending order.
+        values (array): Sample values.
+        bins (int): The number of bins (e.g. the plot width in pixels).
+
+    Returns:
+        list: A list of (time, value) tuples.
+    """
+    n = len(values)
+    if n <= 2 * bins:
+        return list(zip(times, values))
+    points = []
+    step = n / bins
+    for b in range(bins):
+        start, end = int(b * step), int((b + 1) * step)
+        chunk = values[start:end]
+        low, high = min(chunk), max(chunk)
+        i_low, i_high = start + chunk.index(low), start + chunk.index(high)
+        if i_low > i_high:
+            i_low, i_high = i_high, i_low
+        points.append((times[i_low], values[i_low]))
+        if i_high != i_low:
+            points.append((times[i_high], values[i_high]))
+    return points
+
+class HistoryPlotWidget(QWidget):
+    """
+    A sparkline-style plot of one watch's value history.
+
+    Values are drawn as a step line, extended to the present time since a
+    sample is only recorded when the value changes.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the HistoryPlotWidget.
+
+        Args:
+            parent (QWidget, optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setMinimumHeight(80)
+        self.ring = None
+        self.title = ""
+        self._drawn_version = None
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(PLOT_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self._refresh)
+        self.refresh_timer.start()
+
+    def set_ring(self, ring, title=""):
+        """
+        Selects the history to plot.
+
+        Args:
+            ring (SampleRing): The samples to plot, or None to clear the plot.
+            title (str, optional): A caption drawn in the corner.
+        """
+        self.ring = ring
+        self.title = title
+        self._drawn_version = None
+        self.update()
+
+    def _refresh(self):
+        """
+        Schedules a repaint if new samples arrived since the last one.
+        """
+        if self.ring is not None and self.isVisible() and self.ring.version != self._drawn_version:
+            self.update()
+
+    def paintEvent(self, event):
+        """
+        Paints the downsampled history.
+
+        Args:
+            event (QPaintEvent): The paint event.
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#2d2d2d"))
+        painter.setPen(QColor("#e0e0e0"))
+        if self.title:
+            painter.drawText(6, 14, self.title)
+        if self.ring is None or not len(self.ring):
+            return
+        self._drawn_version = self.ring.version
+
+        times, values = self.ring.snapshot()
+        width, height = max(self.width() - 12, 1), max(self.height() - 24, 1)
+        points = downsample_minmax(times, values, width)
+        t0, t1 = points[0][0], max(time.monotonic(), points[-1][0])
+        v0, v1 = min(v for _, v in points), max(v for _, v in points)
+        t_scale = width / (t1 - t0) if t1 > t0 else 0.0
+        v_scale = height / (v1 - v0) if v1 > v0 else 0.0
+
+        def to_pixel(t, v):
+            return QPointF(6 + (t - t0) * t_scale, 18 + height - (v - v0) * v_scale if v_scale else 18 + height / 2)
+
+        polygon = QPolygonF()
+        previous = None
+        for t, v in points:
+            if previous is not None:
+                polygon.append(to_pixel(t, previous)) # Step: hold the previous value until t
+            polygon.append(to_pixel(t, v))
+            previous = v
+        polygon.append(to_pixel(t1, previous))
+
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(QPen(QColor("#0078d4"), 1))
+        painter.drawPolyline(polygon)
+        painter.setPen(QColor("#999999"))
+        painter.drawText(self.rect().adjusted(0, 2, -6, 0), Qt.AlignRight | Qt.AlignTop,
+                         f"min {hex(int(v0))}  max {hex(int(v1))}  {len(self.ring)} samples")